@@ -0,0 +1,22 @@
+"""Gunicorn settings picked up automatically from the working directory.
+
+Prepares the shared directory prometheus_client uses to aggregate metrics
+across worker processes (see tasks/metrics.py).
+"""
+import os
+import shutil
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/taskforge-metrics")
+
+
+def on_starting(server):  # noqa: ANN001
+    # Stale files from a previous master would double-count samples.
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):  # noqa: ANN001
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -55,6 +55,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Correlation id for every log record emitted while handling the request
+    "tasks.middleware.RequestIdMiddleware",
+    # Latency covers everything below; only RequestIdMiddleware (and
+    # QueryInstrumentationMiddleware, when enabled) sit outside it
+    "tasks.middleware.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -70,6 +75,12 @@ MIDDLEWARE = [
     "tasks.middleware.PageLogMiddleware",
 ]
 
+# Opt-in per-request DB profiling: Server-Timing header + log line, warns above QUERY_BUDGET.
+QUERY_INSTRUMENTATION: bool = env.bool("QUERY_INSTRUMENTATION", default=False)
+QUERY_BUDGET: int = env.int("QUERY_BUDGET", default=50)
+if QUERY_INSTRUMENTATION:
+    MIDDLEWARE.insert(1, "tasks.middleware.QueryInstrumentationMiddleware")
+
 ROOT_URLCONF = "taskforge.urls"
 
 TEMPLATES = [
@@ -156,22 +167,105 @@ REST_FRAMEWORK = {
 }
 
 # ---------------------------------------------------------------------------
-# LOGGING – simple stdout + DB audit via tasks.middleware
+# LOGGING – structured stdout + DB audit via tasks.middleware
 # ---------------------------------------------------------------------------
+# LOG_FORMAT=json (default) emits one JSON object per line with a request_id;
+# LOG_FORMAT=plain is friendlier for local runserver sessions.
+LOG_LEVEL: str = env("LOG_LEVEL", default="INFO")
+LOG_FORMAT: str = env("LOG_FORMAT", default="json")
+# Upper bound on characters logged for any request/response payload.
+LOG_PAYLOAD_MAX_CHARS: int = env.int("LOG_PAYLOAD_MAX_CHARS", default=1000)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
+    "filters": {
+        "request_id": {"()": "tasks.logs.RequestIdFilter"},
+    },
+    "formatters": {
+        "json": {"()": "tasks.logs.JsonFormatter"},
+        "plain": {"format": "%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s"},
+    },
     "handlers": {
         "console": {
             "class": "logging.StreamHandler",
+            "filters": ["request_id"],
+            "formatter": LOG_FORMAT,
         },
     },
     "root": {
         "handlers": ["console"],
-        "level": "INFO" if not DEBUG else "DEBUG",
+        "level": LOG_LEVEL,
+    },
+    "loggers": {
+        # Monday payloads are only logged at DEBUG; raise to DEBUG when troubleshooting.
+        "tasks.services": {"level": env("MONDAY_LOG_LEVEL", default="INFO")},
+        "tasks.views": {"level": LOG_LEVEL},
+        "tasks.middleware": {"level": LOG_LEVEL},
+        # SQL echo and HTTP connection chatter stay quiet unless asked for.
+        "django.db.backends": {"level": env("DB_LOG_LEVEL", default="WARNING")},
+        "urllib3": {"level": "WARNING"},
     },
 }
 
+# ---------------------------------------------------------------------------
+# ADMIN – sidebar filters show the N most recent values; the rest via autocomplete
+# ---------------------------------------------------------------------------
+ADMIN_FILTER_LOOKUP_LIMIT: int = env.int("ADMIN_FILTER_LOOKUP_LIMIT", default=20)
+ADMIN_FILTER_LOOKUP_TTL: int = env.int("ADMIN_FILTER_LOOKUP_TTL", default=300)
+# Unfiltered changelists above this many rows show Postgres' estimated count.
+ADMIN_ESTIMATED_COUNT_THRESHOLD: int = env.int("ADMIN_ESTIMATED_COUNT_THRESHOLD", default=10000)
+
+# ---------------------------------------------------------------------------
+# METRICS – Prometheus scrape endpoint at /metrics
+# ---------------------------------------------------------------------------
+# Optional bearer token required by /metrics; leave unset to expose it openly.
+# Multi-worker aggregation is enabled by PROMETHEUS_MULTIPROC_DIR (gunicorn.conf.py).
+METRICS_TOKEN: str | None = env("METRICS_TOKEN", default=None)
+
+# ---------------------------------------------------------------------------
+# STATS – /api/stats/ caches one aggregate bucket per day
+# ---------------------------------------------------------------------------
+STATS_MAX_DAYS: int = env.int("STATS_MAX_DAYS", default=365)
+# Today's bucket is still filling up; closed days change only when old tasks get reviewed.
+STATS_TODAY_TTL: int = env.int("STATS_TODAY_TTL", default=60)
+STATS_HISTORY_TTL: int = env.int("STATS_HISTORY_TTL", default=3600)
+
+# ---------------------------------------------------------------------------
+# EXPIRY – `manage.py expire_tasks` (run periodically) closes pending tasks past expires_at
+# ---------------------------------------------------------------------------
+# "auto": tasks flagged auto_approved are approved (and sent to Monday.com), the rest expire.
+# "expire": every overdue pending task is marked expired.
+TASK_EXPIRY_POLICY: str = env("TASK_EXPIRY_POLICY", default="auto")
+TASK_EXPIRY_BATCH_SIZE: int = env.int("TASK_EXPIRY_BATCH_SIZE", default=500)
+
+# Admin bulk approvals run as BulkJobs, committed BULK_JOB_CHUNK_SIZE tasks at a time.
+# With BULK_JOBS_IN_THREAD the submitting worker starts them in a background thread;
+# `manage.py run_bulk_jobs` (cron) picks up queued jobs and resumes ones whose
+# heartbeat is older than BULK_JOB_STALE_SECONDS (e.g. after a worker restart).
+BULK_JOB_CHUNK_SIZE: int = env.int("BULK_JOB_CHUNK_SIZE", default=50)
+BULK_JOBS_IN_THREAD: bool = env.bool("BULK_JOBS_IN_THREAD", default=True)
+BULK_JOB_STALE_SECONDS: int = env.int("BULK_JOB_STALE_SECONDS", default=300)
+
+# Task exports (/api/tasks/export/, admin action) fetch this many rows per cursor round trip.
+EXPORT_CHUNK_SIZE: int = env.int("EXPORT_CHUNK_SIZE", default=2000)
+
+# /api/tasks/changes/ (delta sync): page size, and how long deletes are remembered.
+# A change token older than the retention gets 410 and the client re-syncs from scratch.
+CHANGES_PAGE_SIZE: int = env.int("CHANGES_PAGE_SIZE", default=200)
+CHANGES_MAX_PAGE_SIZE: int = env.int("CHANGES_MAX_PAGE_SIZE", default=1000)
+TASK_TOMBSTONE_RETENTION_DAYS: int = env.int("TASK_TOMBSTONE_RETENTION_DAYS", default=30)
+
+# Live review updates (/api/tasks/live/, server-sent events). Under WSGI each stream
+# answers one poll and the browser reconnects every LIVE_POLL_SECONDS; under ASGI a
+# stream stays open for LIVE_STREAM_SECONDS and is woken by review transitions.
+LIVE_POLL_SECONDS: float = env.float("LIVE_POLL_SECONDS", default=2.0)
+LIVE_STREAM_SECONDS: int = env.int("LIVE_STREAM_SECONDS", default=300)
+
+# Serve /health/ and the task approve/act endpoints from async views (tasks/async_views.py).
+# Only useful under ASGI (gunicorn -k uvicorn_worker.UvicornWorker taskforge.asgi); see docs/deployment.md.
+ASYNC_VIEWS: bool = env.bool("ASYNC_VIEWS", default=False)
+
 # ---------------------------------------------------------------------------
 # MONDAY.COM API – token pulled from env (integration service uses)
 # ---------------------------------------------------------------------------
@@ -182,7 +276,21 @@ MONDAY_API_KEY: str | None = "eyJhbGciOiJIUzI1NiJ9.eyJ0aWQiOjUxMjY3Mjg4OCwiYWFpI
 MONDAY_API_URL: str | None = env("MONDAY_API_URL", default="https://api.monday.com/v2")
 MONDAY_BOARD_ID: str | None = env("MONDAY_BOARD_ID", default="9212659997")
 MONDAY_GROUP_ID: str | None = env("MONDAY_GROUP_ID", default="group_mkqyryrz")
+# Map "external_id" to a text column on the board to make retried pushes idempotent;
+# without it tasks.services logs an error, since a retry may create a duplicate item.
 MONDAY_COLUMN_MAP: str = env(
     "MONDAY_COLUMN_MAP",
     default='{"team_member":"text_mkr7jgkp","email":"text_mkr0hqsb","priority":"status_1","status":"status","due_date":"date5","brief_description":"long_text"}',
-) 
\ No newline at end of file
+) 
+# A claimed push not finished within this many seconds may be retried by another worker.
+MONDAY_PUSH_LEASE_SECONDS: int = env.int("MONDAY_PUSH_LEASE_SECONDS", default=120)
+# Items created per aliased create_item mutation when pushing in bulk.
+MONDAY_BATCH_SIZE: int = env.int("MONDAY_BATCH_SIZE", default=25)
+# Ingest approves tasks sent with "approved": true and pushes them in one batch.
+INGEST_AUTO_APPROVE: bool = env.bool("INGEST_AUTO_APPROVE", default=True)
+# reconcile_monday starts a full board scan (deleted-item detection) at most this often.
+MONDAY_RECONCILE_SCAN_INTERVAL_MIN: int = env.int("MONDAY_RECONCILE_SCAN_INTERVAL_MIN", default=60)
+# Signing secret of the Monday app that owns the board webhooks. Requests must be
+# signed with it; while unset, webhook events are refused unless DEBUG is on.
+MONDAY_WEBHOOK_SECRET: str | None = env("MONDAY_WEBHOOK_SECRET", default=None)
+MONDAY_WEBHOOK_BATCH_SIZE: int = env.int("MONDAY_WEBHOOK_BATCH_SIZE", default=200)
@@ -4,11 +4,14 @@ from django.http import JsonResponse
 from django.views.generic import RedirectView
 from django.conf import settings
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
+from tasks.async_views import HealthView
 from tasks.health import health_view
+from tasks.metrics import metrics_view
 from tasks.views import HomeView, PublicActionItemView
 
 urlpatterns = [
-    path("health/", health_view, name="health"),
+    path("health/", HealthView.as_view() if settings.ASYNC_VIEWS else health_view, name="health"),
+    path("metrics", metrics_view, name="metrics"),
     path("admin/", admin.site.urls),
     path("api/", include("tasks.urls", namespace="tasks")),
     # Public page for approved items
@@ -1,9 +1,8 @@
 from django.contrib import admin
 from django.urls import reverse
 from django.utils.html import format_html
-from django.shortcuts import redirect
+from django.shortcuts import get_object_or_404, redirect
 from django.contrib import messages
-from django.utils import timezone
 from django.template.response import TemplateResponse
 from django.http import HttpResponseRedirect
 import logging
@@ -12,8 +11,26 @@ from django.contrib.contenttypes.models import ContentType
 from django.utils.translation import gettext_lazy as _
 from django.utils.encoding import force_str
 from django.contrib.admin import SimpleListFilter
-
-from .models import Meeting, Task, ReviewAction, PageLog, AppSetting, RawTranscript, ActionItem, SecurityQuestion, UserSecurityAnswer
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Max
+from django.http import JsonResponse
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.utils.functional import cached_property
+
+from .models import (
+    Meeting, Task, ReviewAction, PageLog, AppSetting, BulkJob, RawTranscript, ActionItem, MondayPush,
+    MondayWebhookEvent,
+    SecurityQuestion, TaskAssignee, UserSecurityAnswer,
+)
+from .exports import export_response
+from .search import search_tasks
+from .transitions import transition
+
+# Tasks listed on a bulk confirmation page; the rest are only counted
+BULK_CONFIRM_PREVIEW = 100
 
 
 # Admin logging utilities
@@ -68,6 +85,59 @@ class AdminActionLogger:
             change_message=f"{action}: {message}" if message else action,
         )
 
+    @staticmethod
+    def log_bulk_custom_action(request, objs, action, message=''):
+        """Log the same custom action on many objects of one model with a single INSERT."""
+        objs = list(objs)
+        if not objs:
+            return []
+        content_type_id = ContentType.objects.get_for_model(objs[0]).pk
+        change_message = f"{action}: {message}" if message else action
+        return LogEntry.objects.bulk_create([
+            LogEntry(
+                user_id=request.user.pk,
+                content_type_id=content_type_id,
+                object_id=str(obj.pk),
+                object_repr=force_str(obj)[:200],
+                action_flag=CHANGE,
+                change_message=change_message,
+            )
+            for obj in objs
+        ])
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that trusts the planner's row estimate for big unfiltered lists.
+
+    On Postgres an unfiltered changelist page would otherwise run a full
+    ``COUNT(*)``; ``pg_class.reltuples`` is maintained by autovacuum and is
+    accurate enough for page links. Filtered querysets and small tables
+    (below ``ADMIN_ESTIMATED_COUNT_THRESHOLD``) still get an exact count.
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where:
+            estimate = self._estimated_rows(self.object_list)
+            if estimate is not None and estimate >= getattr(settings, 'ADMIN_ESTIMATED_COUNT_THRESHOLD', 10000):
+                return estimate
+        return super().count
+
+    @staticmethod
+    def _estimated_rows(queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 until the table has been vacuumed/analyzed at least once
+        return int(row[0]) if row and row[0] >= 0 else None
+
 
 class LoggingModelAdmin(admin.ModelAdmin):
     """Base ModelAdmin class that logs all actions."""
@@ -113,7 +183,8 @@ class LoggingModelAdmin(admin.ModelAdmin):
 
 @admin.register(Meeting)
 class MeetingAdmin(LoggingModelAdmin):
-    list_display = ("title", "organizer_email", "formatted_date_display", "meeting_id", "execution_id", "formatted_generated_at")
+    list_display = ("title", "organizer_email", "formatted_date_display", "meeting_id", "execution_id", "formatted_generated_at",
+                    "pending_count", "approved_count", "rejected_count")
     list_filter = ("organizer_email",)
     search_fields = ("title", "organizer_email", "meeting_id", "execution_id")
     readonly_fields = ("formatted_date_display", "formatted_generated_at")
@@ -159,67 +230,118 @@ except admin.sites.NotRegistered:
     pass
 
 
-# Custom filter for meetings
-class MeetingFilter(SimpleListFilter):
-    title = 'Meeting'
-    parameter_name = 'meeting'
-    
+class CachedLookupFilter(SimpleListFilter):
+    """List filter whose sidebar shows only the N most recent values, cached.
+
+    Values outside the top N are reachable through the search box rendered by
+    ``admin/tasks/autocomplete_filter.html``, which queries
+    ``ActionItemAdmin.filter_lookup_view``. The cache is dropped whenever a
+    Meeting is saved or deleted (see ``tasks.signals``).
+    """
+
+    template = 'admin/tasks/autocomplete_filter.html'
+    meeting_field = ''  # Meeting column the filter value is matched against
+
+    def __init__(self, request, params, model, model_admin):
+        super().__init__(request, params, model, model_admin)
+        self.autocomplete_url = reverse('admin:filter_lookup', args=[self.parameter_name])
+
+    @classmethod
+    def cache_key(cls):
+        return f"admin-filter-lookups:{cls.parameter_name}"
+
+    @classmethod
+    def recent_lookups(cls, limit):
+        """Return ``[(value, label), ...]`` for the ``limit`` most recent meetings."""
+        rows = (
+            Meeting.objects.exclude(**{f"{cls.meeting_field}__isnull": True})
+            .exclude(**{cls.meeting_field: ''})
+            .values(cls.meeting_field)
+            .annotate(last_seen=Max('date'))
+            .order_by('-last_seen')[:limit]
+        )
+        return [(row[cls.meeting_field], row[cls.meeting_field]) for row in rows]
+
+    @classmethod
+    def search(cls, term, limit):
+        """Autocomplete matches for ``term`` beyond the cached top N."""
+        values = (
+            Meeting.objects.filter(**{f"{cls.meeting_field}__istartswith": term})
+            .order_by(cls.meeting_field)
+            .values_list(cls.meeting_field, flat=True)
+            .distinct()[:limit]
+        )
+        return [(value, value) for value in values]
+
+    @classmethod
+    def label_for(cls, value):
+        return value
+
     def lookups(self, request, model_admin):
-        meetings = Meeting.objects.all().order_by('-date')
-        return [(meeting.id, f"{meeting.title} ({meeting.date.strftime('%b %d, %Y')})") for meeting in meetings]
-    
+        limit = getattr(settings, 'ADMIN_FILTER_LOOKUP_LIMIT', 20)
+        choices = cache.get(self.cache_key())
+        if choices is None:
+            choices = self.recent_lookups(limit)
+            cache.set(self.cache_key(), choices, getattr(settings, 'ADMIN_FILTER_LOOKUP_TTL', 300))
+        # Keep the active selection visible even when it isn't in the top N
+        if self.value() and all(str(value) != self.value() for value, _ in choices):
+            choices = [(self.value(), self.label_for(self.value())), *choices]
+        return choices
+
     def queryset(self, request, queryset):
         if self.value():
-            return queryset.filter(meeting__id=self.value())
+            return queryset.filter(**{f"meeting__{self.meeting_field}": self.value()})
         return queryset
 
 
+# Custom filter for meetings
+class MeetingFilter(CachedLookupFilter):
+    title = 'Meeting'
+    parameter_name = 'meeting'
+    meeting_field = 'id'
+
+    @staticmethod
+    def _label(title, date):
+        return f"{title} ({date.strftime('%b %d, %Y')})"
+
+    @classmethod
+    def recent_lookups(cls, limit):
+        rows = Meeting.objects.order_by('-date').values_list('id', 'title', 'date')[:limit]
+        return [(str(pk), cls._label(title, date)) for pk, title, date in rows]
+
+    @classmethod
+    def search(cls, term, limit):
+        rows = Meeting.objects.filter(title__icontains=term).order_by('-date').values_list('id', 'title', 'date')[:limit]
+        return [(str(pk), cls._label(title, date)) for pk, title, date in rows]
+
+    @classmethod
+    def label_for(cls, value):
+        try:
+            meeting = Meeting.objects.only('title', 'date').get(pk=value)
+        except (Meeting.DoesNotExist, ValidationError):
+            return value
+        return cls._label(meeting.title, meeting.date)
+
+
 # Custom filter for execution_id
-class ExecutionIDFilter(SimpleListFilter):
+class ExecutionIDFilter(CachedLookupFilter):
     title = 'Execution ID'
     parameter_name = 'execution_id'
-    
-    def lookups(self, request, model_admin):
-        # Get unique execution_ids from meetings
-        execution_ids = Meeting.objects.exclude(execution_id__isnull=True).exclude(execution_id='').values_list('execution_id', flat=True).distinct()
-        return [(execution_id, execution_id) for execution_id in execution_ids]
-    
-    def queryset(self, request, queryset):
-        if self.value():
-            return queryset.filter(meeting__execution_id=self.value())
-        return queryset
+    meeting_field = 'execution_id'
 
 
 # Custom filter for meeting_id
-class MeetingIDFilter(SimpleListFilter):
+class MeetingIDFilter(CachedLookupFilter):
     title = 'Meeting ID'
     parameter_name = 'meeting_id'
-    
-    def lookups(self, request, model_admin):
-        # Get unique meeting_ids
-        meeting_ids = Meeting.objects.values_list('meeting_id', flat=True).distinct()
-        return [(meeting_id, meeting_id) for meeting_id in meeting_ids]
-    
-    def queryset(self, request, queryset):
-        if self.value():
-            return queryset.filter(meeting__meeting_id=self.value())
-        return queryset
+    meeting_field = 'meeting_id'
 
 
 # Custom filter for organizer_email
-class OrganizerFilter(SimpleListFilter):
+class OrganizerFilter(CachedLookupFilter):
     title = 'Organizer'
     parameter_name = 'organizer'
-    
-    def lookups(self, request, model_admin):
-        # Get unique organizer emails
-        organizers = Meeting.objects.values_list('organizer_email', flat=True).distinct()
-        return [(organizer, organizer) for organizer in organizers]
-    
-    def queryset(self, request, queryset):
-        if self.value():
-            return queryset.filter(meeting__organizer_email=self.value())
-        return queryset
+    meeting_field = 'organizer_email'
 
 
 @admin.register(ActionItem)
@@ -230,12 +352,41 @@ class ActionItemAdmin(BaseTaskAdmin):
     list_filter = (MeetingFilter, MeetingIDFilter, ExecutionIDFilter, OrganizerFilter, "status", "priority", "posted_to_monday")
     search_fields = ("task_item", "assignee_names", "brief_description", "meeting__title", "meeting__meeting_id", "meeting__execution_id", "meeting__organizer_email")
     readonly_fields = ('action_buttons',)
-    ordering = ("-meeting__date", "-created_at")
+    ordering = ("-meeting_date", "-created_at")
     list_per_page = 50
     date_hierarchy = 'date_expected'
     list_display_links = ('task_item_short',)
+    # Avoid the second, unfiltered COUNT(*) and estimate big totals instead
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+    # Columns read by list_display, admin_actions and the bulk confirmation page
+    changelist_fields = (
+        'id', 'task_item', 'assignee_names', 'priority', 'status', 'date_expected', 'reviewed_at',
+        'posted_to_monday', 'created_at', 'meeting__id', 'meeting__title', 'meeting__meeting_id',
+        'meeting__organizer_email', 'meeting_date',
+    )
     
-    actions = ["approve_send_to_monday", "decline_tasks"]
+    actions = ["approve_send_to_monday", "decline_tasks", "export_csv", "export_ndjson"]
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if not change or {'assignee_names', 'assignee_emails'} & set(form.changed_data):
+            TaskAssignee.sync([obj])
+
+    def get_search_results(self, request, queryset, search_term):
+        """Use the full-text index instead of icontains over search_fields."""
+        if not search_term.strip():
+            return queryset, False
+        return search_tasks(queryset, search_term, rank=False), False
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).select_related('meeting')
+        match = getattr(request, 'resolver_match', None)
+        if match and match.url_name == f'{self.opts.app_label}_{self.opts.model_name}_changelist':
+            # Large TextFields like brief_description and source_payload aren't shown in the list
+            qs = qs.only(*self.changelist_fields)
+        return qs
     
     def task_item_short(self, obj):
         return obj.task_item[:50] + "..." if len(obj.task_item) > 50 else obj.task_item
@@ -343,6 +494,16 @@ class ActionItemAdmin(BaseTaskAdmin):
                 self.admin_site.admin_view(self.reject_task_view),
                 name='reject_task',
             ),
+            path(
+                'bulk-jobs/<int:job_id>/',
+                self.admin_site.admin_view(self.bulk_job_progress_view),
+                name='bulk_job_progress',
+            ),
+            path(
+                'bulk-jobs/<int:job_id>/status/',
+                self.admin_site.admin_view(self.bulk_job_status_view),
+                name='bulk_job_status',
+            ),
             path(
                 'bulk-approve/',
                 self.admin_site.admin_view(self.bulk_approve_view),
@@ -353,12 +514,30 @@ class ActionItemAdmin(BaseTaskAdmin):
                 self.admin_site.admin_view(self.bulk_reject_view),
                 name='bulk_reject',
             ),
+            path(
+                'filter-lookups/<str:parameter>/',
+                self.admin_site.admin_view(self.filter_lookup_view),
+                name='filter_lookup',
+            ),
         ]
         return custom_urls + urls
     
+    def filter_lookup_view(self, request, parameter):
+        """JSON autocomplete for the sidebar filters (``?term=`` prefix search)."""
+        filters = {f.parameter_name: f for f in self.list_filter if isinstance(f, type) and issubclass(f, CachedLookupFilter)}
+        filter_class = filters.get(parameter)
+        term = request.GET.get('term', '').strip()
+        if filter_class is None:
+            return JsonResponse({'detail': 'unknown filter'}, status=404)
+        if not term:
+            return JsonResponse({'results': []})
+        limit = getattr(settings, 'ADMIN_FILTER_LOOKUP_LIMIT', 20)
+        results = [{'value': value, 'label': label} for value, label in filter_class.search(term, limit)]
+        return JsonResponse({'results': results})
+
     def approve_task_view(self, request, task_id):
         """View to approve a single task and send to Monday.com."""
-        from .services import create_monday_item
+        from .services import push_task_to_monday
         
         try:
             task = ActionItem.objects.get(pk=task_id, status=Task.Status.PENDING)
@@ -374,22 +553,13 @@ class ActionItemAdmin(BaseTaskAdmin):
                 }
                 return TemplateResponse(request, 'admin/tasks/confirm_action.html', context)
             
-            # Try to create Monday item
-            item_id = create_monday_item(task)
+            # Approve first: only the reviewer who wins the compare-and-set pushes to Monday
+            if not transition([task.pk], Task.Status.APPROVED, user=request.user):
+                messages.error(request, f"Task '{task.task_item}' was reviewed by someone else in the meantime.")
+                return redirect(reverse('admin:tasks_actionitem_change', args=[task_id]))
+
+            item_id = push_task_to_monday(task)
             if item_id:
-                task.status = Task.Status.APPROVED
-                task.reviewed_at = timezone.now()
-                task.monday_item_id = item_id
-                task.posted_to_monday = True
-                task.save()
-                
-                # Log the action
-                ReviewAction.objects.create(
-                    task=task,
-                    user=request.user,
-                    action=ReviewAction.Action.APPROVE
-                )
-                
                 # Log to admin log
                 AdminActionLogger.log_custom_action(
                     request, 
@@ -400,13 +570,17 @@ class ActionItemAdmin(BaseTaskAdmin):
                 
                 messages.success(request, f"Task '{task.task_item}' approved and sent to Monday.com successfully.")
             else:
-                messages.error(request, f"Failed to send task '{task.task_item}' to Monday.com. Check logs for details.")
+                messages.error(
+                    request,
+                    f"Task '{task.task_item}' approved, but sending it to Monday.com failed. "
+                    "reconcile_monday will retry it; check logs for details.",
+                )
                 
                 # Log the failure
                 AdminActionLogger.log_custom_action(
                     request, 
                     task, 
-                    "Failed to send to Monday.com",
+                    "Approved; failed to send to Monday.com",
                     "Check application logs for details"
                 )
                 
@@ -434,18 +608,9 @@ class ActionItemAdmin(BaseTaskAdmin):
             
             # Process the rejection
             reason = request.POST.get('rejected_reason', "Declined by admin")
-            task.status = Task.Status.REJECTED
-            task.reviewed_at = timezone.now()
-            task.rejected_reason = reason
-            task.save()
-            
-            # Log the action
-            ReviewAction.objects.create(
-                task=task,
-                user=request.user,
-                action=ReviewAction.Action.REJECT,
-                reason=task.rejected_reason
-            )
+            if not transition([task.pk], Task.Status.REJECTED, user=request.user, reason=reason):
+                messages.error(request, f"Task '{task.task_item}' was reviewed by someone else in the meantime.")
+                return redirect(reverse('admin:tasks_actionitem_change', args=[task_id]))
             
             # Log to admin log
             AdminActionLogger.log_custom_action(
@@ -462,21 +627,40 @@ class ActionItemAdmin(BaseTaskAdmin):
         # Redirect back to the change page
         return redirect(reverse('admin:tasks_actionitem_change', args=[task_id]))
 
+    @admin.action(description="Export selected as CSV")
+    def export_csv(self, request, queryset):
+        """Stream the selection (or the whole filtered changelist) as CSV; see ``tasks.exports``."""
+        return export_response(queryset, "csv", request)
+
+    @admin.action(description="Export selected as NDJSON")
+    def export_ndjson(self, request, queryset):
+        return export_response(queryset, "ndjson", request)
+
     @admin.action(description="Approve & send to Monday")
     def approve_send_to_monday(self, request, queryset):
-        """Bulk action to approve tasks and send to Monday.com."""
-        selected = request.POST.getlist("_selected_action")
-        
+        """Bulk action to approve tasks and send to Monday.com.
+
+        Confirmed selections run as a background ``BulkJob``; the admin lands on
+        its progress page.
+        """
         # Filter only pending tasks
         pending_tasks = queryset.filter(status=Task.Status.PENDING)
-        if not pending_tasks:
+        if 'confirm' in request.POST:
+            return self.process_bulk_approve(request, pending_tasks)
+
+        total = pending_tasks.count()
+        if not total:
             messages.warning(request, "No pending tasks selected for approval.")
             return
             
         context = {
             'title': "Confirm bulk approval",
-            'tasks': pending_tasks,
+            'tasks': pending_tasks.select_related('meeting')[:BULK_CONFIRM_PREVIEW],
+            'total': total,
             'action': 'approve',
+            'changelist_action': 'approve_send_to_monday',
+            'select_across': request.POST.get('select_across', '0'),
+            'selected': request.POST.getlist('_selected_action'),
             'opts': self.model._meta,
             'app_label': self.model._meta.app_label,
         }
@@ -484,19 +668,30 @@ class ActionItemAdmin(BaseTaskAdmin):
 
     @admin.action(description="Decline selected tasks")
     def decline_tasks(self, request, queryset):
-        """Bulk action to decline tasks."""
-        selected = request.POST.getlist("_selected_action")
-        
+        """Bulk action to decline tasks.
+
+        The confirmation form posts back to the changelist with the original
+        selection (``select_across`` included), so declining a whole filtered
+        changelist never round-trips thousands of ids through the page.
+        """
         # Filter only pending tasks
         pending_tasks = queryset.filter(status=Task.Status.PENDING)
-        if not pending_tasks:
+        if 'confirm' in request.POST:
+            return self.process_bulk_reject(request, pending_tasks)
+
+        total = pending_tasks.count()
+        if not total:
             messages.warning(request, "No pending tasks selected for rejection.")
             return
             
         context = {
             'title': "Confirm bulk rejection",
-            'tasks': pending_tasks,
+            'tasks': pending_tasks.select_related('meeting')[:BULK_CONFIRM_PREVIEW],
+            'total': total,
             'action': 'reject',
+            'changelist_action': 'decline_tasks',
+            'select_across': request.POST.get('select_across', '0'),
+            'selected': request.POST.getlist('_selected_action'),
             'opts': self.model._meta,
             'app_label': self.model._meta.app_label,
         }
@@ -523,96 +718,44 @@ class ActionItemAdmin(BaseTaskAdmin):
         return TemplateResponse(request, 'admin/tasks/confirm_bulk_action.html', context)
         
     def process_bulk_approve(self, request, queryset):
-        """Process the bulk approval after confirmation."""
-        from .services import create_monday_item
-        
-        logger = logging.getLogger(__name__)
-        logger.info(f"Processing bulk approval for {queryset.count()} tasks")
-        
-        success_count = 0
-        error_count = 0
-        error_tasks = []
-        
-        # Log the bulk action start
-        AdminActionLogger.log_custom_action(
-            request,
-            queryset.first() if queryset.exists() else None,
-            "Bulk Approve Started",
-            f"Processing {queryset.count()} tasks"
-        )
+        """Queue the confirmed approval as a background job and show its progress."""
+        from .bulk_jobs import submit_bulk_approve
 
-        for task in queryset:
-            logger.info(f"Processing task {task.id}: {task.task_item[:50]}...")
-            try:
-                item_id = create_monday_item(task)
-                if item_id:
-                    task.status = Task.Status.APPROVED
-                    task.reviewed_at = timezone.now()
-                    task.monday_item_id = item_id
-                    task.posted_to_monday = True
-                    task.save()
-                    
-                    # Log the action
-                    ReviewAction.objects.create(
-                        task=task,
-                        user=request.user,
-                        action=ReviewAction.Action.APPROVE
-                    )
-                    
-                    # Log to admin log
-                    AdminActionLogger.log_custom_action(
-                        request, 
-                        task, 
-                        "Bulk Approved", 
-                        f"Monday.com Item ID: {item_id}"
-                    )
-                    
-                    logger.info(f"Successfully approved task {task.id} and sent to Monday.com (item_id={item_id})")
-                    success_count += 1
-                else:
-                    logger.error(f"Failed to send task {task.id} to Monday.com - no item_id returned")
-                    error_count += 1
-                    error_tasks.append(task.task_item[:50])
-                    
-                    # Log the failure
-                    AdminActionLogger.log_custom_action(
-                        request, 
-                        task, 
-                        "Bulk Approval Failed", 
-                        "Failed to send to Monday.com"
-                    )
-            except Exception as e:
-                logger.exception(f"Exception while processing task {task.id}: {str(e)}")
-                error_count += 1
-                error_tasks.append(task.task_item[:50])
-                
-                # Log the exception
-                AdminActionLogger.log_custom_action(
-                    request, 
-                    task, 
-                    "Bulk Approval Exception", 
-                    str(e)[:200]
-                )
-        
-        # Log the bulk action completion
-        AdminActionLogger.log_custom_action(
-            request,
-            queryset.first() if queryset.exists() else None,
-            "Bulk Approve Completed",
-            f"Success: {success_count}, Errors: {error_count}"
-        )
-        
-        if success_count:
-            messages.success(request, f"{success_count} task(s) approved and sent to Monday.com successfully.")
-        if error_count:
-            error_msg = f"Failed to send {error_count} task(s) to Monday.com. Check logs for details."
-            if error_tasks:
-                error_msg += f" Problem tasks: {', '.join(error_tasks[:3])}"
-                if len(error_tasks) > 3:
-                    error_msg += f" and {len(error_tasks) - 3} more"
-            messages.error(request, error_msg)
-            
-        return redirect('admin:tasks_actionitem_changelist')
+        task_ids = list(queryset.order_by('created_at').values_list('pk', flat=True))
+        if not task_ids:
+            messages.info(request, "No pending tasks were selected to approve.")
+            return redirect('admin:tasks_actionitem_changelist')
+        with transaction.atomic():
+            job = submit_bulk_approve(task_ids, request.user)
+        AdminActionLogger.log_custom_action(request, job, "Bulk Approve Submitted", f"{len(task_ids)} task(s)")
+        messages.info(request, f"Approving {len(task_ids)} task(s) in the background.")
+        return redirect('admin:bulk_job_progress', job_id=job.pk)
+
+    def bulk_job_progress_view(self, request, job_id):
+        """Progress page for a bulk job; polls ``bulk_job_status``."""
+        job = get_object_or_404(BulkJob, pk=job_id)
+        context = {
+            **self.admin_site.each_context(request),
+            'title': f"Bulk job #{job.pk}",
+            'job': job,
+            'opts': self.model._meta,
+            'app_label': self.model._meta.app_label,
+        }
+        return TemplateResponse(request, 'admin/tasks/bulk_job_progress.html', context)
+
+    def bulk_job_status_view(self, request, job_id):
+        job = get_object_or_404(BulkJob, pk=job_id)
+        return JsonResponse({
+            'state': job.state,
+            'state_display': job.get_state_display(),
+            'cursor': job.cursor,
+            'total': job.total,
+            'percent': job.percent,
+            'approved': job.approved,
+            'pushed': job.pushed,
+            'skipped': job.skipped,
+            'last_error': job.last_error,
+        })
     
     def bulk_reject_view(self, request):
         """View to handle bulk reject confirmation."""
@@ -635,51 +778,25 @@ class ActionItemAdmin(BaseTaskAdmin):
         return TemplateResponse(request, 'admin/tasks/confirm_bulk_action.html', context)
     
     def process_bulk_reject(self, request, queryset):
-        """Process the bulk rejection after confirmation."""
-        count = 0
-        
-        # Log the bulk action start
-        AdminActionLogger.log_custom_action(
-            request,
-            queryset.first() if queryset.exists() else None,
-            "Bulk Reject Started",
-            f"Processing {queryset.count()} tasks"
-        )
-        
-        for task in queryset:
-            task.status = Task.Status.REJECTED
-            task.reviewed_at = timezone.now()
-            task.rejected_reason = "Declined by admin"
-            task.save()
-            
-            # Log the action
-            ReviewAction.objects.create(
-                task=task,
-                user=request.user,
-                action=ReviewAction.Action.REJECT,
-                reason="Declined by admin"
-            )
-            
-            # Log to admin log
-            AdminActionLogger.log_custom_action(
-                request, 
-                task, 
-                "Bulk Rejected", 
-                "Declined by admin"
+        """Process the bulk rejection after confirmation.
+
+        One SELECT for the selection, then ``transition`` (one UPDATE plus one
+        ``bulk_create`` of ReviewActions) and one ``bulk_create`` of admin log
+        entries, all in a single transaction.
+        """
+        reason = "Declined by admin"
+        with transaction.atomic():
+            rows = dict(queryset.values_list('pk', 'task_item'))
+            moved = transition(rows, Task.Status.REJECTED, user=request.user, reason=reason).moved
+            AdminActionLogger.log_bulk_custom_action(
+                request,
+                (ActionItem(pk=pk, task_item=rows[pk], status=Task.Status.REJECTED) for pk in moved),
+                "Bulk Rejected",
+                reason,
             )
-            
-            count += 1
-        
-        # Log the bulk action completion
-        AdminActionLogger.log_custom_action(
-            request,
-            queryset.first() if queryset.exists() else None,
-            "Bulk Reject Completed",
-            f"Rejected {count} tasks"
-        )
-        
-        if count:
-            messages.success(request, f"{count} task(s) declined successfully.")
+
+        if moved:
+            messages.success(request, f"{len(moved)} task(s) declined successfully.")
         else:
             messages.info(request, "No pending tasks were selected to decline.")
             
@@ -705,6 +822,40 @@ class PageLogAdmin(LoggingModelAdmin):
     search_fields = ("user__username", "path", "remote_addr")
 
 
+@admin.register(MondayWebhookEvent)
+class MondayWebhookEventAdmin(LoggingModelAdmin):
+    list_display = ("event_type", "item_id", "received_at", "processed_at", "error")
+    list_filter = ("event_type",)
+    search_fields = ("item_id", "trigger_uuid")
+    readonly_fields = ("trigger_uuid", "event_type", "item_id", "payload", "received_at", "processed_at", "error")
+
+
+@admin.register(MondayPush)
+class MondayPushAdmin(LoggingModelAdmin):
+    list_display = ("task", "state", "attempts", "item_id", "claimed_at", "updated_at")
+    list_filter = ("state",)
+    search_fields = ("task__id", "item_id")
+    raw_id_fields = ("task",)
+    readonly_fields = ("claimed_at", "updated_at")
+
+
+@admin.register(BulkJob)
+class BulkJobAdmin(LoggingModelAdmin):
+    list_display = ("__str__", "state", "progress", "approved", "pushed", "skipped", "created_by", "created_at")
+    list_filter = ("kind", "state")
+    readonly_fields = ("kind", "state", "created_by", "cursor", "approved", "pushed", "skipped", "last_error",
+                       "created_at", "started_at", "heartbeat_at", "finished_at")
+    exclude = ("task_ids",)
+
+    @admin.display(description="Progress")
+    def progress(self, obj):
+        url = reverse('admin:bulk_job_progress', args=[obj.pk])
+        return format_html('<a href="{}">{} / {} ({}%)</a>', url, obj.cursor, obj.total, obj.percent)
+
+    def has_add_permission(self, request):
+        return False
+
+
 @admin.register(AppSetting)
 class AppSettingAdmin(LoggingModelAdmin):
     list_display = ("key", "updated_at")
@@ -23,6 +23,7 @@ class TasksConfig(AppConfig):
         missing, the function silently exits so local development isn't
         affected.
         """
+        from . import signals  # noqa: F401 – registers model signal handlers
 
         @receiver(post_migrate)
         def _bootstrap_superuser(sender, **kwargs):  # noqa: ANN001
@@ -0,0 +1,162 @@
+"""Async views for the I/O-bound endpoints, served when ``ASYNC_VIEWS`` is on.
+
+Under ASGI (uvicorn workers) a sync view holds a worker thread for as long as it
+waits on Monday.com. These views await instead: Monday calls go through
+``httpx.AsyncClient`` (``services._apost_monday``) and task lookups use Django's
+async ORM. Transactional work (``views.apply_review``, push claims, the health
+DB checks) still runs through ``sync_to_async``, since Django's async ORM has
+no ``transaction.atomic``.
+
+Responses match ``TaskViewSet.approve`` / ``act`` and ``health.health_view``, so
+clients don't notice which set of views served them. Like ``TaskViewSet`` the
+task endpoints are public and CSRF-exempt.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.views import View
+
+from .health import MONDAY_PROBE, _health_payload, _monday_probe_status
+from .models import Task
+from .serializers import TaskActionSerializer, TaskSerializer
+from .services import _apost_monday, _get_setting, apush_task_to_monday
+from .views import ReviewConflict, apply_review
+
+logger = logging.getLogger(__name__)
+
+
+async def _get_task(pk) -> Task | None:
+    try:
+        return await Task.objects.select_related("meeting").aget(pk=pk)
+    except Task.DoesNotExist:
+        return None
+
+
+def _request_data(request) -> dict | None:
+    """JSON or form body as a dict; ``None`` if the JSON doesn't parse."""
+    if request.content_type == "application/json":
+        try:
+            return json.loads(request.body or b"{}")
+        except ValueError:
+            return None
+    return request.POST.dict()
+
+
+async def _review(task: Task, new_status: str, **edits) -> Task | JsonResponse:
+    try:
+        return await sync_to_async(apply_review)(task, new_status, **edits)
+    except ReviewConflict as exc:
+        return JsonResponse({"detail": str(exc.detail)}, status=exc.status_code)
+
+
+async def _push(task: Task) -> None:
+    if task.monday_item_id:
+        return
+    item_id = await apush_task_to_monday(task)
+    if item_id:
+        logger.info("Task %s successfully sent to Monday.com with item_id=%s", task.id, item_id)
+    else:
+        logger.error("Failed to send task %s to Monday.com", task.id)
+
+
+async def _task_response(task: Task) -> JsonResponse:
+    data = await sync_to_async(lambda: TaskSerializer(task).data)()
+    return JsonResponse(data)
+
+
+class _PublicTaskView(View):
+    http_method_names = ["post", "options"]
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # Django 4.2's csrf_exempt wraps the view in a sync function; set the flag directly
+        view.csrf_exempt = True
+        return view
+
+
+class ApproveTaskView(_PublicTaskView):
+    """Async ``TaskViewSet.approve``."""
+
+    async def post(self, request, pk):
+        task = await _get_task(pk)
+        if task is None:
+            return JsonResponse({"detail": "Not found."}, status=404)
+        if request.GET.get("confirm") != "true":
+            return JsonResponse({"message": "Preview. Resend with ?confirm=true to apply."}, status=202)
+
+        task = await _review(task, Task.Status.APPROVED)
+        if isinstance(task, JsonResponse):
+            return task
+        await _push(task)
+        return await _task_response(task)
+
+
+class ActTaskView(_PublicTaskView):
+    """Async ``TaskViewSet.act``."""
+
+    async def post(self, request, pk):
+        task = await _get_task(pk)
+        if task is None:
+            return JsonResponse({"detail": "Not found."}, status=404)
+        body = _request_data(request)
+        if body is None:
+            return JsonResponse({"detail": "JSON parse error"}, status=400)
+        serializer = TaskActionSerializer(data=body)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=400)
+        data = serializer.validated_data
+
+        if request.GET.get("confirm") != "true":
+            logger.debug("Preview requested before confirmation for task %s", task.id)
+            return JsonResponse(
+                {
+                    "message": "Preview. Resend the same request with ?confirm=true within 5 seconds to apply.",
+                    "payload": data,
+                },
+                status=202,
+            )
+
+        # same defensive delay as the sync view, without holding a worker
+        await asyncio.sleep(1)
+
+        task = await _review(
+            task,
+            Task.Status.APPROVED if data["action"] == "approve" else Task.Status.REJECTED,
+            reason=data.get("reason", ""),
+            note=data.get("new_brief_description") or data.get("description"),
+            date_expected=data.get("new_date_expected"),
+        )
+        if isinstance(task, JsonResponse):
+            return task
+        if task.status == Task.Status.APPROVED:
+            await _push(task)
+        return await _task_response(task)
+
+
+class HealthView(View):
+    """Async ``health_view``: the Monday probe is awaited, the DB checks run in a thread."""
+
+    http_method_names = ["get", "head", "options"]
+
+    async def get(self, request):
+        monday = await cache.aget("health_monday")
+        if monday is None:
+            token_present = bool(await sync_to_async(_get_setting)("MONDAY_API_KEY"))
+            status_msg = "missing-token"
+            if token_present:
+                try:
+                    status_msg = _monday_probe_status(await _apost_monday(MONDAY_PROBE))
+                except Exception as exc:  # pragma: no cover
+                    status_msg = str(exc)
+            monday = {"token_present": token_present, "api_status": status_msg}
+            await cache.aset("health_monday", monday, 60)
+
+        payload, status = await sync_to_async(_health_payload)(monday)
+        return JsonResponse(payload, status=status)
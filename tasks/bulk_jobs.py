@@ -0,0 +1,153 @@
+"""Background bulk admin jobs (``BulkJob``): chunked, persisted and resumable.
+
+``submit_bulk_approve`` records the selection and, once that is committed,
+starts ``run_job`` in a daemon thread (``BULK_JOBS_IN_THREAD``), so the admin
+request returns straight away. ``submit_push`` does the same for tasks that are
+already approved (ingest auto-approval), so only the Monday.com push runs in
+the background. ``run_job`` takes the job's lease and works
+through ``task_ids`` ``BULK_JOB_CHUNK_SIZE`` at a time. Each chunk commits its
+approvals (``transitions.transition``) together with the job's cursor and
+counters, then pushes the chunk to Monday.com with ``push_tasks_to_monday``
+(batched ``create_item`` calls, idempotent push claims).
+
+The lease is ``heartbeat_at``: every chunk commit is a compare-and-set on it, so
+two workers never run the same job. A worker that dies leaves a stale heartbeat,
+and ``manage.py run_bulk_jobs`` resumes the job from ``cursor``. Tasks approved in
+a chunk whose push never ran (or failed) stay approved without an item and are
+re-pushed by ``reconcile_monday``.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import BulkJob, Task
+from .services import push_tasks_to_monday
+from .transitions import transition
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLost(Exception):
+    """Another worker took over the job (ours looked dead)."""
+
+
+def submit_bulk_approve(task_ids, user=None) -> BulkJob:
+    """Queue an approve-and-push job for ``task_ids``; starts it after commit when running in-thread."""
+    return _submit(BulkJob.Kind.APPROVE, task_ids, user)
+
+
+def submit_push(task_ids) -> BulkJob:
+    """Queue a push-only job for already approved ``task_ids``; starts it like ``submit_bulk_approve``."""
+    return _submit(BulkJob.Kind.PUSH, task_ids)
+
+
+def _submit(kind: str, task_ids, user=None) -> BulkJob:
+    job = BulkJob.objects.create(
+        kind=kind,
+        created_by=user if user is not None and user.is_authenticated else None,
+        task_ids=[str(pk) for pk in task_ids],
+    )
+    if settings.BULK_JOBS_IN_THREAD:
+        transaction.on_commit(lambda: start_in_thread(job.pk))
+    return job
+
+
+def start_in_thread(job_id: int) -> threading.Thread:
+    thread = threading.Thread(target=_run_in_thread, args=(job_id,), name=f"bulk-job-{job_id}", daemon=True)
+    thread.start()
+    return thread
+
+
+def _run_in_thread(job_id: int) -> None:
+    try:
+        run_job(job_id)
+    except Exception:  # pragma: no cover - logged, the job is marked failed by run_job
+        logger.exception("Bulk job %s crashed", job_id)
+    finally:
+        connection.close()
+
+
+def resumable(now: datetime | None = None):
+    """Jobs a worker may start: queued ones and running ones whose heartbeat went stale."""
+    stale = (now or timezone.now()) - timedelta(seconds=settings.BULK_JOB_STALE_SECONDS)
+    return BulkJob.objects.filter(
+        Q(state=BulkJob.State.QUEUED)
+        | Q(state=BulkJob.State.RUNNING, heartbeat_at__lt=stale)
+        | Q(state=BulkJob.State.RUNNING, heartbeat_at__isnull=True)
+    )
+
+
+def claim(job_id: int, now: datetime | None = None) -> BulkJob | None:
+    """Take the lease on job ``job_id``; ``None`` if it's finished or another worker is alive on it."""
+    now = now or timezone.now()
+    won = resumable(now).filter(pk=job_id).update(state=BulkJob.State.RUNNING, heartbeat_at=now)
+    if not won:
+        return None
+    job = BulkJob.objects.select_related("created_by").get(pk=job_id)
+    if job.started_at is None:
+        job.started_at = now
+        job.save(update_fields=["started_at"])
+    return job
+
+
+def _commit_progress(job: BulkJob, **changes) -> None:
+    """Write ``changes`` and a fresh heartbeat, provided we still hold the lease."""
+    now = timezone.now()
+    won = BulkJob.objects.filter(pk=job.pk, heartbeat_at=job.heartbeat_at).update(heartbeat_at=now, **changes)
+    if not won:
+        raise LeaseLost(f"Bulk job {job.pk} was taken over by another worker")
+    job.heartbeat_at = now
+    for name, value in changes.items():
+        setattr(job, name, value)
+
+
+def _approve_chunk(job: BulkJob, chunk: list[str]) -> None:
+    with transaction.atomic():
+        result = transition(chunk, Task.Status.APPROVED, user=job.created_by, reason=f"Bulk approval #{job.pk}")
+        _commit_progress(job, cursor=job.cursor + len(chunk), approved=job.approved + len(result.moved),
+                         skipped=job.skipped + len(result.skipped))
+    # after commit: a crash here leaves approved-but-unposted tasks for reconcile_monday
+    pushed = push_tasks_to_monday(chunk)
+    _commit_progress(job, pushed=job.pushed + pushed)
+
+
+def _push_chunk(job: BulkJob, chunk: list[str]) -> None:
+    # push claims make a resumed job re-pushing this chunk a no-op for items already created
+    pushed = push_tasks_to_monday(chunk)
+    _commit_progress(job, cursor=job.cursor + len(chunk), pushed=job.pushed + pushed)
+
+
+RUNNERS = {
+    BulkJob.Kind.APPROVE: _approve_chunk,
+    BulkJob.Kind.PUSH: _push_chunk,
+}
+
+
+def run_job(job_id: int, chunk_size: int | None = None) -> BulkJob | None:
+    """Run (or resume) job ``job_id`` to completion; ``None`` if it could not be claimed."""
+    job = claim(job_id)
+    if job is None:
+        return None
+    chunk_size = chunk_size or settings.BULK_JOB_CHUNK_SIZE
+    run_chunk = RUNNERS[job.kind]
+    try:
+        while job.cursor < job.total:
+            run_chunk(job, job.task_ids[job.cursor:job.cursor + chunk_size])
+    except LeaseLost:
+        logger.warning("Bulk job %s: lease lost, leaving it to the other worker", job.pk)
+        return job
+    except Exception as exc:
+        logger.exception("Bulk job %s failed at %d/%d", job.pk, job.cursor, job.total)
+        _commit_progress(job, state=BulkJob.State.FAILED, last_error=str(exc)[:2000], finished_at=timezone.now())
+        return job
+    _commit_progress(job, state=BulkJob.State.DONE, last_error="", finished_at=timezone.now())
+    logger.info("Bulk job %s done: approved=%d pushed=%d skipped=%d",
+                job.pk, job.approved, job.pushed, job.skipped)
+    return job
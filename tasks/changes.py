@@ -0,0 +1,107 @@
+"""Delta sync for API consumers mirroring tasks (``GET /api/tasks/changes/``).
+
+A change token is a keyset position ``(timestamp, task id)``. A page holds the
+tasks whose ``updated_at`` is after the token and the ``TaskTombstone`` rows
+whose ``deleted_at`` is after it, merged in that order. Both are range scans on
+an index (``task_updated_idx``, ``tasktombstone_deleted_idx``), so a sync costs
+O(changes) instead of O(table).
+
+Tokens only advance to ``now - SETTLE``. ``updated_at`` is stamped before the
+writing transaction commits, so a row can become visible after a later-stamped
+one. Holding back the last few seconds means a client never skips past it.
+Tokens older than ``TASK_TOMBSTONE_RETENTION_DAYS`` are refused, because the
+deletes they would need may already be pruned. The client must then sync again
+from scratch.
+"""
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Task, TaskTombstone
+
+# Rows stamped this recently may belong to a transaction that hasn't committed yet
+SETTLE = timedelta(seconds=5)
+MIN_ID = uuid.UUID(int=0)
+MAX_ID = uuid.UUID(int=(1 << 128) - 1)
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class TokenExpired(Exception):
+    """The token predates tombstone retention; the client must re-sync from scratch."""
+
+
+@dataclass
+class ChangePage:
+    upserted: list = field(default_factory=list)  # Task instances
+    deleted: list = field(default_factory=list)  # TaskTombstone instances
+    next_token: str = ""
+    has_more: bool = False
+
+
+def encode_token(ts: datetime, pk: uuid.UUID) -> str:
+    micros = (ts - EPOCH) // timedelta(microseconds=1)
+    return f"{micros}_{pk.hex}"
+
+
+def decode_token(token: str) -> tuple[datetime, uuid.UUID]:
+    """Inverse of ``encode_token``; raises ``ValueError`` for anything else."""
+    micros, _, pk = token.partition("_")
+    return EPOCH + timedelta(microseconds=int(micros)), uuid.UUID(hex=pk)
+
+
+def _after(ts_field: str, id_field: str, ts: datetime, pk: uuid.UUID) -> Q:
+    return Q(**{f"{ts_field}__gt": ts}) | Q(**{ts_field: ts, f"{id_field}__gt": pk})
+
+
+def changes_since(token: str | None, limit: int, now: datetime | None = None) -> ChangePage:
+    """The first ``limit`` changes after ``token`` (from the beginning when ``None``)."""
+    now = now or timezone.now()
+    horizon = now - SETTLE
+    ts, pk = decode_token(token) if token else (EPOCH, MIN_ID)
+    if token and ts < now - timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS):
+        raise TokenExpired(token)
+
+    tasks = list(
+        Task.objects.filter(_after("updated_at", "id", ts, pk), updated_at__lte=horizon)
+        .order_by("updated_at", "id")[:limit + 1]
+    )
+    tombstones = list(
+        TaskTombstone.objects.filter(_after("deleted_at", "task_id", ts, pk), deleted_at__lte=horizon)
+        .order_by("deleted_at", "task_id")[:limit + 1]
+    )
+    merged = sorted(
+        [(task.updated_at, task.pk, task) for task in tasks]
+        + [(stone.deleted_at, stone.task_id, stone) for stone in tombstones],
+        key=lambda entry: entry[:2],
+    )
+
+    page = ChangePage(has_more=len(merged) > limit)
+    for _, _, obj in merged[:limit]:
+        (page.deleted if isinstance(obj, TaskTombstone) else page.upserted).append(obj)
+    if page.has_more:
+        last_ts, last_pk, _ = merged[limit - 1]
+        page.next_token = encode_token(last_ts, last_pk)
+    else:
+        # everything up to the horizon has been handed out
+        page.next_token = encode_token(*max((ts, pk), (horizon, MAX_ID)))
+    return page
+
+
+def record_tombstones(tasks) -> None:
+    now = timezone.now()
+    TaskTombstone.objects.bulk_create(
+        [TaskTombstone(task_id=task.pk, meeting_id=task.meeting_id, deleted_at=now) for task in tasks],
+        update_conflicts=True, unique_fields=["task_id"], update_fields=["meeting_id", "deleted_at"],
+    )
+
+
+def prune_tombstones(now: datetime | None = None) -> int:
+    cutoff = (now or timezone.now()) - timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS)
+    deleted, _ = TaskTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,82 @@
+"""Materialised per-meeting task counters (``Meeting.pending_count`` & co.).
+
+Counters are recomputed from ``tasks_task`` with a single ``UPDATE`` per batch
+of meetings rather than incremented, so a refresh is idempotent and can never
+make drift worse. Task saves/deletes trigger a refresh through
+``tasks.signals``; code that writes many tasks at once (ingest) wraps itself in
+``deferred()`` so each affected meeting is refreshed once at the end.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator
+
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import Meeting, Task
+
+COUNTER_FIELDS = {
+    "pending_count": Task.Status.PENDING,
+    "approved_count": Task.Status.APPROVED,
+    "rejected_count": Task.Status.REJECTED,
+}
+
+_pending_refresh: ContextVar[set | None] = ContextVar("pending_counter_refresh", default=None)
+
+
+def _count_subquery(status: str) -> Coalesce:
+    counts = (
+        Task.objects.filter(meeting=OuterRef("pk"), status=status)
+        .order_by()
+        .values("meeting")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def refresh_meeting_counters(meeting_ids: Iterable) -> int:
+    """Recompute the counters of ``meeting_ids`` in one statement; returns rows updated."""
+    meeting_ids = {pk for pk in meeting_ids if pk is not None}
+    if not meeting_ids:
+        return 0
+    return Meeting.objects.filter(pk__in=meeting_ids).update(
+        **{field: _count_subquery(status) for field, status in COUNTER_FIELDS.items()}
+    )
+
+
+def schedule_refresh(meeting_id) -> None:
+    """Refresh ``meeting_id`` now, or at the end of the enclosing ``deferred()`` block."""
+    pending = _pending_refresh.get()
+    if pending is None:
+        refresh_meeting_counters([meeting_id])
+    else:
+        pending.add(meeting_id)
+
+
+@contextmanager
+def deferred() -> Iterator[set]:
+    """Collect counter refreshes and run them once when the block exits."""
+    if _pending_refresh.get() is not None:  # nested: the outer block flushes
+        yield _pending_refresh.get()
+        return
+    pending: set = set()
+    token = _pending_refresh.set(pending)
+    try:
+        yield pending
+    finally:
+        _pending_refresh.reset(token)
+    refresh_meeting_counters(pending)
+
+
+def drifted_meetings():
+    """Meetings whose stored counters disagree with their tasks."""
+    actual = {
+        f"actual_{field}": Count("tasks", filter=Q(tasks__status=status)) for field, status in COUNTER_FIELDS.items()
+    }
+    drift = Q()
+    for field in COUNTER_FIELDS:
+        drift |= ~Q(**{field: F(f"actual_{field}")})
+    return Meeting.objects.order_by().annotate(**actual).filter(drift)
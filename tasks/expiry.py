@@ -0,0 +1,59 @@
+"""Closing pending tasks whose public review window (``Task.expires_at``) has passed.
+
+Driven by ``manage.py expire_tasks``. Each batch is claimed and transitioned in
+its own transaction through ``transitions.transition`` (set-based UPDATEs
+guarded on ``status='pending'``), so a reviewer acting at the same moment wins
+and the sweep simply skips the row.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Task
+from .transitions import transition
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("auto", "expire")
+
+
+@dataclass
+class BatchResult:
+    approved: list = field(default_factory=list)  # task ids, to be sent to Monday.com
+    expired: list = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.approved) + len(self.expired)
+
+
+def overdue(now=None):
+    """Pending tasks past their review window (served by ``task_pending_expires_idx``)."""
+    return Task.objects.filter(status=Task.Status.PENDING, expires_at__lte=now or timezone.now())
+
+
+def expire_batch(policy: str = "auto", batch_size: int = 500, now=None) -> BatchResult:
+    """Transition up to ``batch_size`` overdue tasks according to ``policy``."""
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown expiry policy {policy!r}; expected one of {POLICIES}")
+    now = now or timezone.now()
+    result = BatchResult()
+
+    with transaction.atomic():
+        rows = list(
+            overdue(now).select_for_update(skip_locked=True)
+            .order_by("expires_at")
+            .values_list("pk", "auto_approved")[:batch_size]
+        )
+        if not rows:
+            return result
+        approve = [pk for pk, auto in rows if policy == "auto" and auto]
+        expire = [pk for pk, auto in rows if not (policy == "auto" and auto)]
+        result.approved = transition(approve, Task.Status.APPROVED, reason="Auto-approved on expiry", now=now).moved
+        result.expired = transition(expire, Task.Status.EXPIRED, reason="Review window elapsed", now=now).moved
+
+    logger.info("Expiry batch: approved=%d expired=%d", len(result.approved), len(result.expired))
+    return result
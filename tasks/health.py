@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 from importlib import import_module
 import subprocess, os
@@ -36,6 +37,40 @@ def _check_migrations() -> dict[str, str]:
         return {"migrations": f"error: {exc}"}
 
 
+MONDAY_PROBE = "query { me { id } }"
+
+
+def _monday_probe_status(data: dict) -> str:
+    if data.get("errors"):
+        return data["errors"][0].get("message", "error")
+    return "ok"
+
+
+@functools.cache
+def _git_sha() -> str:
+    # the checkout doesn't change under a running process
+    try:
+        return (
+            subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).resolve().parent.parent)
+            .decode()
+            .strip()
+        )
+    except Exception:  # pragma: no cover
+        return "unknown"
+
+
+def _health_payload(monday: dict) -> tuple[dict, int]:
+    payload = {
+        "timestamp": now().isoformat(),
+        **_check_database(),
+        **_check_migrations(),
+        "monday": monday,
+        "version": _git_sha(),
+    }
+    status = 200 if payload.get("database") == "ok" and payload.get("migrations") == "ok" else 503
+    return payload, status
+
+
 def health_view(request):  # noqa: D401
     """Return JSON with app, DB, and migrations status."""
 
@@ -47,11 +82,7 @@ def health_view(request):  # noqa: D401
         if token_present:
             try:
                 # Simple query to check if API key is valid
-                data = _post_monday("query { me { id } }")
-                if data.get("errors"):
-                    status_msg = data["errors"][0].get("message", "error")
-                else:
-                    status_msg = "ok"
+                status_msg = _monday_probe_status(_post_monday(MONDAY_PROBE))
             except Exception as exc:  # pragma: no cover
                 status_msg = str(exc)
         monday_cache = {
@@ -60,22 +91,5 @@ def health_view(request):  # noqa: D401
         }
         cache.set("health_monday", monday_cache, 60)
 
-    # git sha
-    try:
-        git_sha = (
-            subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).resolve().parent.parent)
-            .decode()
-            .strip()
-        )
-    except Exception:  # pragma: no cover
-        git_sha = "unknown"
-
-    payload = {
-        "timestamp": now().isoformat(),
-        **_check_database(),
-        **_check_migrations(),
-        "monday": monday_cache,
-        "version": git_sha,
-    }
-    status = 200 if payload.get("database") == "ok" and payload.get("migrations") == "ok" else 503
-    return JsonResponse(payload, status=status) 
\ No newline at end of file
+    payload, status = _health_payload(monday_cache)
+    return JsonResponse(payload, status=status)
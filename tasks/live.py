@@ -0,0 +1,290 @@
+"""Live task updates for the public review page, as server-sent events.
+
+``GET /api/tasks/live/?since=<cursor>`` streams one ``task`` event per task
+whose row changed after ``since`` (status, rejection reason, Monday.com badge),
+so the page patches single cards instead of reloading. The event id is the
+cursor, a keyset ``(updated_at, id)`` token as in ``tasks.changes``; a
+reconnecting ``EventSource`` sends it back as ``Last-Event-ID``.
+
+Changes are found by polling ``Task.updated_at`` (indexed). ``updated_at`` is
+stamped before the writing transaction commits, so a row can become visible
+after a later-stamped one. The cursor therefore only moves past rows at least
+``COMMIT_SLACK`` old; everything up to it has been sent.
+
+* Under WSGI a stream answers one poll and closes; its ``retry`` field makes
+  the browser reconnect after ``LIVE_POLL_SECONDS``. A sync worker is never
+  held open. Rows younger than ``COMMIT_SLACK`` wait for a later poll, so a
+  reconnect never repeats a change.
+* Under ASGI the stream stays open for up to ``LIVE_STREAM_SECONDS`` and
+  sleeps between polls on ``wakeup``. It sends rows as soon as they appear and
+  remembers what it sent until the cursor passes them. Committed transitions
+  set ``wakeup`` in their own process. On PostgreSQL they also ``NOTIFY`` a
+  channel that one listener thread per process ``LISTEN``s on, so every
+  worker's streams wake at once. Anything else is picked up by the next
+  ``LIVE_POLL_SECONDS`` poll.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connection
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .changes import MAX_ID, SETTLE as COMMIT_SLACK, _after, decode_token, encode_token
+from .models import Task
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "taskforge_tasks"
+BATCH_SIZE = 500
+KEEPALIVE_SECONDS = 15
+
+FIELDS = ("id", "meeting_id", "status", "rejected_reason", "posted_to_monday", "monday_item_id", "updated_at")
+
+
+def start_token(now: datetime | None = None) -> str:
+    """Cursor for a page rendered at ``now``: re-sends only changes that may not have committed yet."""
+    return encode_token((now or timezone.now()) - COMMIT_SLACK, MAX_ID)
+
+
+class ChangeFeed:
+    """Tasks changed after a keyset ``position``, each (task, ``updated_at``) sent once.
+
+    ``position`` only advances over rows older than ``COMMIT_SLACK``. With
+    ``eager`` the feed also sends younger rows, remembering them until the
+    position passes them; otherwise they wait until they are old enough.
+    """
+
+    def __init__(self, position: tuple[datetime, uuid.UUID], eager: bool = False):
+        self.position = position
+        self.eager = eager
+        self._sent: dict[uuid.UUID, datetime] = {}
+        self._scan: tuple[datetime, uuid.UUID] | None = None  # keyset position while draining a backlog
+
+    @property
+    def token(self) -> str:
+        return encode_token(*self.position)
+
+    def poll(self, now: datetime | None = None) -> list[dict]:
+        horizon = (now or timezone.now()) - COMMIT_SLACK
+        qs = (
+            Task.objects.filter(_after("updated_at", "id", *(self._scan or self.position)))
+            .order_by("updated_at", "pk")
+            .values(*FIELDS)
+        )
+        if not self.eager:
+            qs = qs.filter(updated_at__lte=horizon)
+        rows = list(qs[:BATCH_SIZE])
+        self._scan = (rows[-1]["updated_at"], rows[-1]["id"]) if len(rows) == BATCH_SIZE else None
+
+        changes = []
+        for row in rows:
+            if self._sent.get(row["id"]) == row["updated_at"]:
+                continue
+            changes.append(_task_event(row))
+            if row["updated_at"] > horizon:
+                self._sent[row["id"]] = row["updated_at"]
+        # rows come in keyset order, so the settled ones are a prefix
+        settled = [(row["updated_at"], row["id"]) for row in rows if row["updated_at"] <= horizon]
+        if settled:
+            self.position = max(self.position, settled[-1])
+        if self._scan is None:
+            # every row up to the horizon has been read
+            self.position = max(self.position, (horizon, MAX_ID))
+        self._sent = {pk: ts for pk, ts in self._sent.items() if (ts, pk) > self.position}
+        return changes
+
+
+def _task_event(row: dict) -> dict:
+    return {
+        "id": str(row["id"]),
+        "meeting_id": str(row["meeting_id"]),
+        "status": row["status"],
+        "rejected_reason": row["rejected_reason"],
+        "posted_to_monday": bool(row["posted_to_monday"] or row["monday_item_id"]),
+        "updated_at": row["updated_at"].isoformat(),
+    }
+
+
+def format_event(data: dict | None = None, *, event: str | None = None, event_id: str | None = None,
+                 retry_ms: int | None = None) -> str:
+    lines = []
+    if retry_ms is not None:
+        lines.append(f"retry: {retry_ms}")
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    if data is not None:
+        lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+# ---------------------------------------------------------------------------
+# Waking ASGI streams
+# ---------------------------------------------------------------------------
+
+
+class Wakeup:
+    """Change counter that sync and async waiters can sleep on."""
+
+    def __init__(self):
+        self.generation = 0
+        self._cond = threading.Condition()
+        self._async_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    def notify(self) -> None:
+        with self._cond:
+            self.generation += 1
+            self._cond.notify_all()
+            waiters = list(self._async_waiters)
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+
+    def wait(self, seen: int, timeout: float) -> int:
+        with self._cond:
+            self._cond.wait_for(lambda: self.generation != seen, timeout)
+            return self.generation
+
+    async def await_change(self, seen: int, timeout: float) -> int:
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cond:
+            if self.generation != seen:
+                return self.generation
+            self._async_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._cond:
+                self._async_waiters.discard(waiter)
+        return self.generation
+
+
+wakeup = Wakeup()
+_listener: threading.Thread | None = None
+_listener_lock = threading.Lock()
+
+
+def announce_change() -> None:
+    """Wake live streams after a committed change (this process, and others via NOTIFY)."""
+    wakeup.notify()
+    if connection.vendor == "postgresql":
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"NOTIFY {NOTIFY_CHANNEL}")
+        except Exception as exc:  # pragma: no cover - streams fall back to polling
+            logger.warning("Could not NOTIFY %s: %s", NOTIFY_CHANNEL, exc)
+
+
+def ensure_listener() -> None:
+    """Start this process's LISTEN thread (PostgreSQL only; a no-op elsewhere)."""
+    global _listener
+    if connection.vendor != "postgresql":
+        return
+    with _listener_lock:
+        if _listener is None or not _listener.is_alive():
+            _listener = threading.Thread(target=_listen, name="live-listener", daemon=True)
+            _listener.start()
+
+
+def _listen() -> None:  # pragma: no cover - needs PostgreSQL
+    while True:
+        try:
+            connection.ensure_connection()
+            raw = connection.connection
+            raw.autocommit = True
+            with raw.cursor() as cursor:
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            while True:
+                if select.select([raw], [], [], 60)[0]:
+                    raw.poll()
+                    if raw.notifies:
+                        raw.notifies.clear()
+                        wakeup.notify()
+        except Exception as exc:
+            logger.warning("Live listener lost its connection (%s); retrying", exc)
+            connection.close()
+            time.sleep(5)
+
+
+# ---------------------------------------------------------------------------
+# The endpoint
+# ---------------------------------------------------------------------------
+
+
+def _position(request) -> tuple[datetime, uuid.UUID]:
+    """Where to resume: ``Last-Event-ID`` or ``?since=`` (a cursor, or an ISO timestamp)."""
+    raw = request.headers.get("Last-Event-ID") or request.GET.get("since") or ""
+    now = timezone.now()
+    try:
+        position = decode_token(raw)
+    except ValueError:
+        try:
+            since = parse_datetime(raw)
+        except ValueError:
+            since = None
+        if since is None:
+            return decode_token(start_token(now))
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        position = (since, MAX_ID)
+    return min(position, (now, MAX_ID))
+
+
+def _poll_once(position: tuple[datetime, uuid.UUID]):
+    feed = ChangeFeed(position)
+    retry_ms = int(settings.LIVE_POLL_SECONDS * 1000)
+    yield format_event(event_id=feed.token, retry_ms=retry_ms)
+    for change in feed.poll():
+        yield format_event(change, event="task")
+    yield format_event(event_id=feed.token)
+
+
+async def _stream(position: tuple[datetime, uuid.UUID]):
+    feed = ChangeFeed(position, eager=True)
+    deadline = time.monotonic() + settings.LIVE_STREAM_SECONDS
+    # ask the browser to come back quickly once we close at the deadline
+    yield format_event(event_id=feed.token, retry_ms=1000)
+    last_sent = time.monotonic()
+    while time.monotonic() < deadline:
+        seen = wakeup.generation
+        token = feed.token
+        changes = await sync_to_async(feed.poll)()
+        for change in changes:
+            yield format_event(change, event="task")
+        if changes or feed.token != token:
+            yield format_event(event_id=feed.token)
+            last_sent = time.monotonic()
+        elif time.monotonic() - last_sent >= KEEPALIVE_SECONDS:
+            yield ": keepalive\n\n"
+            last_sent = time.monotonic()
+        remaining = deadline - time.monotonic()
+        await wakeup.await_change(seen, max(0.0, min(settings.LIVE_POLL_SECONDS, remaining)))
+
+
+def live_view(request):
+    """Server-sent ``task`` events for tasks changed after ``?since=`` / ``Last-Event-ID``."""
+    position = _position(request)
+    if isinstance(request, ASGIRequest):
+        ensure_listener()
+        content = _stream(position)
+    else:
+        content = _poll_once(position)
+    response = StreamingHttpResponse(content, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # don't let a proxy buffer the stream
+    return response
@@ -0,0 +1,66 @@
+"""Structured logging helpers: JSON formatter, request-id propagation, lazy payloads.
+
+Wired up through ``settings.LOGGING``; ``RequestIdMiddleware`` sets the
+correlation id for the duration of each request.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Attributes every LogRecord has; anything else was passed via ``extra=``.
+_RESERVED = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id"}
+
+
+class RequestIdFilter(logging.Filter):
+    """Attach the current request's correlation id to every record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; ``extra=`` fields are emitted as top-level keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class Payload:
+    """Defer ``json.dumps`` of a log argument until a handler actually emits it.
+
+    Output is capped at ``limit`` characters (``LOG_PAYLOAD_MAX_CHARS`` by default)
+    so a large Monday response can't flood the log.
+    """
+
+    __slots__ = ("obj", "limit")
+
+    def __init__(self, obj: Any, limit: int | None = None):
+        self.obj = obj
+        self.limit = limit
+
+    def __str__(self) -> str:
+        limit = self.limit or getattr(settings, "LOG_PAYLOAD_MAX_CHARS", 1000)
+        text = self.obj if isinstance(self.obj, str) else json.dumps(self.obj, default=str)
+        if len(text) > limit:
+            return f"{text[:limit]}…(+{len(text) - limit} chars)"
+        return text
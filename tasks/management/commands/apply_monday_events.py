@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from tasks.monday_webhooks import apply_pending_events
+
+
+class Command(BaseCommand):
+    help = "Apply queued Monday.com webhook events (normally applied right after delivery; run to drain a backlog)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None, help="default: MONDAY_WEBHOOK_BATCH_SIZE")
+
+    def handle(self, *args, **options):
+        total = 0
+        while applied := apply_pending_events(options["batch_size"]):
+            total += applied
+        self.stdout.write(self.style.SUCCESS(f"Applied {total} Monday webhook event(s)."))
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tasks.expiry import POLICIES, expire_batch, overdue
+from tasks.services import push_tasks_to_monday
+
+
+class Command(BaseCommand):
+    help = "Close pending tasks whose review window (expires_at) has passed; run periodically (e.g. every 5 min)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--policy", choices=POLICIES, default=None,
+                            help="auto: approve auto_approved tasks, expire the rest; expire: expire all "
+                                 "(default: TASK_EXPIRY_POLICY)")
+        parser.add_argument("--batch-size", type=int, default=None, help="default: TASK_EXPIRY_BATCH_SIZE")
+        parser.add_argument("--max-batches", type=int, default=20, help="Stop after this many batches (0 = no limit)")
+        parser.add_argument("--no-push", action="store_true", help="Don't send auto-approved tasks to Monday.com")
+        parser.add_argument("--dry-run", action="store_true", help="Only count overdue tasks")
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            self.stdout.write(f"{overdue().count()} overdue pending task(s) (dry run, nothing changed).")
+            return
+
+        policy = options["policy"] or settings.TASK_EXPIRY_POLICY
+        batch_size = options["batch_size"] or settings.TASK_EXPIRY_BATCH_SIZE
+        approved = expired = pushed = batches = 0
+        while not options["max_batches"] or batches < options["max_batches"]:
+            result = expire_batch(policy=policy, batch_size=batch_size)
+            batches += 1
+            approved += len(result.approved)
+            expired += len(result.expired)
+            if result.approved and not options["no_push"]:
+                pushed += self._push(result.approved)
+            if len(result) < batch_size:
+                break
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Expiry sweep ({policy}): {approved} auto-approved ({pushed} sent to Monday.com), "
+            f"{expired} expired in {batches} batch(es)."
+        ))
+
+    def _push(self, task_ids) -> int:
+        pushed = push_tasks_to_monday(task_ids)
+        if pushed < len(task_ids):
+            self.stderr.write(f"{len(task_ids) - pushed} auto-approved task(s) not sent to Monday.com")
+        return pushed
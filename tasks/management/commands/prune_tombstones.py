@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tasks.changes import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = "Delete task tombstones older than TASK_TOMBSTONE_RETENTION_DAYS; run daily"
+
+    def handle(self, *args, **options):
+        deleted = prune_tombstones()
+        self.stdout.write(self.style.SUCCESS(
+            f"Pruned {deleted} tombstone(s) older than {settings.TASK_TOMBSTONE_RETENTION_DAYS} days."
+        ))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from tasks.counters import drifted_meetings, refresh_meeting_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute Meeting pending/approved/rejected counters that have drifted from their tasks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only report drifted meetings")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        drifted = list(drifted_meetings().values_list("pk", "meeting_id"))
+        for _, meeting_id in drifted[:20]:
+            self.stdout.write(f"Drifted: {meeting_id}")
+        if options["dry_run"]:
+            self.stdout.write(f"{len(drifted)} meeting(s) have drifted counters (dry run, nothing changed).")
+            return
+
+        batch_size = options["batch_size"]
+        fixed = 0
+        for start in range(0, len(drifted), batch_size):
+            fixed += refresh_meeting_counters(pk for pk, _ in drifted[start:start + batch_size])
+        self.stdout.write(self.style.SUCCESS(f"Reconciled counters for {fixed} meeting(s)."))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.monday_sync import reconcile
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-push approved tasks missing from Monday.com and diff the board against Task.monday_item_id; "
+        "cheap enough to run every few minutes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--max-pages", type=int, default=20, help="items_page requests per run")
+        parser.add_argument("--page-size", type=int, default=500, help="Items per page (Monday maximum: 500)")
+        parser.add_argument("--force-scan", action="store_true",
+                            help="Start a board scan even if MONDAY_RECONCILE_SCAN_INTERVAL_MIN hasn't elapsed")
+        parser.add_argument("--repush-missing", action="store_true",
+                            help="Recreate items deleted from the board instead of only flagging the tasks")
+
+    def handle(self, *args, **options):
+        try:
+            result = reconcile(
+                max_pages=options["max_pages"],
+                page_size=options["page_size"],
+                force_scan=options["force_scan"],
+                repush_missing=options["repush_missing"],
+            )
+        except RuntimeError as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(f"Re-pushed {result.repushed} approved task(s) without a Monday item.")
+        if result.scan_skipped:
+            self.stdout.write("Board scan not due yet.")
+        elif result.scan_complete:
+            self.stdout.write(self.style.SUCCESS(
+                f"Board scan complete: {result.seen} matched, {result.orphans} untracked item(s), "
+                f"{result.missing} task(s) missing from the board."
+            ))
+        else:
+            self.stdout.write(f"Board scan in progress: {result.pages} page(s) this run, will resume next run.")
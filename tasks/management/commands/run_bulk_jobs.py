@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from tasks.bulk_jobs import resumable, run_job
+from tasks.models import BulkJob
+
+
+class Command(BaseCommand):
+    help = "Run queued bulk admin jobs and resume ones whose worker died; run periodically (e.g. every 5 min)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--job", type=int, help="Only run this job")
+        parser.add_argument("--retry-failed", action="store_true",
+                            help="Re-queue failed jobs first; they resume from where they stopped")
+        parser.add_argument("--chunk-size", type=int, default=None, help="default: BULK_JOB_CHUNK_SIZE")
+
+    def handle(self, *args, **options):
+        if options["retry_failed"]:
+            failed = BulkJob.objects.filter(state=BulkJob.State.FAILED)
+            if options["job"]:
+                failed = failed.filter(pk=options["job"])
+            failed.update(state=BulkJob.State.QUEUED, finished_at=None)
+
+        jobs = resumable().order_by("created_at")
+        if options["job"]:
+            jobs = jobs.filter(pk=options["job"])
+        ran = 0
+        for job_id in list(jobs.values_list("pk", flat=True)):
+            job = run_job(job_id, chunk_size=options["chunk_size"])
+            if job is None:
+                continue
+            ran += 1
+            self.stdout.write(f"Job #{job.pk}: {job.get_state_display()} – {job.cursor}/{job.total} processed, "
+                              f"{job.approved} approved, {job.pushed} sent to Monday.com, {job.skipped} skipped")
+        self.stdout.write(self.style.SUCCESS(f"Ran {ran} bulk job(s)."))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from tasks.monday_emulator import MondayEmulator
+
+
+class Command(BaseCommand):
+    help = "Serve a local fake Monday.com GraphQL API (point MONDAY_API_URL at the printed URL)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+        parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+        parser.add_argument("--complexity-budget", type=int, default=10_000_000, help="Complexity points per window")
+        parser.add_argument("--budget-window", type=float, default=60.0, help="Seconds before the budget resets")
+
+    def handle(self, *args, **options):
+        emulator = MondayEmulator(
+            host=options["host"], port=options["port"], latency=options["latency"], jitter=options["jitter"],
+            error_rate=options["error_rate"], complexity_budget=options["complexity_budget"],
+            budget_window=options["budget_window"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Monday.com emulator listening on {emulator.url} (Ctrl+C to stop)"))
+        emulator.start()
+        try:
+            emulator._thread.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            emulator.stop()
+            self.stdout.write(f"Served {emulator.stats.requests} request(s), created {emulator.stats.items_created} item(s).")
@@ -7,7 +7,8 @@ from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 
-from tasks.models import Meeting, Task, AppSetting
+from tasks.models import Meeting, Task, AppSetting, TaskAssignee
+from tasks.transitions import transition
 
 logger = logging.getLogger(__name__)
 
@@ -147,8 +148,9 @@ class Command(BaseCommand):
             else:
                 self.stdout.write(f"Using existing meeting: {meeting.title}")
             
-            # Process tasks
+            # Process tasks; ones flagged approved are created pending and approved together below
             tasks = data.get('tasks', [])
+            approved_ids = []
             for task_data in tasks:
                 # Convert date string to datetime object
                 date_expected = None
@@ -166,9 +168,6 @@ class Command(BaseCommand):
                 else:
                     date_expected = timezone.now().date()
                 
-                # Determine status based on approved flag
-                status = Task.Status.APPROVED if task_data.get('approved', False) else Task.Status.PENDING
-                
                 # Create task
                 task, task_created = Task.objects.get_or_create(
                     meeting=meeting,
@@ -179,20 +178,21 @@ class Command(BaseCommand):
                         'priority': task_data.get('priority', Task.Priority.MEDIUM),
                         'brief_description': task_data.get('brief_description', ''),
                         'date_expected': date_expected,
-                        'status': status,
                         'auto_approved': task_data.get('auto_approved', False),
                         'source_payload': task_data
                     }
                 )
                 
                 if task_created:
+                    TaskAssignee.sync([task])
                     tasks_created += 1
-                    if status == Task.Status.APPROVED:
-                        task.reviewed_at = timezone.now()
-                        task.save()
+                    if task_data.get('approved', False):
+                        approved_ids.append(task.pk)
                     self.stdout.write(self.style.SUCCESS(f"Created task: {task.task_item[:50]}..."))
                 else:
                     self.stdout.write(f"Task already exists: {task.task_item[:50]}...")
+
+            transition(approved_ids, Task.Status.APPROVED, reason="Seeded as approved")
         
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Error processing {file_path}: {str(e)}"))
@@ -0,0 +1,95 @@
+"""Prometheus metrics for request latency, ingest throughput and Monday.com calls.
+
+Metrics are defined once at import time and exposed on ``/metrics`` in the
+text exposition format. When ``PROMETHEUS_MULTIPROC_DIR`` is set (see
+``gunicorn.conf.py``) every worker writes its samples to mmap'd files in that
+directory and the endpoint aggregates them, so scrapes see totals across all
+gunicorn workers rather than whichever worker happened to answer.
+"""
+from __future__ import annotations
+
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+REQUEST_LATENCY = Histogram(
+    "taskforge_http_request_duration_seconds",
+    "Time spent handling a request, per resolved view.",
+    ["view", "method", "status"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "taskforge_http_db_queries",
+    "Number of database queries issued per request.",
+    ["view"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250, 500),
+)
+
+# ---------------------------------------------------------------------------
+# INGEST
+# ---------------------------------------------------------------------------
+INGEST_TASKS = Counter(
+    "taskforge_ingest_tasks_total",
+    "Tasks processed by the n8n ingest endpoint.",
+    ["result"],  # created | updated | unchanged | auto_approved
+)
+
+# ---------------------------------------------------------------------------
+# MONDAY.COM
+# ---------------------------------------------------------------------------
+MONDAY_LATENCY = Histogram(
+    "taskforge_monday_request_duration_seconds",
+    "Latency of Monday.com GraphQL calls.",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 15),
+)
+MONDAY_ERRORS = Counter(
+    "taskforge_monday_errors_total",
+    "Failed Monday.com GraphQL calls.",
+    ["operation", "kind"],  # kind: http | graphql
+)
+MONDAY_COMPLEXITY = Histogram(
+    "taskforge_monday_query_complexity",
+    "Complexity points charged by Monday.com per call.",
+    ["operation"],
+    buckets=(100, 500, 1000, 5000, 10000, 50000, 100000, 500000),
+)
+MONDAY_COMPLEXITY_REMAINING = Gauge(
+    "taskforge_monday_complexity_remaining",
+    "Complexity budget left after the most recent Monday.com call.",
+    multiprocess_mode="mostrecent",
+)
+
+
+def _registry():
+    """Return the registry to scrape, aggregating worker files when configured."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def metrics_view(request):  # noqa: D401
+    """Expose all metrics in the Prometheus text format.
+
+    If ``METRICS_TOKEN`` is configured the scraper must send it as a bearer token.
+    """
+    token = getattr(settings, "METRICS_TOKEN", None)
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponseForbidden("forbidden")
+    return HttpResponse(generate_latest(_registry()), content_type=CONTENT_TYPE_LATEST)
@@ -1,23 +1,193 @@
 from __future__ import annotations
 
 import logging
+import re
+import time
+import uuid
+from collections import Counter
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connection
 from django.utils.deprecation import MiddlewareMixin
 from django.utils import timezone
 from django.contrib.admin.models import LogEntry, ADDITION, CHANGE, DELETION
 from django.contrib.contenttypes.models import ContentType
 from django.utils.encoding import force_str
 import json
-import re
 
 from .models import PageLog
+from . import metrics
+from .logs import request_id_var
 
 logger = logging.getLogger(__name__)
 
+# Reconnected every few seconds by each open review page; not worth a PageLog row apiece
+UNLOGGED_PREFIXES = ("/static/", "/media/", "/api/tasks/live/")
+
+
+class SyncAndAsyncMiddleware:
+    """Base for middleware that runs natively under WSGI and under ASGI.
+
+    Django hands an async ``get_response`` when serving async views over ASGI;
+    subclasses then answer through ``__acall__`` so a request never has to hop
+    to a thread just to get past the middleware stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+
+class RequestIdMiddleware(SyncAndAsyncMiddleware):
+    """Bind a correlation id to the request for log records and echo it back.
+
+    Honours an incoming ``X-Request-ID`` (e.g. from Railway's proxy or n8n) so a
+    call can be traced end to end; otherwise a fresh id is generated.
+    """
+
+    _valid = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+    def _request_id(self, request) -> str:
+        incoming = request.headers.get("X-Request-ID", "")
+        request.request_id = incoming if self._valid.match(incoming) else uuid.uuid4().hex
+        return request.request_id
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        request_id = self._request_id(request)
+        token = request_id_var.set(request_id)
+        try:
+            response = self.get_response(request)
+        finally:
+            request_id_var.reset(token)
+        response["X-Request-ID"] = request_id
+        return response
+
+    async def __acall__(self, request):
+        request_id = self._request_id(request)
+        token = request_id_var.set(request_id)
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_id_var.reset(token)
+        response["X-Request-ID"] = request_id
+        return response
+
+
+class QueryRecorder:
+    """``connection.execute_wrapper`` hook that tallies queries, DB time and SQL shapes.
+
+    SQL is recorded with its placeholders, so the same statement run with
+    different parameters (the N+1 pattern) shares one signature.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.signatures: Counter[str] = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.signatures[sql] += 1
+
+    def duplicates(self) -> list[tuple[str, int]]:
+        return [(sql, n) for sql, n in self.signatures.most_common() if n > 1]
+
+
+def _view_name(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match else "<unresolved>"
+
+
+class MetricsMiddleware(SyncAndAsyncMiddleware):
+    """Record per-view latency and DB query counts for the /metrics endpoint."""
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        view = _view_name(request)
+        metrics.REQUEST_LATENCY.labels(view, request.method, str(response.status_code)).observe(elapsed)
+        metrics.REQUEST_DB_QUERIES.labels(view).observe(recorder.count)
+        return response
+
+    async def __acall__(self, request):
+        # Latency only: an async view's queries run in sync_to_async threads that may
+        # serve other requests meanwhile, so an execute_wrapper can't attribute them.
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        metrics.REQUEST_LATENCY.labels(_view_name(request), request.method,
+                                       str(response.status_code)).observe(time.perf_counter() - start)
+        return response
+
+
+class QueryInstrumentationMiddleware:
+    """Opt-in per-request DB profiling (enable with QUERY_INSTRUMENTATION=true).
+
+    Adds a ``Server-Timing`` header with query count, DB time and duplicated
+    statements, logs the same figures, and warns when a request exceeds
+    ``settings.QUERY_BUDGET`` queries. Sync-only (it needs the request's queries
+    on one connection), so under ASGI it pushes the stack below it into a thread.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+
+        duplicates = recorder.duplicates()
+        db_ms = recorder.duration * 1000
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={db_ms:.1f};desc="{recorder.count} queries"',
+                f'db-dup;desc="{sum(n for _, n in duplicates)} duplicated"',
+            ]
+        )
+
+        budget = getattr(settings, "QUERY_BUDGET", 50)
+        summary = {
+            "view": _view_name(request),
+            "path": request.path,
+            "method": request.method,
+            "status": response.status_code,
+            "queries": recorder.count,
+            "db_ms": round(db_ms, 1),
+            "duplicates": [{"sql": sql[:200], "count": n} for sql, n in duplicates[:5]],
+        }
+        if recorder.count > budget:
+            logger.warning("Query budget exceeded (%d > %d) on %s %s", recorder.count, budget,
+                           request.method, request.path, extra={"db": summary})
+        else:
+            logger.info("DB queries for %s %s: %d", request.method, request.path, recorder.count,
+                        extra={"db": summary})
+        return response
+
 
 class RequestLoggingMiddleware(MiddlewareMixin):
     """Persist a minimal audit trail for each HTTP request."""
 
     def process_response(self, request, response):  # type: ignore[override]
+        if request.path.startswith(UNLOGGED_PREFIXES):
+            return response
         try:
             PageLog.objects.create(
                 user=request.user if hasattr(request, "user") and request.user.is_authenticated else None,
@@ -31,18 +201,24 @@ class RequestLoggingMiddleware(MiddlewareMixin):
         return response 
 
 
-class PageLogMiddleware:
+class PageLogMiddleware(SyncAndAsyncMiddleware):
     """Middleware to log all page requests to the PageLog model."""
 
-    def __init__(self, get_response):
-        self.get_response = get_response
-
     def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
         # Process the request
         response = self.get_response(request)
+        return self.log_request(request, response)
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        # request.user is a lazy DB lookup, so log from a thread
+        return await sync_to_async(self.log_request)(request, response)
 
-        # Skip static files and admin media
-        if request.path.startswith('/static/') or request.path.startswith('/media/'):
+    def log_request(self, request, response):
+        # Skip static files, admin media and the live feed
+        if request.path.startswith(UNLOGGED_PREFIXES):
             return response
 
         # Log the request
@@ -68,11 +244,11 @@ class PageLogMiddleware:
         return ip
 
 
-class AdminActionLogMiddleware:
+class AdminActionLogMiddleware(SyncAndAsyncMiddleware):
     """Middleware to log all admin actions in detail."""
 
     def __init__(self, get_response):
-        self.get_response = get_response
+        super().__init__(get_response)
         # Compile regex patterns for admin URLs
         self.admin_url_pattern = re.compile(r'^/admin/')
         self.admin_change_pattern = re.compile(r'^/admin/\w+/\w+/(.+)/change/')
@@ -80,12 +256,23 @@ class AdminActionLogMiddleware:
         self.admin_add_pattern = re.compile(r'^/admin/\w+/\w+/add/')
 
     def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
         # Store the original path for logging
         request.original_path = request.path
         
         # Process the request
         response = self.get_response(request)
-        
+        return self.after_response(request, response)
+
+    async def __acall__(self, request):
+        request.original_path = request.path
+        response = await self.get_response(request)
+        if not self.admin_url_pattern.match(request.path):
+            return response
+        return await sync_to_async(self.after_response)(request, response)
+
+    def after_response(self, request, response):
         # Only log admin actions
         if not self.admin_url_pattern.match(request.path):
             return response
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0005_alter_task_options_meeting_execution_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='meeting',
+            name='date',
+            field=models.DateTimeField(db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='meeting',
+            name='execution_id',
+            field=models.CharField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.AlterField(
+            model_name='meeting',
+            name='organizer_email',
+            field=models.EmailField(db_index=True, max_length=254),
+        ),
+    ]
@@ -0,0 +1,29 @@
+"""Full-text search index for tasks (Postgres tsvector + GIN, SQLite FTS5).
+
+The search column/table lives outside the ORM state; see tasks/search.py.
+"""
+
+from django.db import migrations
+
+
+def install(apps, schema_editor):
+    from tasks import search
+
+    search.install(schema_editor.connection)
+
+
+def uninstall(apps, schema_editor):
+    from tasks import search
+
+    search.uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0006_meeting_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
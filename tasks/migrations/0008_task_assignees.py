@@ -0,0 +1,69 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def _parse(names, emails):
+    # Frozen copy of TaskAssignee.parse – migrations must not depend on model code
+    name_list = [n.strip() for n in (names or "").split(",") if n.strip()]
+    email_list = [e.strip().lower() for e in (emails or "").split(",") if e.strip()]
+    size = max(len(name_list), len(email_list))
+    name_list += [""] * (size - len(name_list))
+    email_list += [""] * (size - len(email_list))
+    return zip(name_list, email_list)
+
+
+def backfill_assignees(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    TaskAssignee = apps.get_model("tasks", "TaskAssignee")
+    batch = []
+    rows = Task.objects.values_list("id", "assignee_names", "assignee_emails").order_by()
+    for task_id, names, emails in rows.iterator(chunk_size=2000):
+        batch.extend(TaskAssignee(task_id=task_id, name=n[:255], email=e[:254]) for n, e in _parse(names, emails))
+        if len(batch) >= 2000:
+            TaskAssignee.objects.bulk_create(batch)
+            batch = []
+    TaskAssignee.objects.bulk_create(batch)
+
+
+def add_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # On UPPER(name), the expression both name__icontains and the trigram lookup in
+    # TaskAssignee.matching compare. Email prefix lookups use the email column's _like index.
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS taskassignee_name_trgm ON tasks_taskassignee USING gin (UPPER(name) gin_trgm_ops)"
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS taskassignee_name_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_task_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskAssignee',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(blank=True, db_index=True, max_length=255)),
+                ('email', models.CharField(blank=True, db_index=True, max_length=254)),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignees', to='tasks.task')),
+            ],
+            options={
+                'ordering': ['task', 'id'],
+                'indexes': [models.Index(fields=['email', 'task'], name='taskassignee_email_task_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_assignees, migrations.RunPython.noop),
+        migrations.RunPython(add_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0008_task_assignees'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pagelog',
+            index=models.Index(fields=['-timestamp'], name='pagelog_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewaction',
+            index=models.Index(fields=['-timestamp'], name='reviewaction_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewaction',
+            index=models.Index(fields=['task', '-timestamp'], name='reviewaction_task_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['meeting', 'status', '-created_at'], name='task_meeting_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['meeting', 'task_item', '-created_at'], name='task_meeting_item_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:07
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_meeting_date(apps, schema_editor):
+    Meeting = apps.get_model("tasks", "Meeting")
+    Task = apps.get_model("tasks", "Task")
+    Task.objects.using(schema_editor.connection.alias).update(
+        meeting_date=Subquery(Meeting.objects.filter(pk=OuterRef("meeting_id")).values("date")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0009_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='task',
+            options={'ordering': ['-meeting_date', '-created_at']},
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='meeting_date',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_meeting_date, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['-meeting_date', '-created_at'], name='task_mdate_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', '-meeting_date', '-created_at'], name='task_status_mdate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['-meeting_date', '-created_at'], name='task_pending_mdate_idx'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:10
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from tasks import search
+
+
+def drop_search_triggers(apps, schema_editor):
+    search.drop_sqlite_triggers(schema_editor.connection)
+
+
+def restore_search_triggers(apps, schema_editor):
+    search.ensure_sqlite_triggers(schema_editor.connection)
+
+
+def backfill_counters(apps, schema_editor):
+    Meeting = apps.get_model("tasks", "Meeting")
+    Task = apps.get_model("tasks", "Task")
+
+    def count(status):
+        rows = (
+            Task.objects.filter(meeting=OuterRef("pk"), status=status)
+            .order_by().values("meeting").annotate(n=Count("pk")).values("n")
+        )
+        return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+    Meeting.objects.using(schema_editor.connection.alias).update(
+        pending_count=count("pending"), approved_count=count("approved"), rejected_count=count("rejected")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_task_meeting_date'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_search_triggers, restore_search_triggers),
+        migrations.AddField(
+            model_name='meeting',
+            name='approved_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='pending_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='meeting',
+            name='rejected_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+        migrations.RunPython(restore_search_triggers, drop_search_triggers),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:14
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import F
+from django.utils import timezone
+
+
+def backfill_expires_at(apps, schema_editor):
+    Task = apps.get_model("tasks", "Task")
+    tasks = Task.objects.using(schema_editor.connection.alias)
+    now = timezone.now()
+    # One UPDATE per distinct window keeps the interval arithmetic backend-neutral
+    for hours in tasks.order_by().values_list("expires_after_h", flat=True).distinct():
+        window = tasks.filter(expires_after_h=hours)
+        # Pending tasks get a full window from deploy time; stamping created_at + hours
+        # would expire every old one at once on the first sweep
+        window.filter(status="pending").update(expires_at=now + timedelta(hours=hours))
+        window.exclude(status="pending").update(expires_at=F("created_at") + timedelta(hours=hours))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0012_task_stats_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_expires_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='reviewaction',
+            name='action',
+            field=models.CharField(choices=[('approve', 'Approve'), ('reject', 'Reject'), ('edit', 'Edit'), ('expire', 'Expire')], max_length=7),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('expired', 'Expired')], default='pending', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['expires_at'], name='task_pending_expires_idx'),
+        ),
+    ]
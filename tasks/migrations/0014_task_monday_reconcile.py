@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:18
+
+from django.db import migrations, models
+
+from tasks import search
+
+
+def drop_search_triggers(apps, schema_editor):
+    search.drop_sqlite_triggers(schema_editor.connection)
+
+
+def restore_search_triggers(apps, schema_editor):
+    search.ensure_sqlite_triggers(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0013_task_expires_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_search_triggers, restore_search_triggers),
+        migrations.AddField(
+            model_name='task',
+            name='monday_seen_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='monday_item_id',
+            field=models.CharField(blank=True, db_index=True, max_length=255, null=True),
+        ),
+        migrations.RunPython(restore_search_triggers, drop_search_triggers),
+    ]
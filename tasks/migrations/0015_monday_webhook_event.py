@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:19
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0014_task_monday_reconcile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MondayWebhookEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('trigger_uuid', models.CharField(blank=True, max_length=64, null=True, unique=True)),
+                ('event_type', models.CharField(max_length=64)),
+                ('item_id', models.CharField(db_index=True, max_length=255)),
+                ('payload', models.JSONField()),
+                ('received_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+            ],
+            options={
+                'ordering': ['received_at', 'id'],
+                'indexes': [models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['received_at', 'id'], name='mondayevent_unprocessed_idx')],
+            },
+        ),
+    ]
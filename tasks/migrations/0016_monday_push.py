@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:24
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0015_monday_webhook_event'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MondayPush',
+            fields=[
+                ('task', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='monday_push', serialize=False, to='tasks.task')),
+                ('state', models.CharField(choices=[('pending', 'Pending'), ('in_flight', 'In flight'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('item_id', models.CharField(blank=True, max_length=255)),
+                ('last_error', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
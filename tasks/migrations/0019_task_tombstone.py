@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:56
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0018_task_updated_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskTombstone',
+            fields=[
+                ('task_id', models.UUIDField(primary_key=True, serialize=False)),
+                ('meeting_id', models.UUIDField(blank=True, null=True)),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['deleted_at'],
+                'indexes': [models.Index(fields=['deleted_at', 'task_id'], name='tasktombstone_deleted_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+"""Re-index task search with one text-search config (see ``search.POSTGRES_CONFIG``).
+
+PostgreSQL only: replaces the trigger function and rebuilds every row's
+``search_vector``. SQLite's FTS5 table already stems both sides.
+"""
+
+from django.db import migrations
+
+
+def reinstall(apps, schema_editor):
+    from tasks import search
+
+    if schema_editor.connection.vendor == "postgresql":
+        search.install(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0019_task_tombstone'),
+    ]
+
+    operations = [
+        migrations.RunPython(reinstall, migrations.RunPython.noop),
+    ]
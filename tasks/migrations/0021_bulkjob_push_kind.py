@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0020_search_single_config'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bulkjob',
+            name='kind',
+            field=models.CharField(choices=[('approve', 'Approve & send to Monday'), ('push', 'Send to Monday')], max_length=16),
+        ),
+    ]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import uuid
+from datetime import timedelta
 from django.conf import settings
-from django.db import models
+from django.db import connection, models
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.contrib.postgres.fields import JSONField  # Postgres backend extra
+from django.contrib.postgres.lookups import TrigramSimilar
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password, check_password
 
@@ -15,11 +18,16 @@ class Meeting(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     meeting_id = models.CharField(max_length=255, unique=True)
     title = models.CharField(max_length=512)
-    organizer_email = models.EmailField()
-    date = models.DateTimeField()
-    execution_id = models.CharField(max_length=255, blank=True, null=True)
+    organizer_email = models.EmailField(db_index=True)
+    date = models.DateTimeField(db_index=True)
+    execution_id = models.CharField(max_length=255, blank=True, null=True, db_index=True)
     generated_at = models.DateTimeField(blank=True, null=True)
 
+    # Task counts by status, maintained by tasks.counters (see reconcile_meeting_counters)
+    pending_count = models.PositiveIntegerField(default=0, editable=False)
+    approved_count = models.PositiveIntegerField(default=0, editable=False)
+    rejected_count = models.PositiveIntegerField(default=0, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -51,6 +59,7 @@ class Task(models.Model):
         PENDING = "pending", "Pending"
         APPROVED = "approved", "Approved"
         REJECTED = "rejected", "Rejected"
+        EXPIRED = "expired", "Expired"
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     meeting = models.ForeignKey(Meeting, on_delete=models.CASCADE, related_name="tasks")
@@ -63,23 +72,137 @@ class Task(models.Model):
     date_expected = models.DateField()
 
     status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
-    monday_item_id = models.CharField(max_length=255, blank=True, null=True)
+    monday_item_id = models.CharField(max_length=255, blank=True, null=True, db_index=True)
     source_payload = models.JSONField(blank=True, null=True)
     auto_approved = models.BooleanField(default=False)
     posted_to_monday = models.BooleanField(default=False)
+    # Last time reconcile_monday found this task's item on the board
+    monday_seen_at = models.DateTimeField(null=True, blank=True, editable=False)
     reviewed_at = models.DateTimeField(null=True, blank=True)
     rejected_reason = models.TextField(blank=True)
     expires_after_h = models.PositiveSmallIntegerField(default=24, help_text="Hours after creation during which the task is publicly visible for review.")
+    # created_at + expires_after_h, stamped on first save and whenever the window changes; the expire_tasks command sweeps past it
+    expires_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # Copy of meeting.date so list ordering needs no join; kept in sync by
+    # Task.save() and the Meeting post_save handler in tasks.signals.
+    meeting_date = models.DateTimeField(null=True, blank=True, editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ["-meeting__date", "-created_at"]
+        ordering = ["-meeting_date", "-created_at"]
+        indexes = [
+            # Default ordering, with and without a status filter
+            models.Index(fields=["-meeting_date", "-created_at"], name="task_mdate_created_idx"),
+            models.Index(fields=["status", "-meeting_date", "-created_at"], name="task_status_mdate_idx"),
+            # Reviewer queue: the pending slice is small and read constantly
+            models.Index(fields=["-meeting_date", "-created_at"], condition=models.Q(status="pending"),
+                         name="task_pending_mdate_idx"),
+            # A meeting's tasks by status, newest first: the nested loop under the
+            # -meeting__date ordering, and the per-meeting counters
+            models.Index(fields=["meeting", "status", "-created_at"], name="task_meeting_status_idx"),
+            # Ingest de-duplication lookup (newest duplicate first)
+            models.Index(fields=["meeting", "task_item", "-created_at"], name="task_meeting_item_idx"),
+            # Public review list and the expire_tasks sweep
+            models.Index(fields=["expires_at"], condition=models.Q(status="pending"), name="task_pending_expires_idx"),
+            # /api/stats/ day ranges
+            models.Index(fields=["created_at"], name="task_created_idx"),
+            models.Index(fields=["reviewed_at"], name="task_reviewed_idx"),
+            # Live review feed (tasks.live) polls for rows changed since a cursor
+            models.Index(fields=["updated_at", "id"], name="task_updated_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover
         return f"{self.task_item[:50]}… ({self.get_status_display()})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # What the meeting counters currently count this row as (see tasks.signals)
+        instance._counted_as = (instance.__dict__.get("meeting_id"), instance.__dict__.get("status"))
+        instance._loaded_expires_after_h = instance.__dict__.get("expires_after_h")
+        return instance
+
+    def save(self, *args, **kwargs):
+        if self.meeting_id and kwargs.get("update_fields") is None:
+            meeting_field = self._meta.get_field("meeting")
+            if meeting_field.is_cached(self) and self.meeting.pk == self.meeting_id:
+                self.meeting_date = self.meeting.date
+            elif self.meeting_date is None:
+                self.meeting_date = Meeting.objects.values_list("date", flat=True).get(pk=self.meeting_id)
+        update_fields = kwargs.get("update_fields")
+        window_changed = self.expires_after_h != getattr(self, "_loaded_expires_after_h", self.expires_after_h)
+        if window_changed or (self.expires_at is None and update_fields is None):
+            self.expires_at = (self.created_at or timezone.now()) + timedelta(hours=self.expires_after_h)
+            if update_fields is not None and "expires_after_h" in update_fields:
+                kwargs["update_fields"] = {*update_fields, "expires_at"}
+        super().save(*args, **kwargs)
+        self._loaded_expires_after_h = self.expires_after_h
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at <= timezone.now()
+
+
+class TaskAssignee(models.Model):
+    """One row per person on a task, normalised from the comma-joined assignee fields.
+
+    ``Task.assignee_names``/``assignee_emails`` stay the source of truth (they
+    are what n8n sends and what Monday.com receives); rows here are rebuilt by
+    ``TaskAssignee.sync`` whenever those fields are written.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="assignees")
+    name = models.CharField(max_length=255, blank=True, db_index=True)
+    email = models.CharField(max_length=254, blank=True, db_index=True)  # stored lower-cased
+
+    class Meta:
+        ordering = ["task", "id"]
+        indexes = [models.Index(fields=["email", "task"], name="taskassignee_email_task_idx")]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return self.email or self.name
+
+    @staticmethod
+    def parse(names: str, emails: str) -> list[tuple[str, str]]:
+        """Pair up ``"A, B"`` / ``"a@x, b@x"`` by position, tolerating uneven lists."""
+        name_list = [n.strip() for n in (names or "").split(",") if n.strip()]
+        email_list = [e.strip().lower() for e in (emails or "").split(",") if e.strip()]
+        size = max(len(name_list), len(email_list))
+        name_list += [""] * (size - len(name_list))
+        email_list += [""] * (size - len(email_list))
+        return list(zip(name_list, email_list))
+
+    @staticmethod
+    def matching(value: str) -> models.Q:
+        """Rows for ``value``: an email prefix if it contains ``@``, otherwise a name.
+
+        Names match by substring and, on PostgreSQL, by trigram similarity, so
+        "Jon Smth" still finds "John Smith". Both compare ``UPPER(name)``, the
+        expression ``taskassignee_name_trgm`` indexes.
+        """
+        if "@" in value:
+            return models.Q(email__startswith=value.lower())
+        match = models.Q(name__icontains=value)
+        if connection.vendor == "postgresql":
+            match |= models.Q(TrigramSimilar(Upper("name"), value.upper()))
+        return match
+
+    @classmethod
+    def sync(cls, tasks) -> None:
+        """Rebuild assignee rows for ``tasks`` with one delete and one bulk insert."""
+        tasks = list(tasks)
+        if not tasks:
+            return
+        cls.objects.filter(task__in=[t.pk for t in tasks]).delete()
+        cls.objects.bulk_create(
+            cls(task_id=task.pk, name=name[:255], email=email[:254])
+            for task in tasks
+            for name, email in cls.parse(task.assignee_names, task.assignee_emails)
+        )
+
 
 class ReviewAction(models.Model):
     """Audit trail of user approvals, rejections, or edits."""
@@ -88,6 +211,7 @@ class ReviewAction(models.Model):
         APPROVE = "approve", "Approve"
         REJECT = "reject", "Reject"
         EDIT = "edit", "Edit"
+        EXPIRE = "expire", "Expire"
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="reviews")
@@ -98,6 +222,10 @@ class ReviewAction(models.Model):
 
     class Meta:
         ordering = ["-timestamp"]
+        indexes = [
+            models.Index(fields=["-timestamp"], name="reviewaction_ts_idx"),
+            models.Index(fields=["task", "-timestamp"], name="reviewaction_task_ts_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover
         return f"{self.get_action_display()} by {self.user or 'anonymous'} on {self.task_id}"
@@ -116,11 +244,131 @@ class PageLog(models.Model):
 
     class Meta:
         ordering = ["-timestamp"]
+        indexes = [models.Index(fields=["-timestamp"], name="pagelog_ts_idx")]
 
     def __str__(self) -> str:  # pragma: no cover
         return f"{self.method} {self.path} ({self.status_code})"
 
 
+class MondayPush(models.Model):
+    """Idempotency record for a task's Monday.com item (see ``services.push_task_to_monday``).
+
+    A push is claimed before ``create_item`` is called, so concurrent or retried
+    approvals of the same task can't create a second board item.
+    """
+
+    class State(models.TextChoices):
+        PENDING = "pending", "Pending"
+        IN_FLIGHT = "in_flight", "In flight"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    task = models.OneToOneField(Task, on_delete=models.CASCADE, primary_key=True, related_name="monday_push")
+    state = models.CharField(max_length=10, choices=State.choices, default=State.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    item_id = models.CharField(max_length=255, blank=True)
+    last_error = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.task_id}: {self.get_state_display()}"
+
+
+class MondayWebhookEvent(models.Model):
+    """Inbound Monday.com webhook event, queued until ``tasks.monday_webhooks`` applies it."""
+
+    id = models.BigAutoField(primary_key=True)
+    # Monday's triggerUuid; retried deliveries carry the same one
+    trigger_uuid = models.CharField(max_length=64, unique=True, null=True, blank=True)
+    event_type = models.CharField(max_length=64)
+    item_id = models.CharField(max_length=255, db_index=True)
+    payload = models.JSONField()
+    received_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ["received_at", "id"]
+        indexes = [
+            models.Index(fields=["received_at", "id"], condition=models.Q(processed_at__isnull=True),
+                         name="mondayevent_unprocessed_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.event_type} on item {self.item_id}"
+
+
+class BulkJob(models.Model):
+    """A bulk admin action run in the background in chunks (see ``tasks.bulk_jobs``).
+
+    ``cursor`` indexes into ``task_ids`` and only advances once a chunk has been
+    committed, so a job interrupted by a crash or deploy resumes where it stopped.
+    """
+
+    class Kind(models.TextChoices):
+        APPROVE = "approve", "Approve & send to Monday"
+        PUSH = "push", "Send to Monday"
+
+    class State(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    id = models.BigAutoField(primary_key=True)
+    kind = models.CharField(max_length=16, choices=Kind.choices)
+    state = models.CharField(max_length=10, choices=State.choices, default=State.QUEUED)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    task_ids = models.JSONField(default=list)
+    cursor = models.PositiveIntegerField(default=0)
+    approved = models.PositiveIntegerField(default=0)
+    pushed = models.PositiveIntegerField(default=0)
+    skipped = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["state", "heartbeat_at"], condition=models.Q(state__in=["queued", "running"]),
+                         name="bulkjob_active_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.get_kind_display()} #{self.pk} ({self.get_state_display()})"
+
+    @property
+    def total(self) -> int:
+        return len(self.task_ids)
+
+    @property
+    def percent(self) -> int:
+        return 100 if not self.total else int(100 * self.cursor / self.total)
+
+
+class TaskTombstone(models.Model):
+    """Marker left behind by a deleted task, so ``/api/tasks/changes/`` can report deletes.
+
+    Written by a ``post_delete`` handler; ``prune_tombstones`` drops markers older
+    than ``TASK_TOMBSTONE_RETENTION_DAYS``.
+    """
+
+    task_id = models.UUIDField(primary_key=True)
+    meeting_id = models.UUIDField(null=True, blank=True)
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["deleted_at"]
+        indexes = [models.Index(fields=["deleted_at", "task_id"], name="tasktombstone_deleted_idx")]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.task_id} (deleted {self.deleted_at:%Y-%m-%d %H:%M})"
+
+
 class AppSetting(models.Model):
     """Key→value table for runtime–editable settings (edited via Django admin).
 
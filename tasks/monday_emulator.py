@@ -0,0 +1,232 @@
+"""A local stand-in for the Monday.com GraphQL API.
+
+Serves the handful of operations TaskForge sends – ``create_item`` (aliased
+batches included), ``boards { items_page }``, ``next_items_page``,
+``items_page_by_column_values``, ``me`` and ``complexity`` – from an in-memory board, with configurable latency, random
+failures and a complexity budget. Point ``MONDAY_API_URL`` at ``emulator.url``
+to exercise the real HTTP client code without the network::
+
+    with MondayEmulator(latency=0.05, error_rate=0.1) as emulator:
+        with override_settings(MONDAY_API_URL=emulator.url):
+            ...
+
+or run it standalone with ``manage.py run_monday_emulator``.
+
+It matches the request shapes built in ``tasks.services``; it is not a general
+GraphQL implementation.
+"""
+from __future__ import annotations
+
+import base64
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+_CREATE_ITEM = re.compile(r"(?:(\w+)\s*:\s*)?create_item\s*\(([^)]*)\)")
+_ARG = re.compile(r"(\w+)\s*:\s*(\$\w+|\"[^\"]*\"|[\w.-]+)")
+
+
+@dataclass
+class EmulatorStats:
+    requests: int = 0
+    items_created: int = 0
+    failures: int = 0
+    complexity_rejections: int = 0
+    max_concurrency: int = 0
+    _active: int = field(default=0, repr=False)
+
+
+class MondayEmulator:
+    """Threaded fake Monday.com API server; usable as a context manager."""
+
+    def __init__(self, *, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, complexity_budget: int = 10_000_000, budget_window: float = 60.0,
+                 create_item_cost: int = 30_000, page_item_cost: int = 100, seed: int | None = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.complexity_budget = complexity_budget
+        self.budget_window = budget_window
+        self.create_item_cost = create_item_cost
+        self.page_item_cost = page_item_cost
+        self.items: dict[str, list[dict[str, Any]]] = {}  # board id → items
+        self.stats = EmulatorStats()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next_id = 1_000_000
+        self._budget_used = 0
+        self._window_start = time.monotonic()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    # -- lifecycle ------------------------------------------------------------------
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v2"
+
+    def start(self) -> "MondayEmulator":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="monday-emulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "MondayEmulator":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # -- board state ------------------------------------------------------------------
+    def add_item(self, board_id: str, name: str, column_values: dict | None = None) -> str:
+        with self._lock:
+            self._next_id += 1
+            item = {"id": str(self._next_id), "name": name, "column_values": column_values or {}}
+            self.items.setdefault(str(board_id), []).append(item)
+            return item["id"]
+
+    def delete_item(self, item_id: str) -> None:
+        with self._lock:
+            for items in self.items.values():
+                items[:] = [item for item in items if item["id"] != str(item_id)]
+
+    # -- request handling -------------------------------------------------------------
+    def _charge(self, cost: int) -> tuple[bool, int]:
+        """Spend ``cost`` from the rolling budget; returns (allowed, remaining)."""
+        with self._lock:
+            if time.monotonic() - self._window_start >= self.budget_window:
+                self._window_start, self._budget_used = time.monotonic(), 0
+            if self._budget_used + cost > self.complexity_budget:
+                return False, self.complexity_budget - self._budget_used
+            self._budget_used += cost
+            return True, self.complexity_budget - self._budget_used
+
+    @staticmethod
+    def _resolve(raw: str, variables: dict[str, Any]) -> Any:
+        if raw.startswith("$"):
+            return variables.get(raw[1:])
+        return raw.strip('"')
+
+    @staticmethod
+    def _cursor(board_id: str, offset: int) -> str:
+        return base64.urlsafe_b64encode(json.dumps([board_id, offset]).encode()).decode()
+
+    def _page(self, board_id: str, offset: int, limit: int) -> dict[str, Any]:
+        with self._lock:
+            items = self.items.get(str(board_id), [])
+            page = [{"id": item["id"], "name": item["name"]} for item in items[offset:offset + limit]]
+            more = offset + limit < len(items)
+        return {"cursor": self._cursor(board_id, offset + limit) if more else None, "items": page}
+
+    def execute(self, query: str, variables: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        """Run one GraphQL document; returns (HTTP status, JSON body)."""
+        data: dict[str, Any] = {}
+        creates = _CREATE_ITEM.findall(query)
+        cost = len(creates) * self.create_item_cost
+
+        limit_match = re.search(r"limit\s*:\s*(\$\w+|\d+)", query)
+        limit = int(self._resolve(limit_match.group(1), variables) or 25) if limit_match else 25
+        if "items_page" in query:
+            cost += min(limit, 500) * self.page_item_cost
+
+        allowed, remaining = self._charge(cost)
+        if not allowed:
+            with self._lock:
+                self.stats.complexity_rejections += 1
+            return 200, {
+                "errors": [{
+                    "message": f"Complexity budget exhausted, query cost {cost} budget remaining {remaining} "
+                               f"out of {self.complexity_budget}",
+                    "extensions": {"code": "ComplexityException"},
+                }],
+                "error_code": "ComplexityException",
+            }
+
+        for alias, raw_args in creates:
+            args = {name: self._resolve(value, variables) for name, value in _ARG.findall(raw_args)}
+            columns = args.get("column_values") or "{}"
+            item_id = self.add_item(args.get("board_id"), args.get("item_name") or "",
+                                    json.loads(columns) if isinstance(columns, str) else columns)
+            data[alias or "create_item"] = {"id": item_id}
+            with self._lock:
+                self.stats.items_created += 1
+
+        if "items_page_by_column_values" in query:
+            board_match = re.search(r"board_id\s*:\s*(\$\w+|\"[^\"]*\"|\d+)", query)
+            column_match = re.search(r"column_id\s*:\s*(\$\w+|\"[^\"]*\")", query)
+            value_match = re.search(r"column_values\s*:\s*\[\s*(\$\w+|\"[^\"]*\")", query)
+            board_id, column, value = (self._resolve(m.group(1), variables) if m else None
+                                       for m in (board_match, column_match, value_match))
+            with self._lock:
+                matches = [{"id": item["id"], "name": item["name"]}
+                           for item in self.items.get(str(board_id), [])
+                           if str(item["column_values"].get(column)) == str(value)]
+            data["items_page_by_column_values"] = {"cursor": None, "items": matches[:limit]}
+        elif "next_items_page" in query:
+            cursor_match = re.search(r"cursor\s*:\s*(\$\w+|\"[^\"]*\")", query)
+            cursor = self._resolve(cursor_match.group(1), variables) if cursor_match else None
+            try:
+                board_id, offset = json.loads(base64.urlsafe_b64decode(cursor))
+            except (TypeError, ValueError):
+                return 200, {"errors": [{"message": "CursorException: cursor is invalid or expired"}]}
+            data["next_items_page"] = self._page(board_id, offset, limit)
+        elif "items_page" in query:
+            ids_match = re.search(r"boards\s*\(\s*ids\s*:\s*(\$\w+|\[[^\]]*\]|\d+)", query)
+            ids = self._resolve(ids_match.group(1), variables) if ids_match else []
+            ids = ids if isinstance(ids, list) else re.findall(r"\d+", str(ids))
+            data["boards"] = [{"items_page": self._page(str(board_id), 0, limit)} for board_id in ids]
+
+        if re.search(r"\bme\s*\{", query):
+            data["me"] = {"id": "1", "name": "Emulator", "email": "emulator@example.com"}
+        if "complexity" in query:
+            data["complexity"] = {"before": remaining + cost, "query": cost, "after": remaining}
+        return 200, {"data": data, "account_id": 1}
+
+    def _handler_class(self):
+        emulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):  # keep test output quiet
+                pass
+
+            def _reply(self, status: int, body: dict[str, Any]) -> None:
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                with emulator._lock:
+                    emulator.stats.requests += 1
+                    emulator.stats._active += 1
+                    emulator.stats.max_concurrency = max(emulator.stats.max_concurrency, emulator.stats._active)
+                try:
+                    body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+                    if emulator.latency or emulator.jitter:
+                        time.sleep(emulator.latency + emulator._random.uniform(0, emulator.jitter))
+                    if not self.headers.get("Authorization"):
+                        return self._reply(401, {"errors": [{"message": "Not Authenticated"}]})
+                    if emulator._random.random() < emulator.error_rate:
+                        with emulator._lock:
+                            emulator.stats.failures += 1
+                        return self._reply(500, {"error_message": "Internal server error", "status_code": 500})
+                    status, response = emulator.execute(body.get("query", ""), body.get("variables") or {})
+                    self._reply(status, response)
+                finally:
+                    with emulator._lock:
+                        emulator.stats._active -= 1
+
+        return Handler
@@ -0,0 +1,140 @@
+"""Reconciling tasks with the Monday.com board (``manage.py reconcile_monday``).
+
+Two passes per run:
+
+* **Re-push** – approved tasks without a Monday item (their ``create_item``
+  failed) are pushed again in one batch.
+* **Board scan** – ``items_page``/``next_items_page`` are walked with cursors, a
+  bounded number of pages per run. Each page is indexed by item id and diffed
+  against ``Task.monday_item_id`` in bulk: matching tasks get ``monday_seen_at``
+  stamped, unknown items are counted as orphans. When the last page is reached,
+  every task whose item was not seen since the scan started is flagged
+  (``posted_to_monday=False``) or, with ``repush_missing``, recreated.
+
+Scan progress lives in the ``MONDAY_RECONCILE_STATE`` AppSetting, so a large
+board is covered over several cheap runs, and a new scan starts at most every
+``MONDAY_RECONCILE_SCAN_INTERVAL_MIN`` minutes.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import AppSetting, MondayPush, Task
+from .services import fetch_items_page, push_tasks_to_monday
+
+logger = logging.getLogger(__name__)
+
+STATE_KEY = "MONDAY_RECONCILE_STATE"
+# Monday cursors expire after 60 minutes; restart a scan rather than resume with a dead cursor
+CURSOR_TTL = timedelta(minutes=55)
+
+
+@dataclass
+class ReconcileResult:
+    repushed: int = 0
+    pages: int = 0
+    seen: int = 0
+    orphans: int = 0
+    missing: int = 0
+    scan_complete: bool = False
+    scan_skipped: bool = False
+
+
+def _load_state() -> dict:
+    try:
+        return json.loads(AppSetting.get(STATE_KEY) or "{}")
+    except ValueError:
+        return {}
+
+
+def _save_state(state: dict) -> None:
+    AppSetting.objects.update_or_create(key=STATE_KEY, defaults={"value": json.dumps(state)})
+
+
+def _when(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def repush_unposted(limit: int = 500) -> int:
+    """Retry approved tasks that never got a Monday item."""
+    ids = list(
+        Task.objects.filter(status=Task.Status.APPROVED, monday_item_id__isnull=True)
+        .order_by("reviewed_at")
+        .values_list("pk", flat=True)[:limit]
+    )
+    return push_tasks_to_monday(ids) if ids else 0
+
+
+def _missing_since(started: datetime):
+    """Tasks with an item id that the scan beginning at ``started`` never saw."""
+    return (
+        Task.objects.filter(monday_item_id__isnull=False)
+        .filter(Q(monday_seen_at__lt=started) | Q(monday_seen_at__isnull=True))
+        # pushed while the scan was running: their item may sit on an already-scanned page
+        .exclude(reviewed_at__gte=started)
+    )
+
+
+def reconcile(*, max_pages: int = 20, page_size: int = 500, force_scan: bool = False,
+              repush_missing: bool = False, now: datetime | None = None) -> ReconcileResult:
+    now = now or timezone.now()
+    result = ReconcileResult(repushed=repush_unposted())
+
+    state = _load_state()
+    cursor = state.get("cursor")
+    if cursor and now - _when(state["saved_at"]) > CURSOR_TTL:
+        logger.warning("Monday reconcile cursor expired; restarting board scan")
+        cursor = None
+    if not cursor:
+        last = _when(state.get("last_completed"))
+        interval = timedelta(minutes=settings.MONDAY_RECONCILE_SCAN_INTERVAL_MIN)
+        if last and now - last < interval and not force_scan:
+            result.scan_skipped = True
+            return result
+        state = {"started_at": now.isoformat(), "last_completed": state.get("last_completed")}
+
+    while result.pages < max_pages:
+        items, cursor = fetch_items_page(cursor=cursor, limit=page_size)
+        result.pages += 1
+        index = {str(item["id"]): item for item in items}
+        known = set(Task.objects.filter(monday_item_id__in=index).values_list("monday_item_id", flat=True))
+        if known:
+            Task.objects.filter(monday_item_id__in=known).update(monday_seen_at=now)
+            # only a flag that actually flips counts as a change for /api/tasks/changes/; stamped
+            # at write time, since pushes and earlier pages may have taken well past ``now``
+            Task.objects.filter(monday_item_id__in=known, posted_to_monday=False).update(
+                posted_to_monday=True, updated_at=timezone.now()
+            )
+        result.seen += len(known)
+        result.orphans += len(index) - len(known)
+        if not cursor:
+            break
+
+    if cursor:
+        _save_state({**state, "cursor": cursor, "saved_at": now.isoformat()})
+        return result
+
+    missing = _missing_since(_when(state["started_at"]))
+    missing_ids = list(missing.values_list("pk", flat=True))
+    result.missing = len(missing_ids)
+    if missing_ids:
+        logger.warning("%d task(s) have Monday items that are no longer on the board", len(missing_ids))
+        flagged = Task.objects.filter(pk__in=missing_ids)
+        if repush_missing:
+            flagged.update(monday_item_id=None, posted_to_monday=False, updated_at=timezone.now())
+            # the old push records point at the deleted items; start fresh
+            MondayPush.objects.filter(task_id__in=missing_ids).delete()
+            push_tasks_to_monday(missing_ids)
+        else:
+            # already-flagged rows stay untouched, so repeat scans don't re-announce them on /changes/
+            flagged.filter(posted_to_monday=True).update(posted_to_monday=False, updated_at=timezone.now())
+    result.scan_complete = True
+    _save_state({"last_completed": now.isoformat()})
+    return result
@@ -0,0 +1,138 @@
+"""Inbound Monday.com webhooks: signature check, queueing and batched apply.
+
+``MondayWebhookView`` stores each delivery as a ``MondayWebhookEvent`` and
+returns straight away; ``apply_pending_events`` then drains the queue in
+batches, one transaction per batch. Within a batch the last status per item
+wins, tasks are found with one ``monday_item_id__in`` lookup, and each target
+status is applied with one ``transitions.transition`` call.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import time
+from typing import Any
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import MondayWebhookEvent, Task
+from .services import MONDAY_STATUS_LABELS, _column_map
+from .transitions import transition
+
+logger = logging.getLogger(__name__)
+
+STATUS_EVENTS = {"update_column_value", "change_column_value", "change_status_column_value"}
+DELETE_EVENTS = {"delete_pulse", "archive_pulse", "item_deleted", "item_archived"}
+
+_STATUS_FOR_LABEL = {label.lower(): status for status, label in MONDAY_STATUS_LABELS.items()}
+
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def verify_signature(authorization: str, secret: str) -> bool:
+    """Check the HS256 JWT Monday puts in the ``Authorization`` header of signed webhooks."""
+    token = authorization.removeprefix("Bearer ").strip()
+    try:
+        header_b64, claims_b64, signature_b64 = token.split(".")
+        expected = hmac.new(secret.encode(), f"{header_b64}.{claims_b64}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64decode(signature_b64)):
+            return False
+        header = json.loads(_b64decode(header_b64))
+        claims = json.loads(_b64decode(claims_b64))
+    except (ValueError, TypeError):
+        return False
+    if header.get("alg") != "HS256":
+        return False
+    return not (isinstance(claims.get("exp"), (int, float)) and claims["exp"] < time.time())
+
+
+def enqueue(event: dict[str, Any]) -> bool:
+    """Queue one webhook ``event``; returns ``False`` for redeliveries already queued."""
+    item_id = event.get("pulseId") or event.get("itemId")
+    if not item_id:
+        return False
+    try:
+        with transaction.atomic():
+            MondayWebhookEvent.objects.create(
+                trigger_uuid=event.get("triggerUuid") or None,
+                event_type=event.get("type", ""),
+                item_id=str(item_id),
+                payload=event,
+            )
+    except IntegrityError:
+        return False
+    return True
+
+
+def _label(value: Any) -> str | None:
+    if isinstance(value, dict):
+        label = value.get("label")
+        return label.get("text") if isinstance(label, dict) else label
+    return None
+
+
+def apply_pending_events(batch_size: int | None = None) -> int:
+    """Apply one batch of queued events; returns how many were consumed."""
+    batch_size = batch_size or settings.MONDAY_WEBHOOK_BATCH_SIZE
+    status_column = _column_map().get("status")
+    now = timezone.now()
+
+    with transaction.atomic():
+        events = list(
+            MondayWebhookEvent.objects.select_for_update(skip_locked=True)
+            .filter(processed_at__isnull=True)
+            .order_by("received_at", "id")[:batch_size]
+        )
+        if not events:
+            return 0
+
+        target: dict[str, str] = {}  # item id → new Task.status, last event wins
+        deleted: set[str] = set()
+        for event in events:
+            event.processed_at = now
+            if event.event_type in DELETE_EVENTS:
+                deleted.add(event.item_id)
+                target.pop(event.item_id, None)
+            elif event.event_type in STATUS_EVENTS and event.payload.get("columnId") == status_column:
+                label = _label(event.payload.get("value"))
+                if (label or "").lower() in _STATUS_FOR_LABEL:
+                    target[event.item_id] = _STATUS_FOR_LABEL[label.lower()]
+                    deleted.discard(event.item_id)
+                else:
+                    event.error = f"Unmapped status label {label!r}"
+            else:
+                event.error = "Ignored event"
+
+        tasks = {
+            task.monday_item_id: task
+            for task in Task.objects.filter(monday_item_id__in=set(target) | deleted)
+            .only("id", "meeting_id", "status", "monday_item_id")
+        }
+        changed: dict[str, list] = {}
+        for item_id, status in target.items():
+            task = tasks.get(item_id)
+            if task and task.status != status:
+                changed.setdefault(status, []).append(task.pk)
+        moved = 0
+        for status, task_ids in changed.items():
+            # the board is authoritative: any other status may move to the one it shows
+            moved += len(transition(task_ids, status, reason="Status changed on the Monday.com board",
+                                    sources=Task.Status.values, now=now).moved)
+        if deleted:
+            Task.objects.filter(monday_item_id__in=deleted).update(posted_to_monday=False, updated_at=now)
+
+        for event in events:
+            if not event.error and event.item_id not in tasks:
+                event.error = "No task with this Monday item id"
+        MondayWebhookEvent.objects.bulk_update(events, ["processed_at", "error"])
+
+    logger.info("Applied %d Monday webhook event(s): %d status change(s), %d deletion(s)",
+                len(events), moved, len(deleted))
+    return len(events)
@@ -0,0 +1,248 @@
+"""Full-text search over tasks and their meetings.
+
+Postgres keeps a ``tasks_task.search_vector`` tsvector column (GIN-indexed)
+up to date with triggers on both ``tasks_task`` and ``tasks_meeting``; SQLite
+mirrors the same text into an FTS5 virtual table. Neither column is declared
+on the model, so the ORM never reads or writes it – see migration
+``0007_task_search_index``. Other backends fall back to ``icontains``.
+"""
+from __future__ import annotations
+
+import re
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+# ---------------------------------------------------------------------------
+# POSTGRES
+# ---------------------------------------------------------------------------
+# One text-search config for the index and the query: a lexeme indexed with
+# 'simple' ("alice") never matches the stem an 'english' query looks for ("alic")
+POSTGRES_CONFIG = "english"
+
+POSTGRES_INSTALL = [
+    "ALTER TABLE tasks_task ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    "CREATE INDEX IF NOT EXISTS tasks_task_search_gin ON tasks_task USING gin (search_vector)",
+    f"""
+    CREATE OR REPLACE FUNCTION tasks_task_search_update() RETURNS trigger AS $$
+    DECLARE m RECORD;
+    BEGIN
+      SELECT title, meeting_id, execution_id, organizer_email INTO m
+        FROM tasks_meeting WHERE id = NEW.meeting_id;
+      NEW.search_vector :=
+        setweight(to_tsvector('{POSTGRES_CONFIG}', coalesce(NEW.task_item, '')), 'A') ||
+        setweight(to_tsvector('{POSTGRES_CONFIG}', coalesce(NEW.brief_description, '')), 'B') ||
+        setweight(to_tsvector('{POSTGRES_CONFIG}', coalesce(NEW.assignee_names, '')), 'B') ||
+        setweight(to_tsvector('{POSTGRES_CONFIG}', coalesce(m.title, '')), 'C') ||
+        setweight(to_tsvector('{POSTGRES_CONFIG}',
+                              concat_ws(' ', m.meeting_id, m.execution_id, m.organizer_email)), 'D');
+      RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS tasks_task_search_trg ON tasks_task",
+    """
+    CREATE TRIGGER tasks_task_search_trg
+      BEFORE INSERT OR UPDATE OF task_item, brief_description, assignee_names, meeting_id ON tasks_task
+      FOR EACH ROW EXECUTE FUNCTION tasks_task_search_update()
+    """,
+    # Re-index a meeting's tasks when the meeting text they embed changes
+    """
+    CREATE OR REPLACE FUNCTION tasks_meeting_search_update() RETURNS trigger AS $$
+    BEGIN
+      UPDATE tasks_task SET meeting_id = meeting_id WHERE meeting_id = NEW.id;
+      RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS tasks_meeting_search_trg ON tasks_meeting",
+    """
+    CREATE TRIGGER tasks_meeting_search_trg
+      AFTER UPDATE OF title, meeting_id, execution_id, organizer_email ON tasks_meeting
+      FOR EACH ROW EXECUTE FUNCTION tasks_meeting_search_update()
+    """,
+    # Backfill existing rows through the trigger
+    "UPDATE tasks_task SET meeting_id = meeting_id",
+]
+
+POSTGRES_UNINSTALL = [
+    "DROP TRIGGER IF EXISTS tasks_meeting_search_trg ON tasks_meeting",
+    "DROP FUNCTION IF EXISTS tasks_meeting_search_update()",
+    "DROP TRIGGER IF EXISTS tasks_task_search_trg ON tasks_task",
+    "DROP FUNCTION IF EXISTS tasks_task_search_update()",
+    "ALTER TABLE tasks_task DROP COLUMN IF EXISTS search_vector",
+]
+
+# ---------------------------------------------------------------------------
+# SQLITE (FTS5)
+# ---------------------------------------------------------------------------
+_SQLITE_MEETING_TEXT = (
+    "m.title || ' ' || m.meeting_id || ' ' || coalesce(m.execution_id, '') || ' ' || m.organizer_email"
+)
+_SQLITE_INSERT_ROW = f"""
+    INSERT INTO tasks_task_fts (task_id, task_item, brief_description, assignee_names, meeting_text)
+    SELECT NEW.id, NEW.task_item, NEW.brief_description, NEW.assignee_names, {_SQLITE_MEETING_TEXT}
+      FROM tasks_meeting m WHERE m.id = NEW.meeting_id;
+"""
+
+SQLITE_TABLE = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_task_fts USING fts5(
+      task_id UNINDEXED, task_item, brief_description, assignee_names, meeting_text,
+      tokenize = 'porter unicode61'
+    )
+"""
+
+# Triggers are (re)installed after every migrate: rebuilding tasks_task on
+# SQLite (ALTER via table copy) silently drops triggers attached to it.
+SQLITE_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_ai AFTER INSERT ON tasks_task BEGIN
+      {_SQLITE_INSERT_ROW}
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_ad AFTER DELETE ON tasks_task BEGIN
+      DELETE FROM tasks_task_fts WHERE task_id = OLD.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_task_fts_au
+      AFTER UPDATE OF task_item, brief_description, assignee_names, meeting_id ON tasks_task BEGIN
+      DELETE FROM tasks_task_fts WHERE task_id = OLD.id;
+      {_SQLITE_INSERT_ROW}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tasks_meeting_fts_au
+      AFTER UPDATE OF title, meeting_id, execution_id, organizer_email ON tasks_meeting BEGIN
+      UPDATE tasks_task_fts
+         SET meeting_text = (SELECT {_SQLITE_MEETING_TEXT} FROM tasks_meeting m WHERE m.id = NEW.id)
+       WHERE task_id IN (SELECT id FROM tasks_task WHERE meeting_id = NEW.id);
+    END
+    """,
+]
+
+SQLITE_BACKFILL = f"""
+    INSERT INTO tasks_task_fts (task_id, task_item, brief_description, assignee_names, meeting_text)
+    SELECT t.id, t.task_item, t.brief_description, t.assignee_names, {_SQLITE_MEETING_TEXT}
+      FROM tasks_task t JOIN tasks_meeting m ON m.id = t.meeting_id
+"""
+
+SQLITE_DROP_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS tasks_meeting_fts_au",
+    "DROP TRIGGER IF EXISTS tasks_task_fts_au",
+    "DROP TRIGGER IF EXISTS tasks_task_fts_ad",
+    "DROP TRIGGER IF EXISTS tasks_task_fts_ai",
+]
+
+SQLITE_UNINSTALL = [*SQLITE_DROP_TRIGGERS, "DROP TABLE IF EXISTS tasks_task_fts"]
+
+# Relative weight per FTS5 column: task_id, task_item, brief_description, assignee_names, meeting_text
+_SQLITE_BM25 = "bm25(tasks_task_fts, 0.0, 10.0, 5.0, 5.0, 2.0)"
+
+# icontains fallback for other backends
+_FALLBACK_FIELDS = (
+    "task_item", "brief_description", "assignee_names",
+    "meeting__title", "meeting__meeting_id", "meeting__execution_id", "meeting__organizer_email",
+)
+
+
+def install(connection) -> None:
+    """Create the search column/table, triggers and backfill for ``connection``."""
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            for sql in POSTGRES_INSTALL:
+                cursor.execute(sql)
+        elif connection.vendor == "sqlite":
+            cursor.execute(SQLITE_TABLE)
+            cursor.execute("DELETE FROM tasks_task_fts")
+            cursor.execute(SQLITE_BACKFILL)
+            for sql in SQLITE_TRIGGERS:
+                cursor.execute(sql)
+
+
+def uninstall(connection) -> None:
+    statements = {"postgresql": POSTGRES_UNINSTALL, "sqlite": SQLITE_UNINSTALL}.get(connection.vendor, [])
+    with connection.cursor() as cursor:
+        for sql in statements:
+            cursor.execute(sql)
+
+
+def ensure_sqlite_triggers(connection) -> None:
+    """Re-create any FTS5 triggers dropped by a SQLite table rebuild."""
+    if connection.vendor != "sqlite" or "tasks_task_fts" not in connection.introspection.table_names():
+        return
+    with connection.cursor() as cursor:
+        for sql in SQLITE_TRIGGERS:
+            cursor.execute(sql)
+
+
+def drop_sqlite_triggers(connection) -> None:
+    """Drop the FTS5 triggers before a migration rebuilds ``tasks_meeting``/``tasks_task`` on SQLite.
+
+    SQLite refuses to rename a table over one that live triggers still reference;
+    ``ensure_sqlite_triggers`` puts them back afterwards.
+    """
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        for sql in SQLITE_DROP_TRIGGERS:
+            cursor.execute(sql)
+
+
+def _fts5_query(text: str) -> str:
+    """Turn free text into a safe FTS5 expression: every word, as a prefix, ANDed."""
+    return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+
+def search_tasks(queryset, text: str, *, rank: bool = True):
+    """Filter ``queryset`` to tasks matching ``text``.
+
+    With ``rank=True`` the result carries a ``search_rank`` annotation and is
+    ordered best match first.
+    """
+    text = (text or "").strip()
+    if not text:
+        return queryset
+    vendor = connections[queryset.db].vendor
+
+    if vendor == "postgresql":
+        tsquery = f"websearch_to_tsquery('{POSTGRES_CONFIG}', %s)"
+        queryset = queryset.filter(
+            RawSQL(f"tasks_task.search_vector @@ {tsquery}", [text], output_field=BooleanField())
+        )
+        if rank:
+            queryset = queryset.annotate(
+                search_rank=RawSQL(f"ts_rank(tasks_task.search_vector, {tsquery})", [text], output_field=FloatField())
+            )
+    elif vendor == "sqlite":
+        match = _fts5_query(text)
+        if not match:
+            return queryset.none()
+        queryset = queryset.filter(
+            RawSQL(
+                "tasks_task.id IN (SELECT task_id FROM tasks_task_fts WHERE tasks_task_fts MATCH %s)",
+                [match],
+                output_field=BooleanField(),
+            )
+        )
+        if rank:
+            # bm25() is lower-is-better; negate so both backends sort descending
+            queryset = queryset.annotate(
+                search_rank=RawSQL(
+                    f"(SELECT -{_SQLITE_BM25} FROM tasks_task_fts "
+                    "WHERE tasks_task_fts MATCH %s AND task_id = tasks_task.id)",
+                    [match],
+                    output_field=FloatField(),
+                )
+            )
+    else:
+        condition = Q()
+        for field in _FALLBACK_FIELDS:
+            condition |= Q(**{f"{field}__icontains": text})
+        return queryset.filter(condition)
+
+    if rank:
+        queryset = queryset.order_by("-search_rank", *(queryset.query.order_by or queryset.model._meta.ordering))
+    return queryset
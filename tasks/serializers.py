@@ -12,7 +12,11 @@ class MeetingSerializer(serializers.ModelSerializer):
             "title",
             "organizer_email",
             "date",
+            "pending_count",
+            "approved_count",
+            "rejected_count",
         ]
+        read_only_fields = ["pending_count", "approved_count", "rejected_count"]
 
 
 class TaskSerializer(serializers.ModelSerializer):
@@ -49,6 +53,20 @@ class TaskSerializer(serializers.ModelSerializer):
         ]
 
 
+class TaskChangeSerializer(TaskSerializer):
+    """``TaskSerializer`` for ``/api/tasks/changes/``, with ``meeting_id`` instead of the nested meeting.
+
+    Meeting edits and counter updates don't touch ``Task.updated_at``, so a
+    nested copy in a mirror would go stale; mirrors read meetings from
+    ``/api/meetings/``.
+    """
+
+    meeting_id = serializers.UUIDField(read_only=True)
+
+    class Meta(TaskSerializer.Meta):
+        fields = ["meeting_id" if name == "meeting" else name for name in TaskSerializer.Meta.fields]
+
+
 class TaskActionSerializer(serializers.Serializer):
     """Approve / reject / edit serializer.
 
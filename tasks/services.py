@@ -1,15 +1,31 @@
 """Integration helpers for external services (Monday.com, n8n, etc.)"""
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import re
+import time
+import weakref
+from datetime import datetime, timedelta
 from typing import Any
 
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from .models import AppSetting
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from .models import AppSetting, MondayPush, Task
+from . import metrics
+from .logs import Payload
 import json
 
+try:  # optional: only the ASGI views use it
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
 # Remove hardcoded URL and use _get_setting instead
@@ -25,62 +41,130 @@ def _get_setting(name: str) -> str | None:
     return val
 
 
-def _post_monday(query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
-    api_key = _get_setting("MONDAY_API_KEY")
-    if not api_key:
-        logger.warning("MONDAY_API_KEY missing – skipping Monday API call")
-        return {}
+def _operation_name(query: str) -> str:
+    """Best-effort name of the root field a GraphQL document calls (metrics label)."""
+    match = re.search(r"\{\s*(?:\w+\s*:\s*)?(\w+)", re.sub(r"complexity\s*\{[^}]*\}", "", query))
+    return match.group(1) if match else "unknown"
+
+
+def _record_complexity(operation: str, data: dict[str, Any]) -> None:
+    complexity = (data.get("data") or {}).get("complexity") or {}
+    if complexity.get("query") is not None:
+        metrics.MONDAY_COMPLEXITY.labels(operation).observe(complexity["query"])
+    if complexity.get("after") is not None:
+        metrics.MONDAY_COMPLEXITY_REMAINING.set(complexity["after"])
 
-    headers = {
+
+def _monday_headers(api_key: str) -> dict[str, str]:
+    return {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
         "API-Version": "2023-10"  # Required for project tokens
     }
 
+
+def _check_monday_response(operation: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Count/log GraphQL errors and record complexity; shared by the sync and async clients."""
+    if data.get("errors"):
+        metrics.MONDAY_ERRORS.labels(operation, "graphql").inc()
+        logger.error("Monday API errors on %s: %s", operation, Payload(data["errors"]),
+                     extra={"monday_operation": operation})
+        return data
+
+    _record_complexity(operation, data)
+    logger.debug("Monday.com %s response: %s", operation, Payload(data))
+    return data
+
+
+def _post_monday(query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+    api_key = _get_setting("MONDAY_API_KEY")
+    if not api_key:
+        logger.warning("MONDAY_API_KEY missing – skipping Monday API call")
+        return {}
+
     # Get API URL dynamically
     monday_api_url = _get_monday_api_url()
-    logger.info(f"Using Monday.com API URL: {monday_api_url}")
-    logger.info(f"Making Monday.com API call with headers: {json.dumps({k: '***' if k == 'Authorization' else v for k, v in headers.items()})}")
-    logger.info(f"Monday.com API variables: {json.dumps(variables)}")
-    
+    operation = _operation_name(query)
+    # Payloads are formatted only if DEBUG is enabled for this logger
+    logger.debug("Monday.com %s → %s variables=%s", operation, monday_api_url, Payload(variables))
+
+    start = time.perf_counter()
     try:
-        resp = requests.post(monday_api_url, json={"query": query, "variables": variables}, headers=headers, timeout=15)
+        resp = requests.post(monday_api_url, json={"query": query, "variables": variables},
+                             headers=_monday_headers(api_key), timeout=15)
         resp.raise_for_status()
-        data = resp.json()
-        
-        if data.get("errors"):
-            logger.error(f"Monday API errors: {json.dumps(data['errors'])}")
-            return data
-            
-        logger.info(f"Monday API response: {json.dumps(data)[:500]}...")
-        return data
+        return _check_monday_response(operation, resp.json())
     except requests.exceptions.RequestException as e:
-        logger.error(f"Monday API request failed: {str(e)}")
+        metrics.MONDAY_ERRORS.labels(operation, "http").inc()
+        logger.error("Monday API request failed on %s: %s", operation, e,
+                     extra={"monday_operation": operation})
         return {"errors": [{"message": str(e)}]}
+    finally:
+        metrics.MONDAY_LATENCY.labels(operation).observe(time.perf_counter() - start)
 
 
-def create_monday_item(task, board_id: str | None = None) -> str | None:
-    """Creates an item on Monday.com and returns its item ID."""
-    logger.info(f"Creating Monday item for task {task.id} ({task.task_item[:30]}...)")
+# One pooled client per event loop (uvicorn runs one loop per worker)
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
 
-    board_id = board_id or _get_setting("MONDAY_BOARD_ID")
-    group_id = _get_setting("MONDAY_GROUP_ID")
+
+def _async_client():
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _async_clients[loop] = httpx.AsyncClient(timeout=15)
+    return client
+
+
+async def _apost_monday(query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Async ``_post_monday`` for ASGI views: awaits Monday without holding a thread.
+
+    Falls back to running ``_post_monday`` in a worker thread when httpx isn't installed.
+    """
+    if httpx is None:
+        return await sync_to_async(_post_monday, thread_sensitive=False)(query, variables)
+    api_key = await sync_to_async(_get_setting)("MONDAY_API_KEY")
+    if not api_key:
+        logger.warning("MONDAY_API_KEY missing – skipping Monday API call")
+        return {}
+
+    monday_api_url = await sync_to_async(_get_monday_api_url)()
+    operation = _operation_name(query)
+    logger.debug("Monday.com %s → %s variables=%s", operation, monday_api_url, Payload(variables))
+
+    start = time.perf_counter()
+    try:
+        resp = await _async_client().post(monday_api_url, json={"query": query, "variables": variables},
+                                          headers=_monday_headers(api_key))
+        resp.raise_for_status()
+        return _check_monday_response(operation, resp.json())
+    except httpx.HTTPError as e:
+        metrics.MONDAY_ERRORS.labels(operation, "http").inc()
+        logger.error("Monday API request failed on %s: %s", operation, e,
+                     extra={"monday_operation": operation})
+        return {"errors": [{"message": str(e)}]}
+    finally:
+        metrics.MONDAY_LATENCY.labels(operation).observe(time.perf_counter() - start)
+
+
+# Task.status → label of the board's status column (tasks.monday_webhooks maps it back)
+MONDAY_STATUS_LABELS = {
+    "pending": "To Do",
+    "approved": "Approved",
+    "rejected": "Deprioritized",
+}
+
+
+def _column_map() -> dict[str, str]:
     column_map_json = _get_setting("MONDAY_COLUMN_MAP")
-    
-    logger.info(f"Using board_id: {board_id}, group_id: {group_id}")
-    logger.info(f"Column map JSON: {column_map_json}")
-    
     try:
-        column_map = json.loads(column_map_json) if column_map_json else {}
+        return json.loads(column_map_json) if column_map_json else {}
     except Exception as e:
-        logger.error(f"Failed to parse column map JSON: {str(e)}")
-        column_map = {}
-        
-    if not board_id:
-        logger.warning("MONDAY_BOARD_ID missing – cannot create Monday item")
-        return None
+        logger.error("Failed to parse MONDAY_COLUMN_MAP: %s", e)
+        return {}
 
-    # Build column values according to map, ensuring forbidden column omitted
+
+def _column_values(task, column_map: dict[str, str]) -> dict[str, Any]:
+    """Build column values according to map, ensuring forbidden column omitted."""
     def _safe(col):
         return col and col != "multiple_person_mkr7wdwf"
 
@@ -93,42 +177,331 @@ def create_monday_item(task, board_id: str | None = None) -> str | None:
         column_values[column_map["priority"]] = {"label": task.priority}
     if _safe(column_map.get("status")):
         # Map Django task status to Monday.com status options
-        status_map = {
-            "pending": "To Do",
-            "approved": "Approved",
-            "rejected": "Deprioritized"
-        }
-        monday_status = status_map.get(task.status, "To Do")
+        monday_status = MONDAY_STATUS_LABELS.get(task.status, "To Do")
         column_values[column_map["status"]] = {"label": monday_status}
     if _safe(column_map.get("due_date")):
         column_values[column_map["due_date"]] = {"date": str(task.date_expected)}
     if _safe(column_map.get("brief_description")):
         column_values[column_map["brief_description"]] = task.brief_description[:2000]
+    if _safe(column_map.get("external_id")):
+        # Lets a retried push find the item an earlier, unacknowledged attempt created
+        column_values[column_map["external_id"]] = str(task.id)
+    return column_values
 
-    logger.info(f"Prepared column values: {json.dumps(column_values)}")
 
-    # Mutation exactly matching the n8n production flow
-    query = """
+CREATE_ITEM_MUTATION = """
     mutation ($board:ID!, $group:String, $name:String!, $cols:JSON!){
       create_item(board_id:$board, group_id:$group, item_name:$name, column_values:$cols){ id }
+      complexity { query after }
     }
     """
 
-    variables = {
+
+def _create_item_variables(task, board_id: str | None = None) -> dict[str, Any] | None:
+    """Variables for ``CREATE_ITEM_MUTATION``; ``None`` when no board is configured."""
+    board_id = board_id or _get_setting("MONDAY_BOARD_ID")
+    group_id = _get_setting("MONDAY_GROUP_ID")
+    column_map = _column_map()
+
+    if not board_id:
+        logger.warning("MONDAY_BOARD_ID missing – cannot create Monday item")
+        return None
+
+    column_values = _column_values(task, column_map)
+    logger.debug("Monday column values for task %s (board=%s group=%s): %s",
+                 task.id, board_id, group_id, Payload(column_values))
+    return {
         "board": board_id,  # Send as string for ID! type
         "group": group_id,
         "name": task.task_item[:100],
         "cols": json.dumps(column_values)  # JSON-encode once
     }
 
+
+def _created_item_id(task, data: dict[str, Any]) -> str | None:
+    item_id = (data.get("data") or {}).get("create_item", {}).get("id")
+    if item_id:
+        logger.info("Monday item %s created for task %s", item_id, task.id)
+    else:
+        logger.error("Failed to create Monday item for task %s. Response: %s", task.id, Payload(data))
+    return item_id
+
+
+def create_monday_item(task, board_id: str | None = None) -> str | None:
+    """Creates an item on Monday.com and returns its item ID."""
+    variables = _create_item_variables(task, board_id)
+    if variables is None:
+        return None
+    try:
+        # Mutation exactly matching the n8n production flow
+        return _created_item_id(task, _post_monday(CREATE_ITEM_MUTATION, variables))
+    except Exception as exc:  # pragma: no cover
+        logger.error("Exception creating Monday item for task %s: %s", task.id, exc, exc_info=True)
+        return None 
+
+
+async def acreate_monday_item(task, board_id: str | None = None) -> str | None:
+    """Async ``create_monday_item``."""
+    variables = await sync_to_async(_create_item_variables)(task, board_id)
+    if variables is None:
+        return None
     try:
-        data = _post_monday(query, variables)
-        item_id = data.get("data", {}).get("create_item", {}).get("id")
+        return _created_item_id(task, await _apost_monday(CREATE_ITEM_MUTATION, variables))
+    except Exception as exc:  # pragma: no cover
+        logger.error("Exception creating Monday item for task %s: %s", task.id, exc, exc_info=True)
+        return None
+
+
+def create_monday_items(tasks, board_id: str | None = None) -> dict[Any, str | None]:
+    """Create one Monday item per task using aliased ``create_item`` mutations.
+
+    Up to ``MONDAY_BATCH_SIZE`` items go in each request. Returns ``{task.id: item_id}``,
+    with ``None`` for tasks whose item could not be created.
+    """
+    tasks = list(tasks)
+    results: dict[Any, str | None] = {task.id: None for task in tasks}
+    board_id = board_id or _get_setting("MONDAY_BOARD_ID")
+    if not board_id:
+        logger.warning("MONDAY_BOARD_ID missing – cannot create Monday items")
+        return results
+    group_id = _get_setting("MONDAY_GROUP_ID")
+    column_map = _column_map()
+    batch_size = max(1, int(getattr(settings, "MONDAY_BATCH_SIZE", 25)))
+
+    for start in range(0, len(tasks), batch_size):
+        batch = tasks[start:start + batch_size]
+        params = ["$board:ID!", "$group:String"]
+        fields = []
+        variables: dict[str, Any] = {"board": board_id, "group": group_id}
+        for i, task in enumerate(batch):
+            params += [f"$name{i}:String!", f"$cols{i}:JSON!"]
+            fields.append(
+                f"t{i}: create_item(board_id:$board, group_id:$group, item_name:$name{i}, column_values:$cols{i}){{ id }}"
+            )
+            variables[f"name{i}"] = task.task_item[:100]
+            variables[f"cols{i}"] = json.dumps(_column_values(task, column_map))
+        query = "mutation (%s){\n  %s\n  complexity { query after }\n}" % (", ".join(params), "\n  ".join(fields))
+
+        data = (_post_monday(query, variables).get("data") or {})
+        for i, task in enumerate(batch):
+            item_id = (data.get(f"t{i}") or {}).get("id")
+            results[task.id] = item_id
+            if not item_id:
+                logger.error("Failed to create Monday item for task %s in batch", task.id)
+        logger.info("Monday batch: %d/%d items created", sum(1 for t in batch if results[t.id]), len(batch))
+    return results
+
+
+ITEM_BY_EXTERNAL_ID_QUERY = """
+query ($board:ID!, $column:String!, $value:String!){
+  items_page_by_column_values(board_id:$board, limit:1, columns:[{column_id:$column, column_values:[$value]}]){ items { id } }
+  complexity { query after }
+}
+"""
+
+
+def find_monday_item(task, board_id: str | None = None) -> str | None:
+    """Id of the board item whose ``external_id`` column holds ``task.id``, if any.
+
+    Returns ``None`` when no ``external_id`` column is mapped. Raises ``RuntimeError`` if the
+    lookup fails, so callers don't create a duplicate because of an API error.
+    """
+    column = _column_map().get("external_id")
+    if not column:
+        return None
+    board_id = board_id or _get_setting("MONDAY_BOARD_ID")
+    data = _post_monday(ITEM_BY_EXTERNAL_ID_QUERY, {"board": board_id, "column": column, "value": str(task.id)})
+    page = (data.get("data") or {}).get("items_page_by_column_values")
+    if page is None:
+        raise RuntimeError(f"Monday items_page_by_column_values failed: {data.get('errors') or 'no data'}")
+    items = page.get("items") or []
+    return str(items[0]["id"]) if items else None
+
+
+_external_id_reported = False
+
+
+def _report_unmapped_external_id() -> None:
+    """Log once per process when retried pushes can't be de-duplicated (no ``external_id`` column)."""
+    global _external_id_reported
+    if _external_id_reported or _column_map().get("external_id"):
+        return
+    _external_id_reported = True
+    logger.error("MONDAY_COLUMN_MAP has no external_id column: a retried Monday push cannot find the item "
+                 "an earlier attempt created and may create a duplicate")
+
+
+def _claim_pushes(task_ids, now: datetime) -> dict[Any, MondayPush]:
+    """Take the push lease on ``task_ids``.
+
+    Returns the records this caller may act on: ones it claimed (now ``IN_FLIGHT``, with
+    ``attempts`` incremented) and ones already ``DONE``. Pushes another worker is holding
+    are left out. Each claim is a compare-and-set on ``attempts``, so two workers can't
+    both win the same record even where ``skip_locked`` isn't supported.
+    """
+    _report_unmapped_external_id()
+    task_ids = list(task_ids)
+    MondayPush.objects.bulk_create([MondayPush(task_id=pk) for pk in task_ids], ignore_conflicts=True)
+    stale = now - timedelta(seconds=settings.MONDAY_PUSH_LEASE_SECONDS)
+    owned: dict[Any, MondayPush] = {}
+    with transaction.atomic():
+        records = (
+            MondayPush.objects.select_for_update(skip_locked=True)
+            .filter(pk__in=task_ids)
+            .filter(~Q(state=MondayPush.State.IN_FLIGHT) | Q(claimed_at__lt=stale))
+        )
+        for record in records:
+            if record.state == MondayPush.State.DONE:
+                owned[record.pk] = record
+                continue
+            won = MondayPush.objects.filter(pk=record.pk, attempts=record.attempts).update(
+                state=MondayPush.State.IN_FLIGHT, claimed_at=now, attempts=record.attempts + 1, updated_at=now
+            )
+            if won:
+                record.state, record.claimed_at, record.attempts = MondayPush.State.IN_FLIGHT, now, record.attempts + 1
+                owned[record.pk] = record
+    return owned
+
+
+def _finish_pushes(results: dict[Task, str | None], errors: dict[Any, str], now: datetime) -> None:
+    """Record push outcomes on both the push records and the tasks."""
+    records, posted = [], []
+    finished = timezone.now()
+    for task, item_id in results.items():
+        records.append(MondayPush(
+            task_id=task.pk,
+            state=MondayPush.State.DONE if item_id else MondayPush.State.FAILED,
+            item_id=item_id or "",
+            last_error="" if item_id else errors.get(task.pk, "create_item returned no item id"),
+            updated_at=now,
+        ))
         if item_id:
-            logger.info(f"Monday item created successfully (ID={item_id}) for task {task.id}")
+            task.monday_item_id = item_id
+            task.posted_to_monday = True
+            task.monday_seen_at = now
+            task.updated_at = finished  # the live feed shows the Monday badge
+            posted.append(task)
+    with transaction.atomic():
+        MondayPush.objects.bulk_update(records, ["state", "item_id", "last_error", "updated_at"])
+        Task.objects.bulk_update(posted, ["monday_item_id", "posted_to_monday", "monday_seen_at", "updated_at"])
+
+
+def _resolve_claimed(tasks, claims: dict[Any, MondayPush], errors: dict[Any, str]) -> tuple[dict, list]:
+    """Split claimed ``tasks`` into ``{task: item_id}`` already on the board and tasks still to create."""
+    known, to_create = {}, []
+    for task in tasks:
+        record = claims.get(task.pk)
+        if record is None:
+            continue
+        if record.state == MondayPush.State.DONE:
+            known[task] = record.item_id
+        elif record.attempts > 1:
+            # An earlier attempt may have created the item and died before recording it
+            try:
+                item_id = find_monday_item(task)
+            except RuntimeError as exc:
+                errors[task.pk] = str(exc)
+                known[task] = None
+                continue
+            if item_id:
+                known[task] = item_id
+            else:
+                if not _column_map().get("external_id"):
+                    logger.error("Retrying Monday push for task %s (attempt %d) without an external_id lookup",
+                                 task.id, record.attempts)
+                to_create.append(task)
         else:
-            logger.error(f"Failed to create Monday item for task {task.id}. Response: {json.dumps(data)}")
-        return item_id
-    except Exception as exc:  # pragma: no cover
-        logger.error(f"Exception creating Monday item for task {task.id}: {exc}", exc_info=True)
-        return None 
\ No newline at end of file
+            to_create.append(task)
+    return known, to_create
+
+
+def push_task_to_monday(task) -> str | None:
+    """Create ``task``'s Monday item at most once and store its id on the task.
+
+    Safe under concurrent and retried calls: returns the existing item id if the push
+    already happened, and ``None`` if it failed or another worker is pushing right now.
+    """
+    if task.monday_item_id:
+        return task.monday_item_id
+    now = timezone.now()
+    errors: dict[Any, str] = {}
+    known, to_create = _resolve_claimed([task], _claim_pushes([task.pk], now), errors)
+    if not known and not to_create:
+        logger.info("Monday push for task %s is already in progress elsewhere", task.id)
+        return None
+    results = known or {task: create_monday_item(task)}
+    _finish_pushes(results, errors, now)
+    return results[task]
+
+
+async def apush_task_to_monday(task) -> str | None:
+    """Async ``push_task_to_monday``: the same claims, with ``create_item`` awaited over httpx."""
+    if task.monday_item_id:
+        return task.monday_item_id
+    now = timezone.now()
+    errors: dict[Any, str] = {}
+    claims = await sync_to_async(_claim_pushes)([task.pk], now)
+    known, to_create = await sync_to_async(_resolve_claimed)([task], claims, errors)
+    if not known and not to_create:
+        logger.info("Monday push for task %s is already in progress elsewhere", task.id)
+        return None
+    results = known or {task: await acreate_monday_item(task)}
+    await sync_to_async(_finish_pushes)(results, errors, now)
+    return results[task]
+
+
+def push_tasks_to_monday(task_ids) -> int:
+    """Push approved tasks that have no Monday item yet, in batches; returns how many were posted.
+
+    Uses the same claims as ``push_task_to_monday``, so tasks being pushed elsewhere are skipped.
+    """
+    tasks = list(
+        Task.objects.filter(pk__in=list(task_ids), status=Task.Status.APPROVED, monday_item_id__isnull=True)
+    )
+    if not tasks:
+        return 0
+    now = timezone.now()
+    errors: dict[Any, str] = {}
+    known, to_create = _resolve_claimed(tasks, _claim_pushes([t.pk for t in tasks], now), errors)
+    if to_create:
+        created = create_monday_items(to_create)
+        known.update((task, created.get(task.id)) for task in to_create)
+    if not known:
+        return 0
+    _finish_pushes(known, errors, now)
+    return sum(1 for item_id in known.values() if item_id)
+
+
+ITEMS_PAGE_QUERY = """
+query ($board:[ID!], $limit:Int!){
+  boards(ids:$board){ items_page(limit:$limit){ cursor items { id name } } }
+  complexity { query after }
+}
+"""
+
+NEXT_ITEMS_PAGE_QUERY = """
+query ($cursor:String!, $limit:Int!){
+  next_items_page(cursor:$cursor, limit:$limit){ cursor items { id name } }
+  complexity { query after }
+}
+"""
+
+
+def fetch_items_page(board_id: str | None = None, cursor: str | None = None,
+                     limit: int = 500) -> tuple[list[dict[str, Any]], str | None]:
+    """One page of board items as ``(items, next_cursor)``; ``next_cursor`` is ``None`` on the last page.
+
+    Pass the previous page's cursor to continue a scan (Monday cursors stay valid for 60 minutes).
+    Raises ``RuntimeError`` if the API call fails, so a scan never mistakes an error for an empty board.
+    """
+    if cursor:
+        data = _post_monday(NEXT_ITEMS_PAGE_QUERY, {"cursor": cursor, "limit": limit})
+        page = (data.get("data") or {}).get("next_items_page")
+    else:
+        board_id = board_id or _get_setting("MONDAY_BOARD_ID")
+        data = _post_monday(ITEMS_PAGE_QUERY, {"board": [board_id], "limit": limit})
+        boards = (data.get("data") or {}).get("boards") or []
+        page = boards[0].get("items_page") if boards else None
+    if page is None:
+        raise RuntimeError(f"Monday items_page failed: {data.get('errors') or 'no data'}")
+    return page.get("items") or [], page.get("cursor")
@@ -0,0 +1,69 @@
+"""Model signal handlers (connected from ``TasksConfig.ready``)."""
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db import connections
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from . import changes, counters, live, search
+from .models import ActionItem, Meeting, Task
+from .transitions import tasks_transitioned
+
+# Admin sidebar filters cache their lookups under these keys (see admin.CachedLookupFilter)
+ADMIN_FILTER_CACHE_KEYS = [
+    f"admin-filter-lookups:{param}" for param in ("meeting", "meeting_id", "execution_id", "organizer")
+]
+
+
+@receiver(post_save, sender=Meeting)
+@receiver(post_delete, sender=Meeting)
+def _invalidate_admin_filter_lookups(sender, **kwargs):  # noqa: ANN001
+    cache.delete_many(ADMIN_FILTER_CACHE_KEYS)
+
+
+@receiver(post_save, sender=Meeting)
+def _sync_task_meeting_date(sender, instance, created, **kwargs):  # noqa: ANN001
+    """Propagate a meeting's date to the denormalised ``Task.meeting_date``."""
+    if created:
+        return
+    Task.objects.filter(meeting=instance).exclude(meeting_date=instance.date).update(
+        meeting_date=instance.date, updated_at=timezone.now()
+    )
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=ActionItem)
+def _refresh_counters_on_save(sender, instance, created, **kwargs):  # noqa: ANN001
+    """Keep ``Meeting.*_count`` in step when a task appears, moves or changes status."""
+    current = (instance.meeting_id, instance.status)
+    previous = getattr(instance, "_counted_as", None)
+    if created or previous != current:
+        counters.schedule_refresh(instance.meeting_id)
+        if previous and previous[0] not in (None, instance.meeting_id):
+            counters.schedule_refresh(previous[0])
+    instance._counted_as = current
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=ActionItem)
+def _refresh_counters_on_delete(sender, instance, **kwargs):  # noqa: ANN001
+    counters.schedule_refresh(instance.meeting_id)
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=ActionItem)
+def _record_tombstone(sender, instance, **kwargs):  # noqa: ANN001
+    """Remember the delete for ``/api/tasks/changes/`` clients."""
+    changes.record_tombstones([instance])
+
+
+@receiver(post_migrate)
+def _restore_search_triggers(sender, using="default", **kwargs):  # noqa: ANN001
+    search.ensure_sqlite_triggers(connections[using])
+
+
+@receiver(tasks_transitioned)
+def _wake_live_streams(sender, **kwargs):  # noqa: ANN001
+    live.announce_change()
@@ -0,0 +1,139 @@
+"""Review-throughput statistics behind ``/api/stats/``.
+
+Everything is aggregated in the database into one bucket per calendar day
+(``TIME_ZONE``) and each bucket is cached on its own: a request only queries
+the days missing from the cache, so a dashboard refresh normally costs one
+cache ``get_many``. Closed days are cached for ``STATS_HISTORY_TTL`` (they only
+change when an old task is reviewed late), today for ``STATS_TODAY_TTL``.
+Weekly figures are summed from the daily buckets.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import ReviewAction, Task
+
+# Raw per-day sums; rates and averages are derived from these so buckets can be added up.
+BUCKET_FIELDS = ("ingested", "approved", "rejected", "edits", "pushed", "approval_seconds")
+
+_CACHE_PREFIX = "stats:day:"
+
+
+def _empty_bucket(day: date) -> dict:
+    return {"date": day.isoformat(), **{field: 0 for field in BUCKET_FIELDS}}
+
+
+def _day_start(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def compute_daily(first: date, last: date) -> dict[date, dict]:
+    """Aggregate the days ``first``..``last`` (inclusive) with three grouped queries."""
+    days = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+    buckets = {day: _empty_bucket(day) for day in days}
+    start, end = _day_start(first), _day_start(last + timedelta(days=1))
+
+    ingested = (
+        Task.objects.filter(created_at__gte=start, created_at__lt=end)
+        .annotate(day=TruncDate("created_at"))
+        .order_by()
+        .values("day")
+        .annotate(n=Count("pk"))
+    )
+    for row in ingested:
+        buckets[row["day"]]["ingested"] = row["n"]
+
+    approved = Q(status=Task.Status.APPROVED)
+    reviewed = (
+        Task.objects.filter(reviewed_at__gte=start, reviewed_at__lt=end)
+        .annotate(day=TruncDate("reviewed_at"))
+        .order_by()
+        .values("day")
+        .annotate(
+            approved=Count("pk", filter=approved),
+            rejected=Count("pk", filter=Q(status=Task.Status.REJECTED)),
+            pushed=Count("pk", filter=approved & Q(posted_to_monday=True)),
+            latency=Sum(
+                ExpressionWrapper(F("reviewed_at") - F("created_at"), output_field=DurationField()),
+                filter=approved,
+            ),
+        )
+    )
+    for row in reviewed:
+        bucket = buckets[row["day"]]
+        bucket.update(approved=row["approved"], rejected=row["rejected"], pushed=row["pushed"])
+        bucket["approval_seconds"] = round(row["latency"].total_seconds()) if row["latency"] else 0
+
+    edits = (
+        ReviewAction.objects.filter(action=ReviewAction.Action.EDIT, timestamp__gte=start, timestamp__lt=end)
+        .annotate(day=TruncDate("timestamp"))
+        .order_by()
+        .values("day")
+        .annotate(n=Count("pk"))
+    )
+    for row in edits:
+        buckets[row["day"]]["edits"] = row["n"]
+    return buckets
+
+
+def daily_buckets(first: date, last: date) -> list[dict]:
+    """Daily buckets for ``first``..``last``, served from cache where possible."""
+    days = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+    keys = {day: f"{_CACHE_PREFIX}{day.isoformat()}" for day in days}
+    cached = cache.get_many(keys.values())
+    buckets = {day: cached[keys[day]] for day in days if keys[day] in cached}
+
+    missing = [day for day in days if day not in buckets]
+    if missing:
+        fresh = compute_daily(missing[0], missing[-1])
+        today = timezone.localdate()
+        closed = {keys[d]: b for d, b in fresh.items() if d < today}
+        if closed:
+            cache.set_many(closed, settings.STATS_HISTORY_TTL)
+        if today in fresh:
+            cache.set(keys[today], fresh[today], settings.STATS_TODAY_TTL)
+        buckets.update({day: fresh[day] for day in missing})
+    return [buckets[day] for day in days]
+
+
+def with_rates(bucket: dict) -> dict:
+    """Public shape of a bucket: counts plus rejection/push rates and mean approval latency."""
+    reviewed = bucket["approved"] + bucket["rejected"]
+    return {
+        **{key: value for key, value in bucket.items() if key != "approval_seconds"},
+        "rejection_rate": round(bucket["rejected"] / reviewed, 4) if reviewed else None,
+        "avg_approval_latency_seconds": (
+            round(bucket["approval_seconds"] / bucket["approved"], 1) if bucket["approved"] else None
+        ),
+        "push_success_rate": round(bucket["pushed"] / bucket["approved"], 4) if bucket["approved"] else None,
+    }
+
+
+def _sum(buckets: list[dict], **extra) -> dict:
+    return {**extra, **{field: sum(b[field] for b in buckets) for field in BUCKET_FIELDS}}
+
+
+def review_stats(days: int) -> dict:
+    """Daily, weekly (ISO weeks, Monday start) and total review statistics for the last ``days`` days."""
+    last = timezone.localdate()
+    first = last - timedelta(days=days - 1)
+    daily = daily_buckets(first, last)
+
+    weeks: dict[date, list[dict]] = {}
+    for bucket in daily:
+        day = date.fromisoformat(bucket["date"])
+        weeks.setdefault(day - timedelta(days=day.weekday()), []).append(bucket)
+
+    return {
+        "start": first.isoformat(),
+        "end": last.isoformat(),
+        "totals": with_rates(_sum(daily)),
+        "weekly": [with_rates(_sum(rows, week=week.isoformat())) for week, rows in weeks.items()],
+        "daily": [with_rates(bucket) for bucket in daily],
+    }
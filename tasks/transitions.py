@@ -0,0 +1,103 @@
+"""Task review-status transitions – the one place ``Task.status`` changes.
+
+``transition`` moves any number of tasks to a new status as a compare-and-set:
+one ``UPDATE … WHERE pk IN (…) AND status IN (<allowed sources>)``, then one
+``bulk_create`` of their ``ReviewAction`` rows and one meeting-counter refresh.
+Tasks that were no longer in an allowed source status (another reviewer, the
+expiry sweep or a Monday webhook got there first) are reported as ``skipped``
+and left untouched. After the surrounding transaction commits,
+``tasks_transitioned`` is sent once for the whole batch.
+
+Views, admin actions, the expiry sweep, ingest auto-approval, Monday webhooks
+and ``seedactionitems`` all go through here, so a bulk action costs the same
+handful of queries as a single one.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterable
+
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
+
+from . import counters
+from .models import ReviewAction, Task
+
+logger = logging.getLogger(__name__)
+
+# Sent after commit with ``task_ids`` (those that moved), ``status``, ``previous`` (source statuses) and ``user``
+tasks_transitioned = Signal()
+
+REVIEW_ACTIONS = {
+    Task.Status.APPROVED: ReviewAction.Action.APPROVE,
+    Task.Status.REJECTED: ReviewAction.Action.REJECT,
+    Task.Status.EXPIRED: ReviewAction.Action.EXPIRE,
+    Task.Status.PENDING: ReviewAction.Action.EDIT,
+}
+
+# Review decisions only apply to tasks still waiting for one
+FROM_PENDING = (Task.Status.PENDING,)
+
+
+@dataclass
+class TransitionResult:
+    moved: list = field(default_factory=list)  # task ids whose status changed
+    skipped: list = field(default_factory=list)  # ids not in an allowed source status (or missing)
+
+    def __bool__(self) -> bool:
+        return bool(self.moved)
+
+
+def transition(task_ids: Iterable, to: str, *, user=None, reason: str = "",
+               sources: Iterable[str] = FROM_PENDING, now: datetime | None = None) -> TransitionResult:
+    """Move the tasks in ``task_ids`` that are in one of ``sources`` to status ``to``.
+
+    ``reviewed_at`` is stamped (cleared when going back to pending), a rejection
+    stores ``reason`` as ``rejected_reason``, and every moved task gets a
+    ``ReviewAction`` by ``user``. Runs in (or joins) a transaction.
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+    sources = [status for status in sources if status != to]
+    result = TransitionResult()
+    if not task_ids:
+        return result
+    now = now or timezone.now()
+
+    values = {"status": to, "reviewed_at": None if to == Task.Status.PENDING else now, "updated_at": now}
+    if to == Task.Status.REJECTED:
+        values["rejected_reason"] = reason
+
+    with transaction.atomic():
+        candidates = dict(
+            Task.objects.select_for_update()
+            .filter(pk__in=task_ids, status__in=sources)
+            .values_list("pk", "meeting_id")
+        )
+        if candidates:
+            updated = Task.objects.filter(pk__in=list(candidates), status__in=sources).update(**values)
+            if updated != len(candidates):
+                # lost a race between the SELECT and the UPDATE (no row locks on SQLite); our rows carry ``now``
+                candidates = dict(
+                    Task.objects.filter(pk__in=list(candidates), status=to, updated_at=now)
+                    .values_list("pk", "meeting_id")
+                )
+            ReviewAction.objects.bulk_create(
+                ReviewAction(task_id=pk, user=user, action=REVIEW_ACTIONS[to], reason=reason, timestamp=now)
+                for pk in candidates
+            )
+            counters.refresh_meeting_counters(set(candidates.values()))
+
+        result.moved = list(candidates)
+        moved_keys = {str(pk) for pk in candidates}
+        result.skipped = [pk for pk in task_ids if str(pk) not in moved_keys]
+        if result.moved:
+            moved = result.moved
+            transaction.on_commit(lambda: tasks_transitioned.send(
+                sender=Task, task_ids=moved, status=to, previous=sources, user=user
+            ))
+
+    logger.info("Transition → %s: %d moved, %d skipped", to, len(result.moved), len(result.skipped))
+    return result
@@ -1,7 +1,10 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import MeetingViewSet, TaskViewSet, IngestView, reset_password_via_questions
+from .async_views import ActTaskView, ApproveTaskView
+from .live import live_view
+from .views import MeetingViewSet, TaskViewSet, IngestView, AssigneeCountView, StatsView, MondayWebhookView, reset_password_via_questions
 
 app_name = "tasks"
 
@@ -11,6 +14,18 @@ router.register(r"tasks", TaskViewSet, basename="task")
 
 urlpatterns = [
     path("ingest/", IngestView.as_view(), name="ingest"),
+    path("assignees/", AssigneeCountView.as_view(), name="assignee-counts"),
+    path("stats/", StatsView.as_view(), name="stats"),
+    path("monday/webhook/", MondayWebhookView.as_view(), name="monday-webhook"),
     path("reset-password-questions/", reset_password_via_questions, name="reset-password-questions"),
+    # before the router, which would read "live" as a task pk
+    path("tasks/live/", live_view, name="task-live"),
     path("", include(router.urls)),
-] 
\ No newline at end of file
+]
+
+if settings.ASYNC_VIEWS:
+    # ahead of the router so they take over its approve/act routes
+    urlpatterns[:0] = [
+        path("tasks/<uuid:pk>/approve/", ApproveTaskView.as_view(), name="task-approve-async"),
+        path("tasks/<uuid:pk>/act/", ActTaskView.as_view(), name="task-act-async"),
+    ]
@@ -4,9 +4,11 @@ import time
 import logging
 from datetime import datetime
 
+from django.conf import settings
 from django.db import transaction
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -18,14 +20,26 @@ import json
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
 
-from .models import Meeting, Task, ReviewAction, SecurityQuestion, UserSecurityAnswer
+from django.db.models import Count, Exists, Max, OuterRef, Q, Value
+from django.db.models.functions import Coalesce, NullIf
+
+from .models import Meeting, Task, SecurityQuestion, TaskAssignee, UserSecurityAnswer
 from .serializers import (
     MeetingSerializer,
     TaskSerializer,
     TaskActionSerializer,
+    TaskChangeSerializer,
     ReviewActionSerializer,
 )
-from .services import create_monday_item
+from .services import push_task_to_monday
+from .bulk_jobs import submit_push
+from .search import search_tasks
+from . import counters, live, metrics
+from .stats import review_stats
+from .transitions import transition
+from .changes import TokenExpired, changes_since
+from .exports import CSVRenderer, NDJSONRenderer, export_response
+from . import monday_webhooks
 
 logger = logging.getLogger(__name__)
 
@@ -38,10 +52,42 @@ class MeetingViewSet(mixins.RetrieveModelMixin, mixins.ListModelMixin, viewsets.
     permission_classes = [IsAuthenticated]
 
 
+class ReviewConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "This task has already been reviewed."
+    default_code = "already_reviewed"
+
+
+def apply_review(task: Task, new_status: str, *, user=None, reason: str = "", note: str | None = None,
+                 date_expected=None) -> Task:
+    """Move a pending ``task`` to ``new_status`` via ``transitions.transition``.
+
+    Of two concurrent reviewers exactly one wins the compare-and-set; the loser
+    gets ``ReviewConflict`` (409). The winner then writes only the fields the
+    review edits. Shared by ``TaskViewSet`` and the async views.
+    """
+    with transaction.atomic():
+        if not transition([task.pk], new_status, user=user, reason=reason):
+            current = Task.objects.filter(pk=task.pk).values_list("status", flat=True).first()
+            raise ReviewConflict(f"Task {task.pk} is already {current or 'gone'}.")
+        # the row is ours now; re-read it so neither the transition nor a concurrent edit is lost
+        task.refresh_from_db()
+        fields = []
+        if note:
+            task.brief_description += f"\n\n[Edit] {note}"
+            fields.append("brief_description")
+        if date_expected:
+            task.date_expected = date_expected
+            fields.append("date_expected")
+        if fields:
+            task.save(update_fields=fields + ["updated_at"])
+    return task
+
+
 class TaskViewSet(viewsets.ModelViewSet):
     """CRUD + approve/reject for tasks (publicly accessible)."""
 
-    queryset = Task.objects.select_related("meeting").order_by("-meeting__date", "-created_at")
+    queryset = Task.objects.select_related("meeting").order_by("-meeting_date", "-created_at")
     serializer_class = TaskSerializer
     permission_classes = [AllowAny]
     authentication_classes = []  # Disable SessionAuthentication to avoid CSRF for public calls
@@ -51,8 +97,47 @@ class TaskViewSet(viewsets.ModelViewSet):
         status_param = self.request.query_params.get("status")
         if status_param:
             qs = qs.filter(status=status_param)
+        # ?assignee=alice@ (email prefix) or ?assignee=alice (fuzzy name)
+        if assignee := self.request.query_params.get("assignee", "").strip():
+            qs = qs.filter(Exists(TaskAssignee.objects.filter(TaskAssignee.matching(assignee), task=OuterRef("pk"))))
+        # ?q= full-text search, best match first
+        if query := self.request.query_params.get("q"):
+            qs = search_tasks(qs, query)
         return qs
 
+    def perform_create(self, serializer):
+        TaskAssignee.sync([serializer.save()])
+
+    def perform_update(self, serializer):
+        TaskAssignee.sync([serializer.save()])
+
+    @action(methods=["get"], detail=False, url_path="export", renderer_classes=[CSVRenderer, NDJSONRenderer])
+    def export(self, request):
+        """Stream the list endpoint's result (same filters) as ``?format=csv`` (default) or ``ndjson``."""
+        return export_response(self.filter_queryset(self.get_queryset()), request.accepted_renderer.format, request)
+
+    @action(methods=["get"], detail=False, url_path="changes")
+    def changes(self, request):
+        """Tasks created/updated and deleted after ``?since=<token>``, for incremental mirrors."""
+        try:
+            limit = int(request.query_params.get("limit", settings.CHANGES_PAGE_SIZE))
+        except ValueError:
+            return Response({"detail": "limit must be an integer"}, status=400)
+        if not 1 <= limit <= settings.CHANGES_MAX_PAGE_SIZE:
+            return Response({"detail": f"limit must be between 1 and {settings.CHANGES_MAX_PAGE_SIZE}"}, status=400)
+        try:
+            page = changes_since(request.query_params.get("since") or None, limit)
+        except ValueError:
+            return Response({"detail": "since is not a valid change token"}, status=400)
+        except TokenExpired:
+            return Response({"detail": "Change token expired; sync again without since."}, status=410)
+        return Response({
+            "upserted": TaskChangeSerializer(page.upserted, many=True, context={"request": request}).data,
+            "deleted": [{"id": stone.task_id, "deleted_at": stone.deleted_at} for stone in page.deleted],
+            "next": page.next_token,
+            "has_more": page.has_more,
+        })
+
     @action(methods=["post"], detail=True, url_path="act")
     def act(self, request, pk=None):  # type: ignore[override]
         """Approve, reject, or edit a task with 5-second confirmation window."""
@@ -77,43 +162,19 @@ class TaskViewSet(viewsets.ModelViewSet):
         # Optional sleep to allow front-end confirmation countdown (defensive)
         time.sleep(1)  # noqa: S311 – brief delay, not blocking worker significantly
 
-        with transaction.atomic():
-            action = data["action"]
-            reason = data.get("reason", "")
-
-            # Handle brief_description append and date change
-            new_desc = data.get("new_brief_description") or data.get("description")
-            if new_desc:
-                task.brief_description += f"\n\n[Edit] {new_desc}"
-
-            if date := data.get("new_date_expected"):
-                task.date_expected = date
-
-            if action == "approve":
-                task.status = Task.Status.APPROVED
-                task.reviewed_at = timezone.now()
-            else:
-                task.status = Task.Status.REJECTED
-                task.reviewed_at = timezone.now()
-                task.rejected_reason = reason
-
-            task.save()
-
-            # Log action
-            ReviewAction.objects.create(
-                task=task,
-                user=request.user if request.user.is_authenticated else None,
-                action=ReviewAction.Action.APPROVE if action == "approve" else ReviewAction.Action.REJECT,
-                reason=reason,
-            )
+        action = data["action"]
+        task = self._review(
+            task,
+            Task.Status.APPROVED if action == "approve" else Task.Status.REJECTED,
+            reason=data.get("reason", ""),
+            note=data.get("new_brief_description") or data.get("description"),
+            date_expected=data.get("new_date_expected"),
+        )
 
         # On approval, push to Monday.com if not already pushed
         if task.status == Task.Status.APPROVED and not task.monday_item_id:
-            item_id = create_monday_item(task)
+            item_id = push_task_to_monday(task)
             if item_id:
-                task.monday_item_id = item_id
-                task.posted_to_monday = True
-                task.save(update_fields=["monday_item_id", "posted_to_monday"])
                 logger.info(f"Task {task.id} successfully sent to Monday.com with item_id={item_id}")
             else:
                 logger.error(f"Failed to send task {task.id} to Monday.com")
@@ -135,26 +196,12 @@ class TaskViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_202_ACCEPTED,
             )
             
-        # Process the approval
-        with transaction.atomic():
-            task.status = Task.Status.APPROVED
-            task.reviewed_at = timezone.now()
-            task.save()
-            
-            # Log action
-            ReviewAction.objects.create(
-                task=task,
-                user=request.user if request.user.is_authenticated else None,
-                action=ReviewAction.Action.APPROVE,
-            )
-            
+        task = self._review(task, Task.Status.APPROVED)
+
         # Send to Monday.com
         if not task.monday_item_id:
-            item_id = create_monday_item(task)
+            item_id = push_task_to_monday(task)
             if item_id:
-                task.monday_item_id = item_id
-                task.posted_to_monday = True
-                task.save(update_fields=["monday_item_id", "posted_to_monday"])
                 logger.info(f"Task {task.id} successfully sent to Monday.com with item_id={item_id}")
             else:
                 logger.error(f"Failed to send task {task.id} to Monday.com")
@@ -192,23 +239,14 @@ class TaskViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_202_ACCEPTED,
             )
             
-        # Process the rejection
-        with transaction.atomic():
-            task.status = Task.Status.REJECTED
-            task.reviewed_at = timezone.now()
-            task.rejected_reason = reason
-            task.save()
-            
-            # Log action
-            ReviewAction.objects.create(
-                task=task,
-                user=request.user if request.user.is_authenticated else None,
-                action=ReviewAction.Action.REJECT,
-                reason=reason,
-            )
-            
+        task = self._review(task, Task.Status.REJECTED, reason=reason)
+
         return Response(TaskSerializer(task, context={"request": request}).data)
 
+    def _review(self, task: Task, new_status: str, **edits) -> Task:
+        user = self.request.user if self.request.user.is_authenticated else None
+        return apply_review(task, new_status, user=user, **edits)
+
     @action(methods=["patch"], detail=True, url_path="edit")
     def edit(self, request, pk=None):
         return self._handle_edit(request, pk)
@@ -226,19 +264,23 @@ class TaskViewSet(viewsets.ModelViewSet):
         serializer = TaskActionSerializer(data={"action": "approve", **request.data})
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
+        fields = ["updated_at"]
         new_desc = data.get("new_brief_description") or data.get("description")
         if new_desc:
             task.brief_description = new_desc
+            fields.append("brief_description")
         if date := data.get("new_date_expected"):
             task.date_expected = date
-        task.save()
+            fields.append("date_expected")
+        # only the edited columns, so a concurrent review's status change is not overwritten
+        task.save(update_fields=fields)
         return Response(TaskSerializer(task, context={"request": request}).data)
 
 
 class ApprovedPublicViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     """Public-facing read-only endpoint for approved tasks (no auth)."""
 
-    queryset = Task.objects.filter(status=Task.Status.APPROVED).select_related("meeting").order_by("-meeting__date", "-created_at")
+    queryset = Task.objects.filter(status=Task.Status.APPROVED).select_related("meeting").order_by("-meeting_date", "-created_at")
     serializer_class = TaskSerializer
     permission_classes = [AllowAny]
 
@@ -266,119 +308,235 @@ class IngestView(APIView):
             
         created = 0
         updated = 0
+        unchanged = 0
+        touched: list[Task] = []  # tasks whose assignee rows need rebuilding
         
-        for t in tasks_data:
-            meeting_id = t.get("meeting_id")
-            if not meeting_id:
-                continue
+        # Meeting counters are refreshed once per meeting when the block exits
+        with counters.deferred():
+            for t in tasks_data:
+                meeting_id = t.get("meeting_id")
+                if not meeting_id:
+                    continue
                 
-            # Get or create the meeting
-            meeting_date = timezone.now()
-            if 'meeting_date' in payload:
-                try:
-                    # Convert from milliseconds timestamp to datetime
-                    if isinstance(payload['meeting_date'], str) and payload['meeting_date'].isdigit():
-                        meeting_date = datetime.fromtimestamp(int(payload['meeting_date']) / 1000, tz=timezone.utc)
-                    elif isinstance(payload['meeting_date'], int):
-                        meeting_date = datetime.fromtimestamp(payload['meeting_date'] / 1000, tz=timezone.utc)
-                except (ValueError, TypeError):
-                    pass
+                # Get or create the meeting
+                meeting_date = timezone.now()
+                if 'meeting_date' in payload:
+                    try:
+                        # Convert from milliseconds timestamp to datetime
+                        if isinstance(payload['meeting_date'], str) and payload['meeting_date'].isdigit():
+                            meeting_date = datetime.fromtimestamp(int(payload['meeting_date']) / 1000, tz=timezone.utc)
+                        elif isinstance(payload['meeting_date'], int):
+                            meeting_date = datetime.fromtimestamp(payload['meeting_date'] / 1000, tz=timezone.utc)
+                    except (ValueError, TypeError):
+                        pass
             
-            # Parse generated_at if available
-            generated_at = None
-            if 'generated_at' in payload:
-                try:
-                    generated_at = datetime.fromisoformat(payload['generated_at'].replace('Z', '+00:00'))
-                except (ValueError, TypeError, AttributeError):
-                    pass
-
-            meeting_obj, _ = Meeting.objects.get_or_create(
-                meeting_id=meeting_id,
-                defaults={
-                    "title": t.get("meeting_title", "Untitled"),
-                    "organizer_email": t.get("meeting_organizer", "unknown@example.com"),
-                    "date": meeting_date,
-                    "execution_id": payload.get("execution_id"),
-                    "generated_at": generated_at,
-                },
-            )
+                # Parse generated_at if available
+                generated_at = None
+                if 'generated_at' in payload:
+                    try:
+                        generated_at = datetime.fromisoformat(payload['generated_at'].replace('Z', '+00:00'))
+                    except (ValueError, TypeError, AttributeError):
+                        pass
+
+                meeting_obj, _ = Meeting.objects.get_or_create(
+                    meeting_id=meeting_id,
+                    defaults={
+                        "title": t.get("meeting_title", "Untitled"),
+                        "organizer_email": t.get("meeting_organizer", "unknown@example.com"),
+                        "date": meeting_date,
+                        "execution_id": payload.get("execution_id"),
+                        "generated_at": generated_at,
+                    },
+                )
             
-            # Update meeting with execution_id and generated_at if they weren't set before
-            if (payload.get("execution_id") and not meeting_obj.execution_id) or \
-               (generated_at and not meeting_obj.generated_at):
-                meeting_obj.execution_id = payload.get("execution_id", meeting_obj.execution_id)
-                if generated_at:
-                    meeting_obj.generated_at = generated_at
-                meeting_obj.save(update_fields=['execution_id', 'generated_at'])
+                # Update meeting with execution_id and generated_at if they weren't set before
+                if (payload.get("execution_id") and not meeting_obj.execution_id) or \
+                   (generated_at and not meeting_obj.generated_at):
+                    meeting_obj.execution_id = payload.get("execution_id", meeting_obj.execution_id)
+                    if generated_at:
+                        meeting_obj.generated_at = generated_at
+                    meeting_obj.save(update_fields=['execution_id', 'generated_at'])
             
-            # Try to find an existing task
-            task_item = t.get("task_item")
-            existing_task = Task.objects.filter(
-                meeting=meeting_obj, 
-                task_item=task_item
-            ).first()
+                # Try to find an existing task
+                task_item = t.get("task_item")
+                existing_task = Task.objects.filter(
+                    meeting=meeting_obj, 
+                    task_item=task_item
+                ).order_by("-created_at").first()
             
-            if existing_task:
-                # Update the existing task with new data
-                existing_task.assignee_names = t.get("assignee(s)_full_names", existing_task.assignee_names)
-                existing_task.assignee_emails = t.get("assignee_emails", existing_task.assignee_emails)
-                existing_task.priority = t.get("priority", existing_task.priority)
-                existing_task.brief_description = t.get("brief_description", existing_task.brief_description)
+                if existing_task:
+                    tracked = ("assignee_names", "assignee_emails", "priority", "brief_description",
+                               "date_expected", "source_payload", "auto_approved")
+                    before = [getattr(existing_task, f) for f in tracked]
+
+                    # Update the existing task with new data
+                    existing_task.assignee_names = t.get("assignee(s)_full_names", existing_task.assignee_names)
+                    existing_task.assignee_emails = t.get("assignee_emails", existing_task.assignee_emails)
+                    existing_task.priority = t.get("priority", existing_task.priority)
+                    existing_task.brief_description = t.get("brief_description", existing_task.brief_description)
                 
-                # Handle date_expected parsing
-                if t.get("date_expected"):
-                    try:
-                        # Try standard ISO format
-                        date_expected = datetime.strptime(t.get("date_expected"), '%Y-%m-%d').date()
-                        existing_task.date_expected = date_expected
-                    except ValueError:
+                    # Handle date_expected parsing
+                    if t.get("date_expected"):
                         try:
-                            # Try human-readable format
-                            date_expected = datetime.strptime(t.get("date_expected"), '%B %d, %Y').date()
+                            # Try standard ISO format
+                            date_expected = datetime.strptime(t.get("date_expected"), '%Y-%m-%d').date()
                             existing_task.date_expected = date_expected
                         except ValueError:
-                            # Keep existing date if parsing fails
-                            pass
+                            try:
+                                # Try human-readable format
+                                date_expected = datetime.strptime(t.get("date_expected"), '%B %d, %Y').date()
+                                existing_task.date_expected = date_expected
+                            except ValueError:
+                                # Keep existing date if parsing fails
+                                pass
                 
-                existing_task.source_payload = t
+                    existing_task.source_payload = t
                 
-                # Only update auto_approved if it's explicitly set in the payload
-                if t.get("approved") is not None:
-                    existing_task.auto_approved = t.get("approved")
-                    
-                existing_task.save()
-                updated += 1
-                logger.info(f"Updated task: {task_item[:50]}...")
-            else:
-                # Create a new task
-                date_expected = timezone.now().date()
-                if t.get("date_expected"):
-                    try:
-                        # Try standard ISO format
-                        date_expected = datetime.strptime(t.get("date_expected"), '%Y-%m-%d').date()
-                    except ValueError:
+                    # Only update auto_approved if it's explicitly set in the payload
+                    if t.get("approved") is not None:
+                        existing_task.auto_approved = t.get("approved")
+
+                    # Re-sent payloads are common; skip the write when nothing changed
+                    if [getattr(existing_task, f) for f in tracked] == before:
+                        unchanged += 1
+                        continue
+
+                    existing_task.save()
+                    touched.append(existing_task)
+                    updated += 1
+                    logger.debug("Updated task %s", existing_task.id)
+                else:
+                    # Create a new task
+                    date_expected = timezone.now().date()
+                    if t.get("date_expected"):
                         try:
-                            # Try human-readable format
-                            date_expected = datetime.strptime(t.get("date_expected"), '%B %d, %Y').date()
+                            # Try standard ISO format
+                            date_expected = datetime.strptime(t.get("date_expected"), '%Y-%m-%d').date()
                         except ValueError:
-                            # Keep default if parsing fails
-                            pass
+                            try:
+                                # Try human-readable format
+                                date_expected = datetime.strptime(t.get("date_expected"), '%B %d, %Y').date()
+                            except ValueError:
+                                # Keep default if parsing fails
+                                pass
                 
-                task_obj = Task.objects.create(
-                    meeting=meeting_obj,
-                    task_item=task_item,
-                    assignee_names=t.get("assignee(s)_full_names", ""),
-                    assignee_emails=t.get("assignee_emails", ""),
-                    priority=t.get("priority", Task.Priority.MEDIUM),
-                    brief_description=t.get("brief_description", ""),
-                    date_expected=date_expected,
-                    source_payload=t,
-                    auto_approved=t.get("approved", False)
-                )
-                created += 1
-                logger.info(f"Created task: {task_item[:50]}...")
+                    task_obj = Task.objects.create(
+                        meeting=meeting_obj,
+                        task_item=task_item,
+                        assignee_names=t.get("assignee(s)_full_names", ""),
+                        assignee_emails=t.get("assignee_emails", ""),
+                        priority=t.get("priority", Task.Priority.MEDIUM),
+                        brief_description=t.get("brief_description", ""),
+                        date_expected=date_expected,
+                        source_payload=t,
+                        auto_approved=t.get("approved", False)
+                    )
+                    touched.append(task_obj)
+                    created += 1
+                    logger.debug("Created task %s", task_obj.id)
+
+        TaskAssignee.sync(touched)
+        auto_approved = self._auto_approve(touched) if settings.INGEST_AUTO_APPROVE else 0
+        logger.info("Ingest finished: created=%d updated=%d unchanged=%d auto_approved=%d",
+                    created, updated, unchanged, auto_approved)
+        metrics.INGEST_TASKS.labels("created").inc(created)
+        metrics.INGEST_TASKS.labels("updated").inc(updated)
+        metrics.INGEST_TASKS.labels("unchanged").inc(unchanged)
+        metrics.INGEST_TASKS.labels("auto_approved").inc(auto_approved)
+        return Response({"created": created, "updated": updated, "unchanged": unchanged,
+                         "auto_approved": auto_approved})
+
+    @staticmethod
+    def _auto_approve(tasks: list[Task]) -> int:
+        """Approve pending tasks n8n flagged ``approved`` and queue their Monday.com push.
+
+        Keeps them out of the reviewer queue. The push runs as a ``BulkJob``
+        (``bulk_jobs.submit_push``) so n8n is not held up by Monday.com.
+        """
+        candidates = [t for t in tasks if t.auto_approved and t.status == Task.Status.PENDING]
+        if not candidates:
+            return 0
+        with transaction.atomic():
+            moved = transition([t.pk for t in candidates], Task.Status.APPROVED, reason="Auto-approved at ingest").moved
+            if moved:
+                submit_push(moved)
+        return len(moved)
 
-        return Response({"created": created, "updated": updated})
+
+class AssigneeCountView(APIView):
+    """Task counts per assignee, busiest first.
+
+    Assignees are told apart by email; those without one, by name. ``?q=``
+    matches like the task list's ``?assignee=``.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request, *args, **kwargs):
+        rows = TaskAssignee.objects.all()
+        if query := request.query_params.get("q", "").strip():
+            rows = rows.filter(TaskAssignee.matching(query))
+        rows = (
+            rows.annotate(person=Coalesce(NullIf("email", Value("")), "name"))
+            .values("person")
+            .annotate(
+                email=Max("email"),
+                name=Max("name"),
+                total=Count("task"),
+                pending=Count("task", filter=Q(task__status=Task.Status.PENDING)),
+                approved=Count("task", filter=Q(task__status=Task.Status.APPROVED)),
+                rejected=Count("task", filter=Q(task__status=Task.Status.REJECTED)),
+            )
+            .order_by("-total", "person")
+            .values("email", "name", "total", "pending", "approved", "rejected")
+        )
+        return Response(list(rows[:500]))
+
+
+class MondayWebhookView(APIView):
+    """Receiver for Monday.com board webhooks (status changes, item deletions).
+
+    Answers the subscription challenge, verifies the signature against
+    ``MONDAY_WEBHOOK_SECRET``, queues the event and applies queued events once
+    the request commits. Without a secret, events are refused unless ``DEBUG``.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def post(self, request, *args, **kwargs):
+        if "challenge" in request.data:
+            return Response({"challenge": request.data["challenge"]})
+        secret = settings.MONDAY_WEBHOOK_SECRET
+        if not secret:
+            if not settings.DEBUG:
+                logger.error("Rejected Monday webhook: MONDAY_WEBHOOK_SECRET is not set")
+                return Response({"detail": "webhook signing secret not configured"}, status=403)
+        elif not monday_webhooks.verify_signature(request.headers.get("Authorization", ""), secret):
+            logger.warning("Rejected Monday webhook with an invalid signature")
+            return Response({"detail": "invalid signature"}, status=401)
+
+        queued = monday_webhooks.enqueue(request.data.get("event") or {})
+        if queued:
+            transaction.on_commit(monday_webhooks.apply_pending_events)
+        return Response({"queued": queued})
+
+
+class StatsView(APIView):
+    """Review throughput for the manager dashboard: ``?days=`` (default 30) of daily,
+    weekly and total figures. See ``tasks.stats`` for how buckets are cached."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            days = int(request.query_params.get("days", 30))
+        except ValueError:
+            return Response({"detail": "days must be an integer"}, status=400)
+        if not 1 <= days <= settings.STATS_MAX_DAYS:
+            return Response({"detail": f"days must be between 1 and {settings.STATS_MAX_DAYS}"}, status=400)
+        return Response(review_stats(days))
 
 
 class HomeView(TemplateView):
@@ -397,12 +555,19 @@ class PublicActionItemView(ListView):
         # Get status filter from query params, default to showing only pending tasks
         status_filter = self.request.GET.get('status', Task.Status.PENDING)
         
+        # Pending tasks are only shown inside their review window
+        tasks = Task.objects.exclude(status=Task.Status.PENDING, expires_at__lte=timezone.now())
+
         # If "all" is specified, show all tasks
         if status_filter == 'all':
-            return Task.objects.select_related("meeting").order_by("-meeting__date", "-created_at")
+            return tasks.select_related("meeting").order_by("-meeting_date", "-created_at")
         
         # Otherwise filter by the specified status
-        return Task.objects.filter(status=status_filter).select_related("meeting").order_by("-meeting__date", "-created_at")
+        return tasks.filter(status=status_filter).select_related("meeting").order_by("-meeting_date", "-created_at")
+
+    def get_context_data(self, **kwargs):
+        # The live feed starts here, so nothing between render and connect is missed
+        return super().get_context_data(live_since=live.start_token(), **kwargs)
 
 
 @csrf_exempt
@@ -0,0 +1,28 @@
+"""Fixtures shared across the test modules."""
+import pytest
+from django.utils import timezone
+
+from tasks.models import Meeting, Task
+
+
+@pytest.fixture()
+def make_tasks(db):
+    """``make_tasks(n, age=None, **fields)``: ``n`` tasks on one meeting.
+
+    ``age`` backdates ``updated_at`` by that much, e.g. so ``/api/tasks/changes/``
+    treats the rows as settled.
+    """
+    meeting = Meeting.objects.create(meeting_id="shared", title="Shared", organizer_email="o@example.com",
+                                     date=timezone.now())
+
+    def make(n, age=None, **fields):
+        tasks = [
+            Task.objects.create(meeting=meeting, task_item=f"Task {i}", brief_description="d",
+                                date_expected=timezone.now().date(), **fields)
+            for i in range(n)
+        ]
+        if age is not None:
+            Task.objects.filter(pk__in=[t.pk for t in tasks]).update(updated_at=timezone.now() - age)
+        return tasks
+
+    return make
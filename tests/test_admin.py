@@ -0,0 +1,181 @@
+import re
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.models import Meeting, Task
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture()
+def meetings():
+    now = timezone.now()
+    created = []
+    for i in range(30):
+        meeting = Meeting.objects.create(
+            meeting_id=f"mtg-{i:02d}",
+            title=f"Sync {i:02d}",
+            organizer_email=f"owner{i:02d}@example.com",
+            date=now - timedelta(days=i),
+            execution_id=f"exec-{i:02d}",
+        )
+        Task.objects.create(meeting=meeting, task_item=f"Task {i}", brief_description="x", date_expected=now.date())
+        created.append(meeting)
+    return created
+
+
+@pytest.mark.django_db
+def test_changelist_filters_are_bounded(admin_client, meetings, settings):
+    settings.ADMIN_FILTER_LOOKUP_LIMIT = 5
+    resp = admin_client.get(reverse("admin:tasks_actionitem_changelist"))
+    assert resp.status_code == 200
+    body = resp.content.decode()
+    assert "?organizer=owner00%40example.com" in body
+    assert "?organizer=owner10%40example.com" not in body
+    assert body.count("?organizer=") == 5
+
+
+@pytest.mark.django_db
+def test_changelist_keeps_selected_value_outside_top_n(admin_client, meetings, settings):
+    settings.ADMIN_FILTER_LOOKUP_LIMIT = 5
+    url = reverse("admin:tasks_actionitem_changelist") + "?organizer=owner20@example.com"
+    body = admin_client.get(url).content.decode()
+    assert "owner20@example.com" in body
+
+
+@pytest.mark.django_db
+def test_filter_lookups_are_cached_and_invalidated(admin_client, meetings):
+    url = reverse("admin:tasks_actionitem_changelist")
+    admin_client.get(url)
+    assert cache.get("admin-filter-lookups:organizer")
+    Meeting.objects.create(meeting_id="new", title="New", organizer_email="new@example.com", date=timezone.now())
+    assert cache.get("admin-filter-lookups:organizer") is None
+
+
+@pytest.mark.django_db
+def test_filter_autocomplete_endpoint(admin_client, meetings):
+    url = reverse("admin:filter_lookup", args=["organizer"])
+    data = admin_client.get(url, {"term": "owner2"}).json()
+    assert [r["value"] for r in data["results"]][:2] == ["owner20@example.com", "owner21@example.com"]
+
+    data = admin_client.get(reverse("admin:filter_lookup", args=["meeting"]), {"term": "Sync 29"}).json()
+    assert data["results"][0]["value"] == str(meetings[29].pk)
+
+    assert admin_client.get(reverse("admin:filter_lookup", args=["bogus"]), {"term": "x"}).status_code == 404
+
+
+def _changelist_queries(admin_client):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = admin_client.get(reverse("admin:tasks_actionitem_changelist"))
+    assert resp.status_code == 200
+    return len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_changelist_query_count_independent_of_rows(admin_client, meetings):
+    _changelist_queries(admin_client)  # warm the filter lookup cache
+    baseline = _changelist_queries(admin_client)
+    meeting = meetings[0]
+    for i in range(20):
+        Task.objects.create(meeting=meeting, task_item=f"Extra {i}", brief_description="x",
+                            date_expected=timezone.now().date())
+    assert _changelist_queries(admin_client) == baseline
+
+
+@pytest.mark.django_db
+def test_estimated_count_used_only_for_unfiltered_large_tables(monkeypatch, settings, meetings):
+    from tasks.admin import EstimatedCountPaginator
+
+    settings.ADMIN_ESTIMATED_COUNT_THRESHOLD = 1000
+    monkeypatch.setattr(EstimatedCountPaginator, "_estimated_rows", staticmethod(lambda qs: 50000))
+    assert EstimatedCountPaginator(Task.objects.all(), 50).count == 50000
+    assert EstimatedCountPaginator(Task.objects.filter(status="pending"), 50).count == 30
+
+    monkeypatch.setattr(EstimatedCountPaginator, "_estimated_rows", staticmethod(lambda qs: None))
+    assert EstimatedCountPaginator(Task.objects.all(), 50).count == 30
+
+
+@pytest.mark.django_db
+def test_bulk_decline_whole_changelist_is_set_based(admin_client, meetings):
+    from django.contrib.admin.models import LogEntry
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from tasks.models import ReviewAction
+
+    Task.objects.filter(meeting=meetings[0]).update(status=Task.Status.APPROVED)
+    url = reverse("admin:tasks_actionitem_changelist")
+    # "select all N" still posts the ticked rows of the visible page
+    page = [str(pk) for pk in Task.objects.values_list("pk", flat=True)[:5]]
+    data = {"action": "decline_tasks", "select_across": "1", "index": "0", "_selected_action": page}
+
+    resp = admin_client.post(url, data)
+    assert resp.status_code == 200
+    assert resp.context["total"] == 29
+
+    with CaptureQueriesContext(connection) as queries:
+        resp = admin_client.post(url, {**data, "confirm": "yes"})
+    assert resp.status_code == 302
+    assert Task.objects.filter(status=Task.Status.REJECTED, rejected_reason="Declined by admin").count() == 29
+    assert ReviewAction.objects.filter(action=ReviewAction.Action.REJECT).count() == 29
+    assert LogEntry.objects.filter(change_message="Bulk Rejected: Declined by admin").count() == 29
+    writes = sorted(re.match(r'(?:UPDATE|INSERT INTO) "(\w+)"', q["sql"]).group(1)
+                    for q in queries.captured_queries if q["sql"].startswith(("UPDATE", "INSERT")))
+    # one statement per table, however many tasks; tasks_pagelog is the request-logging middleware
+    assert [t for t in writes if t != "tasks_pagelog"] == [
+        "django_admin_log", "tasks_meeting", "tasks_reviewaction", "tasks_task",
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("view", ["approve_task", "reject_task"])
+def test_single_review_that_loses_the_race_changes_nothing(admin_client, meetings, monkeypatch, view):
+    from unittest.mock import patch
+
+    from tasks import admin as task_admin
+    from tasks.transitions import transition
+
+    task = Task.objects.get(meeting=meetings[0])
+
+    def expired_meanwhile(*args, **kwargs):
+        transition([task.pk], Task.Status.EXPIRED, reason="Expired")
+        return transition(*args, **kwargs)
+
+    monkeypatch.setattr(task_admin, "transition", expired_meanwhile)
+    with patch("tasks.services.push_task_to_monday") as push:
+        resp = admin_client.post(reverse(f"admin:{view}", args=[task.pk]), {"confirm": "yes"}, follow=True)
+    push.assert_not_called()
+    task.refresh_from_db()
+    assert task.status == Task.Status.EXPIRED
+    assert [str(m) for m in resp.context["messages"]] == [
+        f"Task '{task.task_item}' was reviewed by someone else in the meantime."
+    ]
+
+
+@pytest.mark.django_db
+def test_single_approval_pushes_after_approving(admin_client, meetings):
+    from unittest.mock import patch
+
+    task = Task.objects.get(meeting=meetings[0])
+
+    def push(pushed):
+        assert Task.objects.get(pk=pushed.pk).status == Task.Status.APPROVED
+        return "item-1"
+
+    with patch("tasks.services.push_task_to_monday", side_effect=push) as mock:
+        admin_client.post(reverse("admin:approve_task", args=[task.pk]), {"confirm": "yes"})
+    mock.assert_called_once()
+    task.refresh_from_db()
+    assert task.status == Task.Status.APPROVED
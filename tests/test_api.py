@@ -26,4 +26,26 @@ def test_public_approved_endpoint(client):
     assert resp.status_code == 200
     data = resp.json()
     assert isinstance(data, list)
-    assert len(data) == 1 
\ No newline at end of file
+    assert len(data) == 1
+
+
+@pytest.mark.django_db
+def test_meeting_list_exposes_counters_without_extra_queries(client):
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    client.force_login(User.objects.create_user(username="viewer", password="pass"))
+    for i in range(3):
+        meeting = Meeting.objects.create(meeting_id=f"c{i}", title="T", organizer_email="x@y.com", date=timezone.now())
+        for status in (Task.Status.PENDING, Task.Status.PENDING, Task.Status.REJECTED):
+            Task.objects.create(meeting=meeting, task_item=f"{status}-{Task.objects.count()}", brief_description="b",
+                                date_expected=timezone.now().date(), status=status)
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.get("/api/meetings/")
+    assert resp.status_code == 200
+    assert not [q for q in ctx.captured_queries if "tasks_task" in q["sql"]]
+    rows = resp.json()
+    rows = rows["results"] if isinstance(rows, dict) else rows
+    assert {(r["pending_count"], r["approved_count"], r["rejected_count"]) for r in rows} == {(2, 0, 1)}
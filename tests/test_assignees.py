@@ -0,0 +1,64 @@
+import json
+
+import pytest
+from django.urls import reverse
+from tasks.models import Task, TaskAssignee
+
+
+def test_parse_pairs_names_and_emails():
+    assert TaskAssignee.parse("Alice Smith, Bob", "Alice@Example.com, bob@example.com") == [
+        ("Alice Smith", "alice@example.com"),
+        ("Bob", "bob@example.com"),
+    ]
+    assert TaskAssignee.parse("Carol", "") == [("Carol", "")]
+    assert TaskAssignee.parse("", "") == []
+
+
+def _ingest(client, tasks):
+    for t in tasks:
+        t.setdefault("meeting_id", "assignee-m1")
+        t.setdefault("brief_description", "d")
+    return client.post(reverse("tasks:ingest"), data=json.dumps({"monday_tasks": tasks}),
+                       content_type="application/json")
+
+
+@pytest.mark.django_db
+def test_ingest_populates_and_refreshes_assignees(client):
+    _ingest(client, [{"task_item": "Draft plan", "assignee(s)_full_names": "Alice, Bob",
+                      "assignee_emails": "alice@example.com, bob@example.com"}])
+    task = Task.objects.get(task_item="Draft plan")
+    assert sorted(task.assignees.values_list("email", flat=True)) == ["alice@example.com", "bob@example.com"]
+
+    _ingest(client, [{"task_item": "Draft plan", "assignee(s)_full_names": "Carol",
+                      "assignee_emails": "carol@example.com"}])
+    assert list(task.assignees.values_list("name", "email")) == [("Carol", "carol@example.com")]
+
+
+@pytest.mark.django_db
+def test_assignee_filter_and_counts(client):
+    _ingest(client, [
+        {"task_item": "One", "assignee(s)_full_names": "Alice Smith", "assignee_emails": "alice@example.com"},
+        {"task_item": "Two", "assignee(s)_full_names": "Alice Smith, Bob", "assignee_emails": "alice@example.com, bob@example.com"},
+        {"task_item": "Three", "assignee(s)_full_names": "Bob", "assignee_emails": "bob@example.com"},
+    ])
+    Task.objects.filter(task_item="Two").update(status=Task.Status.APPROVED)
+
+    by_email = client.get(reverse("tasks:task-list"), {"assignee": "alice@"}).json()
+    assert sorted(t["task_item"] for t in by_email) == ["One", "Two"]
+    by_name = client.get(reverse("tasks:task-list"), {"assignee": "smith"}).json()
+    assert sorted(t["task_item"] for t in by_name) == ["One", "Two"]
+
+    counts = client.get(reverse("tasks:assignee-counts")).json()
+    alice = next(row for row in counts if row["email"] == "alice@example.com")
+    assert (alice["name"], alice["total"], alice["pending"], alice["approved"]) == ("Alice Smith", 2, 1, 1)
+    assert [row["email"] for row in client.get(reverse("tasks:assignee-counts"), {"q": "bob"}).json()] == ["bob@example.com"]
+
+
+@pytest.mark.django_db
+def test_counts_keep_name_only_assignees_apart(client):
+    _ingest(client, [
+        {"task_item": "One", "assignee(s)_full_names": "Dana, Eve", "assignee_emails": ""},
+        {"task_item": "Two", "assignee(s)_full_names": "Dana", "assignee_emails": ""},
+    ])
+    counts = client.get(reverse("tasks:assignee-counts")).json()
+    assert [(row["name"], row["email"], row["total"]) for row in counts] == [("Dana", "", 2), ("Eve", "", 1)]
@@ -0,0 +1,102 @@
+"""Async (ASGI) approve/act/health views, end to end against the Monday.com emulator."""
+import asyncio
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import AsyncClient, AsyncRequestFactory, override_settings
+
+from tasks.async_views import ActTaskView, ApproveTaskView, HealthView
+from tasks.models import MondayPush, PageLog, ReviewAction, Task
+from tasks.monday_emulator import MondayEmulator
+
+BOARD = "9212659997"
+
+rf = AsyncRequestFactory()
+approve = ApproveTaskView.as_view()
+act = ActTaskView.as_view()
+
+
+@pytest.fixture()
+def emulator():
+    with MondayEmulator(seed=1, latency=0.1) as emu, override_settings(MONDAY_API_URL=emu.url, MONDAY_BOARD_ID=BOARD):
+        yield emu
+
+
+async def _approve(task):
+    return await approve(rf.post(f"/api/tasks/{task.pk}/approve/?confirm=true"), pk=task.pk)
+
+
+def test_approve_pushes_to_monday(emulator, make_tasks):
+    [task] = make_tasks(1)
+    resp = async_to_sync(_approve)(task)
+    assert resp.status_code == 200
+    body = json.loads(resp.content)
+    assert body["status"] == Task.Status.APPROVED
+    assert body["monday_item_id"] == emulator.items[BOARD][0]["id"]
+    assert MondayPush.objects.get(pk=task.pk).state == MondayPush.State.DONE
+    assert ReviewAction.objects.filter(task=task, action=ReviewAction.Action.APPROVE).count() == 1
+
+
+def test_second_approve_gets_409(emulator, make_tasks):
+    [task] = make_tasks(1)
+    assert async_to_sync(_approve)(task).status_code == 200
+    resp = async_to_sync(_approve)(task)
+    assert resp.status_code == 409
+    assert "already approved" in json.loads(resp.content)["detail"]
+    assert emulator.stats.items_created == 1
+
+
+def test_approve_without_confirm_is_a_preview(make_tasks):
+    [task] = make_tasks(1)
+    resp = async_to_sync(approve)(rf.post(f"/api/tasks/{task.pk}/approve/"), pk=task.pk)
+    assert resp.status_code == 202
+    task.refresh_from_db()
+    assert task.status == Task.Status.PENDING
+
+
+def test_act_reject_validates_and_applies(make_tasks):
+    [task] = make_tasks(1)
+    url = f"/api/tasks/{task.pk}/act/?confirm=true"
+    resp = async_to_sync(act)(rf.post(url, {"action": "reject"}, content_type="application/json"), pk=task.pk)
+    assert resp.status_code == 400
+
+    reason = "Duplicate of last week's item"
+    resp = async_to_sync(act)(rf.post(url, {"action": "reject", "reason": reason}, content_type="application/json"),
+                              pk=task.pk)
+    assert resp.status_code == 200
+    task.refresh_from_db()
+    assert task.status == Task.Status.REJECTED and task.rejected_reason == reason
+
+
+def test_concurrent_approvals_overlap_monday_calls(emulator, make_tasks):
+    tasks = make_tasks(4)
+
+    async def approve_all():
+        return await asyncio.gather(*(_approve(task) for task in tasks))
+
+    assert [resp.status_code for resp in async_to_sync(approve_all)()] == [200] * 4
+    assert emulator.stats.items_created == 4
+    # the create_item calls were awaited side by side, not one worker thread each in turn
+    assert emulator.stats.max_concurrency > 1
+
+
+def test_health(db, emulator):
+    cache.delete("health_monday")
+    resp = async_to_sync(HealthView.as_view())(rf.get("/health/"))
+    assert resp.status_code == 200
+    body = json.loads(resp.content)
+    assert body["database"] == "ok" and body["monday"]["api_status"] == "ok"
+
+
+def test_middleware_stack_runs_async(db):
+    cache.set("health_monday", {"token_present": True, "api_status": "ok"}, 60)
+
+    async def get():
+        return await AsyncClient().get("/health/", headers={"X-Request-ID": "req-async-1"})
+
+    resp = async_to_sync(get)()
+    assert resp.status_code == 200
+    assert resp["X-Request-ID"] == "req-async-1"
+    assert PageLog.objects.filter(path="/health/", status_code=200).exists()
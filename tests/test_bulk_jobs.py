@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.bulk_jobs import run_job, submit_bulk_approve, submit_push
+from tasks.models import BulkJob, Meeting, ReviewAction, Task
+
+
+@pytest.fixture(autouse=True)
+def _no_threads(settings, monkeypatch):
+    settings.BULK_JOBS_IN_THREAD = False
+    pushed = []
+    monkeypatch.setattr("tasks.bulk_jobs.push_tasks_to_monday", lambda ids: pushed.extend(ids) or len(ids))
+    return pushed
+
+
+@pytest.fixture()
+def tasks(db):
+    meeting = Meeting.objects.create(meeting_id="bulk", title="Bulk", organizer_email="o@example.com", date=timezone.now())
+    return [Task.objects.create(meeting=meeting, task_item=f"Task {i}", brief_description="d",
+                                date_expected=timezone.now().date()) for i in range(7)]
+
+
+def test_job_runs_in_chunks(tasks, _no_threads):
+    Task.objects.filter(pk=tasks[0].pk).update(status=Task.Status.REJECTED)
+    job = submit_bulk_approve([t.pk for t in tasks])
+    job = run_job(job.pk, chunk_size=3)
+    assert (job.state, job.cursor, job.approved, job.skipped, job.pushed) == (BulkJob.State.DONE, 7, 6, 1, 7)
+    assert Task.objects.filter(status=Task.Status.APPROVED).count() == 6
+    assert ReviewAction.objects.filter(action=ReviewAction.Action.APPROVE).count() == 6
+    assert len(_no_threads) == 7
+
+
+def test_stale_job_resumes_from_cursor(tasks):
+    job = submit_bulk_approve([t.pk for t in tasks])
+    # a worker approved the first three, then died
+    Task.objects.filter(pk__in=[t.pk for t in tasks[:3]]).update(status=Task.Status.APPROVED)
+    BulkJob.objects.filter(pk=job.pk).update(state=BulkJob.State.RUNNING, cursor=3, approved=3,
+                                             heartbeat_at=timezone.now() - timedelta(hours=1))
+    assert run_job(job.pk) is not None
+    job.refresh_from_db()
+    assert (job.state, job.cursor, job.approved) == (BulkJob.State.DONE, 7, 7)
+    assert ReviewAction.objects.count() == 4
+
+
+def test_live_job_is_not_taken_over(tasks):
+    job = submit_bulk_approve([t.pk for t in tasks])
+    BulkJob.objects.filter(pk=job.pk).update(state=BulkJob.State.RUNNING, heartbeat_at=timezone.now())
+    assert run_job(job.pk) is None
+    call_command("run_bulk_jobs")
+    job.refresh_from_db()
+    assert job.cursor == 0
+
+
+def test_admin_bulk_approve_submits_job(admin_client, tasks):
+    url = reverse("admin:tasks_actionitem_changelist")
+    resp = admin_client.post(url, {"action": "approve_send_to_monday", "select_across": "1", "index": "0",
+                                   "_selected_action": [str(tasks[0].pk)], "confirm": "yes"})
+    job = BulkJob.objects.get()
+    assert resp.status_code == 302 and resp.url == reverse("admin:bulk_job_progress", args=[job.pk])
+    assert job.total == 7 and job.state == BulkJob.State.QUEUED
+
+    call_command("run_bulk_jobs")
+    status = admin_client.get(reverse("admin:bulk_job_status", args=[job.pk])).json()
+    assert (status["state"], status["percent"], status["approved"]) == ("done", 100, 7)
+    assert admin_client.get(resp.url).status_code == 200
+
+
+def test_push_job_only_pushes(tasks, _no_threads):
+    job = submit_push([t.pk for t in tasks[:4]])
+    job = run_job(job.pk, chunk_size=3)
+    assert (job.state, job.cursor, job.approved, job.pushed) == (BulkJob.State.DONE, 4, 0, 4)
+    assert not ReviewAction.objects.exists()
+    assert len(_no_threads) == 4
@@ -0,0 +1,79 @@
+"""Delta sync: GET /api/tasks/changes/?since=<token>."""
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tasks.changes import SETTLE, changes_since, encode_token
+from tasks.models import Task, TaskTombstone
+
+URL = reverse("tasks:task-changes")
+# older than the window the feed holds back
+SETTLED = timedelta(minutes=10)
+
+
+@pytest.fixture()
+def api():
+    return APIClient()
+
+
+def _sync(api, since=None, **params):
+    params = {**params, **({"since": since} if since else {})}
+    resp = api.get(URL, params)
+    assert resp.status_code == 200, resp.content
+    return resp.json()
+
+
+def test_full_sync_then_only_changes(api, make_tasks):
+    tasks = make_tasks(5, age=SETTLED)
+    ids, token, pages = set(), None, 0
+    while True:
+        body = _sync(api, token, limit=2)
+        ids |= {task["id"] for task in body["upserted"]}
+        token, pages = body["next"], pages + 1
+        if not body["has_more"]:
+            break
+    assert ids == {str(t.pk) for t in tasks} and pages == 3
+    # meetings change without bumping their tasks, so mirrors only get the id
+    assert body["upserted"][0]["meeting_id"] == str(tasks[0].meeting_id) and "meeting" not in body["upserted"][0]
+
+    # nothing new: empty page, and the token never goes backwards
+    body = _sync(api, token)
+    assert body["upserted"] == [] and body["deleted"] == []
+    assert body["next"] >= token
+
+    changed, gone = tasks[0], tasks[1]
+    Task.objects.filter(pk=changed.pk).update(status=Task.Status.APPROVED, updated_at=timezone.now())
+    Task.objects.get(pk=gone.pk).delete()
+    assert TaskTombstone.objects.filter(pk=gone.pk).exists()
+
+    # once those writes have settled, the next sync returns exactly them
+    page = changes_since(token, 100, now=timezone.now() + SETTLE * 2)
+    assert [(t.pk, t.status) for t in page.upserted] == [(changed.pk, Task.Status.APPROVED)]
+    assert [stone.task_id for stone in page.deleted] == [gone.pk]
+
+
+def test_unsettled_changes_wait_for_the_next_sync(api, make_tasks):
+    [task] = make_tasks(1)
+    assert _sync(api)["upserted"] == []
+    later = timezone.now() + SETTLE * 2
+    assert [t.pk for t in changes_since(None, 10, now=later).upserted] == [task.pk]
+
+
+def test_page_cost_does_not_grow_with_the_table(make_tasks, django_assert_num_queries):
+    make_tasks(30, age=SETTLED)
+    token = changes_since(None, 1000).next_token
+    make_tasks(2)
+    with django_assert_num_queries(2):  # one range scan per table
+        page = changes_since(token, 1000, now=timezone.now() + SETTLE * 2)
+    assert len(page.upserted) == 2
+
+
+def test_bad_and_expired_tokens(api, db, settings):
+    assert api.get(URL, {"since": "yesterday"}).status_code == 400
+    assert api.get(URL, {"limit": 0}).status_code == 400
+    old = timezone.now() - timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS + 1)
+    resp = api.get(URL, {"since": encode_token(old, Task._meta.pk.default())})
+    assert resp.status_code == 410
@@ -0,0 +1,106 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.models import Meeting, ReviewAction, Task
+
+
+@pytest.fixture()
+def meeting():
+    return Meeting.objects.create(meeting_id="exp", title="Expiry", organizer_email="o@example.com", date=timezone.now())
+
+
+def _task(meeting, name, hours_ago=0, **fields):
+    task = Task.objects.create(meeting=meeting, task_item=name, brief_description="d",
+                               date_expected=timezone.now().date(), **fields)
+    if hours_ago:
+        created = timezone.now() - timedelta(hours=hours_ago)
+        Task.objects.filter(pk=task.pk).update(created_at=created, expires_at=created + timedelta(hours=task.expires_after_h))
+    return task
+
+
+@pytest.mark.django_db
+def test_expires_at_stamped_on_create(meeting):
+    task = _task(meeting, "fresh", expires_after_h=6)
+    assert abs(task.expires_at - (task.created_at + timedelta(hours=6))) < timedelta(seconds=1)
+    assert not task.is_expired
+
+
+@pytest.mark.django_db
+def test_public_page_hides_overdue_pending(client, meeting):
+    _task(meeting, "still open")
+    _task(meeting, "overdue task", hours_ago=48)
+    resp = client.get(reverse("public-tasks"))
+    assert b"still open" in resp.content
+    assert b"overdue task" not in resp.content
+
+
+@pytest.mark.django_db
+def test_expire_tasks_applies_policy_in_batches(meeting):
+    fresh = _task(meeting, "fresh")
+    auto = _task(meeting, "auto", hours_ago=48, auto_approved=True)
+    stale = [_task(meeting, f"stale {i}", hours_ago=30) for i in range(3)]
+
+    with mock.patch("tasks.services.create_monday_items", side_effect=lambda tasks: {t.id: "123" for t in tasks}) as push:
+        call_command("expire_tasks", "--batch-size", "2")
+
+    push.assert_called_once()
+    auto.refresh_from_db()
+    assert (auto.status, auto.monday_item_id) == (Task.Status.APPROVED, "123")
+    assert set(Task.objects.filter(pk__in=[t.pk for t in stale]).values_list("status", flat=True)) == {Task.Status.EXPIRED}
+    fresh.refresh_from_db()
+    assert fresh.status == Task.Status.PENDING
+    assert ReviewAction.objects.filter(action=ReviewAction.Action.EXPIRE).count() == 3
+    meeting.refresh_from_db()
+    assert (meeting.pending_count, meeting.approved_count) == (1, 1)
+
+
+@pytest.mark.django_db
+def test_expire_policy_ignores_auto_approved_flag(meeting):
+    auto = _task(meeting, "auto", hours_ago=48, auto_approved=True)
+    call_command("expire_tasks", "--policy", "expire")
+    auto.refresh_from_db()
+    assert auto.status == Task.Status.EXPIRED
+
+
+@pytest.mark.django_db
+def test_backfill_gives_old_pending_tasks_a_fresh_window(meeting):
+    from importlib import import_module
+    from types import SimpleNamespace
+
+    from django.apps import apps
+    from django.db import connection
+
+    old_pending = _task(meeting, "old pending", hours_ago=100)
+    old_done = _task(meeting, "old approved", hours_ago=100, status=Task.Status.APPROVED)
+    Task.objects.update(expires_at=None)
+
+    migration = import_module("tasks.migrations.0013_task_expires_at")
+    migration.backfill_expires_at(apps, SimpleNamespace(connection=connection))
+
+    old_pending.refresh_from_db()
+    old_done.refresh_from_db()
+    assert old_pending.expires_at > timezone.now() + timedelta(hours=old_pending.expires_after_h - 1)
+    assert old_done.expires_at == old_done.created_at + timedelta(hours=old_done.expires_after_h)
+
+
+@pytest.mark.django_db
+def test_changing_window_recomputes_expires_at(meeting):
+    task = _task(meeting, "rewindowed", hours_ago=30)
+    task = Task.objects.get(pk=task.pk)
+    assert task.is_expired
+
+    task.expires_after_h = 72
+    task.save(update_fields=["expires_after_h"])
+    task.refresh_from_db()
+    assert task.expires_at == task.created_at + timedelta(hours=72)
+    assert not task.is_expired
+
+    task.expires_after_h = 12
+    task.save()
+    task.refresh_from_db()
+    assert task.expires_at == task.created_at + timedelta(hours=12)
@@ -0,0 +1,89 @@
+"""Streaming CSV/NDJSON task exports (API and admin action)."""
+import csv
+import io
+import json
+import warnings
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from tasks.exports import HEADER
+from tasks.models import Meeting, Task
+
+URL = reverse("tasks:task-export")
+
+
+@pytest.fixture()
+def tasks(db):
+    meeting = Meeting.objects.create(meeting_id="exp", title="Export", organizer_email="o@example.com",
+                                     date=timezone.now())
+    return [
+        Task.objects.create(meeting=meeting, task_item=item, brief_description="d", date_expected=timezone.now().date(),
+                            status=status)
+        for item, status in [
+            ("Ship the report", Task.Status.PENDING),
+            ("=HYPERLINK(\"http://evil\")", Task.Status.PENDING),
+            ("Book the venue", Task.Status.APPROVED),
+        ]
+    ]
+
+
+def _body(resp) -> str:
+    assert resp.streaming
+    return b"".join(resp.streaming_content).decode()
+
+
+def test_csv_export_streams_filtered_rows(tasks, settings):
+    settings.EXPORT_CHUNK_SIZE = 1  # several cursor round trips
+    resp = APIClient().get(URL, {"format": "csv", "status": Task.Status.PENDING})
+    assert resp.status_code == 200
+    assert resp["Content-Type"].startswith("text/csv")
+    assert resp["Content-Disposition"].startswith('attachment; filename="tasks-')
+    rows = list(csv.DictReader(io.StringIO(_body(resp))))
+    assert {row["id"] for row in rows} == {str(tasks[0].pk), str(tasks[1].pk)}
+    assert {row["meeting_title"] for row in rows} == {"Export"}
+    # formula-looking text is neutralised for spreadsheets
+    assert "'=HYPERLINK(\"http://evil\")" in {row["task_item"] for row in rows}
+
+
+def test_ndjson_export(tasks):
+    resp = APIClient().get(URL, {"format": "ndjson", "status": Task.Status.APPROVED})
+    assert resp["Content-Type"] == "application/x-ndjson"
+    [line] = _body(resp).splitlines()
+    record = json.loads(line)
+    assert list(record) == HEADER
+    assert record["id"] == str(tasks[2].pk) and record["posted_to_monday"] is False
+
+
+@pytest.mark.django_db(transaction=True)
+def test_asgi_export_streams_without_buffering(tasks):
+    async def fetch():
+        resp = await AsyncClient().get(URL, {"format": "csv"})
+        assert resp.is_async
+        return [chunk async for chunk in resp.streaming_content]
+
+    with warnings.catch_warnings():
+        # Django warns when it has to drain a sync iterator into memory to serve it over ASGI
+        warnings.simplefilter("error")
+        chunks = async_to_sync(fetch)()
+    rows = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+    assert {row["id"] for row in rows} == {str(t.pk) for t in tasks}
+
+
+def test_unknown_format_is_not_found(tasks):
+    assert APIClient().get(URL, {"format": "xlsx"}).status_code == 404
+
+
+def test_admin_export_action(admin_client, tasks):
+    resp = admin_client.post(reverse("admin:tasks_actionitem_changelist"), {
+        "action": "export_csv",
+        "_selected_action": [str(tasks[0].pk), str(tasks[2].pk)],
+        "index": 0,
+    })
+    assert resp.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(_body(resp))))
+    assert sorted(row["task_item"] for row in rows) == ["Book the venue", "Ship the report"]
@@ -45,4 +45,40 @@ def test_ingest_duplicate_skipped(client, sample_payload):
     assert resp.json()["detail"] == "already_ingested"
     # still only one meeting & one task
     assert Meeting.objects.count() == 1
-    assert Task.objects.count() == 1 
\ No newline at end of file
+    assert Task.objects.count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_ingest_auto_approves_flagged_tasks_in_one_batch(client, sample_payload, monkeypatch, settings):
+    from tasks import services
+    from tasks.bulk_jobs import run_job
+    from tasks.models import BulkJob, ReviewAction
+
+    settings.BULK_JOBS_IN_THREAD = False
+
+    first = dict(sample_payload["monday_tasks"][0], approved=True)
+    sample_payload["monday_tasks"] = [
+        first,
+        dict(first, task_item="Second auto task"),
+        dict(first, task_item="Needs review", approved=False),
+    ]
+    calls = []
+
+    def fake_post(query, variables=None):
+        calls.append(query)
+        return {"data": {"t0": {"id": "101"}, "t1": {"id": "102"}}}
+
+    monkeypatch.setattr(services, "_post_monday", fake_post)
+    resp = client.post(reverse("tasks:ingest"), data=json.dumps(sample_payload), content_type="application/json")
+
+    assert resp.json()["auto_approved"] == 2
+    assert calls == []  # the push is left to the queued job
+    job = BulkJob.objects.get(kind=BulkJob.Kind.PUSH)
+    run_job(job.pk)
+    assert len(calls) == 1 and "t1: create_item" in calls[0]
+    approved = Task.objects.filter(status=Task.Status.APPROVED)
+    assert sorted(approved.values_list("monday_item_id", flat=True)) == ["101", "102"]
+    assert all(approved.values_list("posted_to_monday", flat=True))
+    assert Task.objects.get(task_item="Needs review").status == Task.Status.PENDING
+    assert ReviewAction.objects.filter(action=ReviewAction.Action.APPROVE).count() == 2
+    assert Meeting.objects.get(meeting_id="mid1").approved_count == 2
@@ -0,0 +1,113 @@
+"""Live review feed (server-sent events) over Task.updated_at."""
+import json
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks import live
+from tasks.changes import MAX_ID, decode_token, encode_token
+from tasks.models import Task
+from tasks.transitions import transition
+
+
+def _events(chunks):
+    """Parse SSE text into ``(event, data)`` pairs, ignoring id/retry-only blocks."""
+    events = []
+    for block in "".join(chunks).split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if "data" in fields:
+            events.append((fields.get("event"), json.loads(fields["data"])))
+    return events
+
+
+def _get(client, **kwargs):
+    resp = client.get(reverse("tasks:task-live"), **kwargs)
+    assert resp["Content-Type"] == "text/event-stream"
+    return resp, [chunk.decode() for chunk in resp.streaming_content]
+
+
+def test_feed_reports_status_changes_since_cursor(client, make_tasks):
+    tasks = make_tasks(3)
+    since = timezone.now() - timedelta(minutes=1)
+    transition([tasks[0].pk], Task.Status.APPROVED, now=since + timedelta(seconds=1))
+    transition([tasks[1].pk], Task.Status.REJECTED, reason="Not an action item at all", now=since + timedelta(seconds=2))
+
+    resp, chunks = _get(client, data={"since": encode_token(since, MAX_ID)})
+    events = _events(chunks)
+    by_id = {data["id"]: data for _, data in events}
+    assert by_id[str(tasks[0].pk)]["status"] == Task.Status.APPROVED
+    assert by_id[str(tasks[1].pk)]["rejected_reason"] == "Not an action item at all"
+    assert {event for event, _ in events} == {"task"}
+    assert "retry: " in chunks[0]
+
+
+def _last_id(chunks):
+    return [line[4:] for line in "".join(chunks).splitlines() if line.startswith("id: ")][-1]
+
+
+def test_reconnects_send_each_change_once(client, make_tasks):
+    tasks = make_tasks(2)
+    start = timezone.now() - timedelta(minutes=1)
+    transition([tasks[0].pk], Task.Status.APPROVED, now=start + timedelta(seconds=1))
+    # stamped a moment ago: its transaction may not have committed, so it waits for a later poll
+    transition([tasks[1].pk], Task.Status.APPROVED)
+
+    _, chunks = _get(client, data={"since": encode_token(start, MAX_ID)})
+    assert [data["id"] for _, data in _events(chunks)] == [str(tasks[0].pk)]
+    last_id = _last_id(chunks)
+    _, chunks = _get(client, headers={"Last-Event-ID": last_id})
+    assert _events(chunks) == []
+
+    feed = live.ChangeFeed(decode_token(last_id))
+    later = timezone.now() + live.COMMIT_SLACK * 2
+    assert [change["id"] for change in feed.poll(now=later)] == [str(tasks[1].pk)]
+    assert feed.poll(now=later) == []
+
+
+def test_last_event_id_resumes_without_replaying_old_changes(client, make_tasks):
+    [task] = make_tasks(1)
+    old = timezone.now() - timedelta(minutes=5)
+    Task.objects.filter(pk=task.pk).update(updated_at=old)
+
+    _, chunks = _get(client, headers={"Last-Event-ID": encode_token(old + timedelta(minutes=1), MAX_ID)})
+    assert _events(chunks) == []
+
+
+def test_feed_drains_backlog_larger_than_a_batch(make_tasks, monkeypatch):
+    monkeypatch.setattr(live, "BATCH_SIZE", 4)
+    tasks = make_tasks(10)
+    feed = live.ChangeFeed((timezone.now() - timedelta(minutes=1), MAX_ID), eager=True)
+    seen = []
+    for _ in range(5):
+        seen += [change["id"] for change in feed.poll()]
+    assert sorted(seen) == sorted(str(t.pk) for t in tasks)
+
+
+def test_committed_transition_wakes_streams(make_tasks, django_capture_on_commit_callbacks):
+    [task] = make_tasks(1)
+    seen = live.wakeup.generation
+    with django_capture_on_commit_callbacks(execute=True):
+        transition([task.pk], Task.Status.APPROVED)
+    assert live.wakeup.wait(seen, timeout=0) != seen
+
+
+@override_settings(LIVE_STREAM_SECONDS=0.5, LIVE_POLL_SECONDS=0.1)
+def test_async_stream_stays_open_and_sends_new_changes(make_tasks):
+    [task] = make_tasks(1)
+    position = decode_token(live.start_token())
+
+    async def consume():
+        chunks = []
+        async for chunk in live._stream(position):
+            if not chunks:
+                # a change made after the stream opened is still delivered on it
+                await live.sync_to_async(transition)([task.pk], Task.Status.APPROVED)
+            chunks.append(chunk)
+        return chunks
+
+    events = _events(async_to_sync(consume)())
+    assert [(event, data["status"]) for event, data in events] == [("task", Task.Status.APPROVED)]
@@ -0,0 +1,51 @@
+import json
+import logging
+
+import pytest
+from django.test import override_settings
+
+from tasks.logs import JsonFormatter, Payload, RequestIdFilter, request_id_var
+
+
+def _record(msg, *args, **extra):
+    record = logging.makeLogRecord({"name": "tasks.services", "levelno": logging.INFO, "levelname": "INFO",
+                                    "msg": msg, "args": args, **extra})
+    RequestIdFilter().filter(record)
+    return record
+
+
+def test_json_formatter_includes_request_id_and_extra():
+    token = request_id_var.set("abc123")
+    try:
+        line = JsonFormatter().format(_record("created %s", "item-1", monday_operation="create_item"))
+    finally:
+        request_id_var.reset(token)
+    entry = json.loads(line)
+    assert entry["msg"] == "created item-1"
+    assert entry["request_id"] == "abc123"
+    assert entry["monday_operation"] == "create_item"
+
+
+@override_settings(LOG_PAYLOAD_MAX_CHARS=20)
+def test_payload_is_capped():
+    text = str(Payload({"cols": "x" * 100}))
+    assert text.startswith('{"cols": "xxxxxxxx')
+    assert "chars)" in text
+
+
+def test_payload_is_lazy():
+    class Exploding:
+        def __str__(self):  # pragma: no cover - must never run
+            raise AssertionError("formatted while DEBUG disabled")
+
+    logger = logging.getLogger("tasks.services.lazy-test")
+    logger.setLevel(logging.INFO)
+    logger.debug("payload %s", Payload(Exploding()))
+
+
+@pytest.mark.django_db
+def test_request_id_round_trip(client):
+    resp = client.get("/health/", HTTP_X_REQUEST_ID="n8n-run-42")
+    assert resp["X-Request-ID"] == "n8n-run-42"
+    generated = client.get("/health/", HTTP_X_REQUEST_ID="bad id with spaces")["X-Request-ID"]
+    assert generated != "bad id with spaces" and len(generated) == 32
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from prometheus_client import REGISTRY
+
+from tasks.services import _operation_name
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_exposes_request_latency(client):
+    client.get("/health/")
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    body = resp.content.decode()
+    assert "taskforge_http_request_duration_seconds_bucket" in body
+    assert 'view="health"' in body
+    assert "taskforge_http_db_queries_bucket" in body
+
+
+@pytest.mark.django_db
+@override_settings(METRICS_TOKEN="s3cret")
+def test_metrics_endpoint_requires_token_when_configured(client):
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics", HTTP_AUTHORIZATION="Bearer s3cret").status_code == 200
+
+
+@pytest.mark.django_db
+def test_ingest_counts_created_updated_unchanged(client):
+    payload = {
+        "monday_tasks": [
+            {
+                "meeting_id": "metrics-m1",
+                "meeting_title": "Demo",
+                "meeting_organizer": "x@example.com",
+                "task_item": "Count me",
+                "brief_description": "Desc",
+                "date_expected": timezone.now().date().isoformat(),
+                "priority": "Medium",
+            }
+        ]
+    }
+    url = reverse("tasks:ingest")
+    before = {r: _sample("taskforge_ingest_tasks_total", result=r) for r in ("created", "updated", "unchanged")}
+
+    client.post(url, data=json.dumps(payload), content_type="application/json")
+    resp = client.post(url, data=json.dumps(payload), content_type="application/json")
+    assert resp.json() == {"created": 0, "updated": 0, "unchanged": 1, "auto_approved": 0}
+
+    payload["monday_tasks"][0]["brief_description"] = "Changed"
+    client.post(url, data=json.dumps(payload), content_type="application/json")
+
+    for result in ("created", "updated", "unchanged"):
+        assert _sample("taskforge_ingest_tasks_total", result=result) == before[result] + 1
+
+
+def test_operation_name_skips_complexity():
+    assert _operation_name("query { me { id } }") == "me"
+    assert _operation_name("mutation ($a:ID!){ complexity { query } create_item(board_id:$a){ id } }") == "create_item"
+    assert _operation_name("mutation { t0: create_item(board_id:1){ id } t1: create_item(board_id:1){ id } }") == "create_item"
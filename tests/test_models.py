@@ -38,4 +38,59 @@ def test_task_approval_flow():
     assert task.status == Task.Status.APPROVED
     assert task.reviews.count() == 1
     review = task.reviews.first()
-    assert review.reason == "Looks good" 
\ No newline at end of file
+    assert review.reason == "Looks good"
+
+
+@pytest.mark.django_db
+def test_task_meeting_date_follows_meeting():
+    meeting = Meeting.objects.create(
+        meeting_id="456", title="Planning", organizer_email="owner@example.com", date=timezone.now()
+    )
+    task = Task.objects.create(
+        meeting=meeting, task_item="Draft plan", brief_description="d", date_expected=timezone.now().date()
+    )
+    assert task.meeting_date == meeting.date
+
+    meeting.date = meeting.date - timezone.timedelta(days=3)
+    meeting.save()
+    task.refresh_from_db()
+    assert task.meeting_date == meeting.date
+
+    # Ordering by the meeting date no longer needs a join
+    assert "JOIN" not in str(Task.objects.all().query)
+
+
+@pytest.mark.django_db
+def test_meeting_counters_follow_task_status():
+    meeting = Meeting.objects.create(
+        meeting_id="789", title="Retro", organizer_email="owner@example.com", date=timezone.now()
+    )
+    tasks = [
+        Task.objects.create(meeting=meeting, task_item=f"Item {i}", brief_description="d",
+                            date_expected=timezone.now().date())
+        for i in range(3)
+    ]
+    meeting.refresh_from_db()
+    assert (meeting.pending_count, meeting.approved_count, meeting.rejected_count) == (3, 0, 0)
+
+    task = Task.objects.get(pk=tasks[0].pk)
+    task.status = Task.Status.APPROVED
+    task.save()
+    Task.objects.get(pk=tasks[1].pk).delete()
+    meeting.refresh_from_db()
+    assert (meeting.pending_count, meeting.approved_count, meeting.rejected_count) == (1, 1, 0)
+
+
+@pytest.mark.django_db
+def test_reconcile_meeting_counters_fixes_drift():
+    from django.core.management import call_command
+
+    meeting = Meeting.objects.create(
+        meeting_id="790", title="Retro", organizer_email="owner@example.com", date=timezone.now()
+    )
+    Task.objects.create(meeting=meeting, task_item="Item", brief_description="d", date_expected=timezone.now().date())
+    Meeting.objects.filter(pk=meeting.pk).update(pending_count=7, rejected_count=2)
+
+    call_command("reconcile_meeting_counters")
+    meeting.refresh_from_db()
+    assert (meeting.pending_count, meeting.approved_count, meeting.rejected_count) == (1, 0, 0)
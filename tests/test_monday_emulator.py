@@ -0,0 +1,133 @@
+"""End-to-end Monday.com client tests against the in-repo API emulator (no network)."""
+import logging
+import threading
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+from tasks.models import MondayPush, Task
+from tasks.monday_emulator import MondayEmulator
+from tasks.services import (
+    create_monday_item, create_monday_items, fetch_items_page, push_task_to_monday, push_tasks_to_monday,
+)
+
+BOARD = "9212659997"
+
+
+@pytest.fixture()
+def emulator():
+    with MondayEmulator(seed=1) as emu, override_settings(MONDAY_API_URL=emu.url, MONDAY_BOARD_ID=BOARD):
+        yield emu
+
+
+def test_create_item_round_trip(emulator, make_tasks):
+    [task] = make_tasks(1, priority=Task.Priority.HIGH)
+    item_id = create_monday_item(task)
+    assert item_id
+    [item] = emulator.items[BOARD]
+    assert item["id"] == item_id and item["name"] == "Task 0"
+    assert {"label": "High"} in item["column_values"].values()
+
+
+@override_settings(MONDAY_BATCH_SIZE=25)
+def test_bulk_approval_push_is_batched(emulator, make_tasks):
+    tasks = make_tasks(60, status=Task.Status.APPROVED)
+    assert push_tasks_to_monday([t.pk for t in tasks]) == 60
+    assert emulator.stats.requests == 3
+    assert Task.objects.filter(posted_to_monday=True, monday_item_id__isnull=False).count() == 60
+
+
+def test_complexity_budget_exhaustion_reports_failures(make_tasks):
+    tasks = make_tasks(3)
+    with MondayEmulator(complexity_budget=60_000, create_item_cost=30_000) as emu, \
+            override_settings(MONDAY_API_URL=emu.url, MONDAY_BOARD_ID=BOARD, MONDAY_BATCH_SIZE=1):
+        results = create_monday_items(tasks)
+    assert sorted(bool(v) for v in results.values()) == [False, True, True]
+    assert emu.stats.complexity_rejections == 1
+
+
+def test_server_errors_return_no_item(make_tasks):
+    [task] = make_tasks(1)
+    with MondayEmulator(error_rate=1.0) as emu, override_settings(MONDAY_API_URL=emu.url, MONDAY_BOARD_ID=BOARD):
+        assert create_monday_item(task) is None
+    assert emu.stats.failures == 1
+
+
+def test_items_page_cursor_paging(db, emulator):
+    for i in range(7):
+        emulator.add_item(BOARD, f"item {i}")
+    seen, cursor, pages = [], None, 0
+    while True:
+        items, cursor = fetch_items_page(BOARD, cursor=cursor, limit=3)
+        seen += [item["id"] for item in items]
+        pages += 1
+        if not cursor:
+            break
+    assert pages == 3 and len(set(seen)) == 7
+
+
+def test_concurrent_pushes_overlap(make_tasks):
+    tasks = make_tasks(6)
+    with MondayEmulator(latency=0.1) as emu, override_settings(MONDAY_API_URL=emu.url, MONDAY_BOARD_ID=BOARD):
+        threads = [threading.Thread(target=create_monday_item, args=(t,)) for t in tasks]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert emu.stats.items_created == 6
+    assert emu.stats.max_concurrency > 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_approval_does_not_create_second_item(make_tasks, monkeypatch):
+    [task] = make_tasks(1, status=Task.Status.APPROVED)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_create(task):
+        started.set()
+        release.wait(5)
+        return create_monday_item(task)
+
+    monkeypatch.setattr("tasks.services.create_monday_item", slow_create)
+    with MondayEmulator() as emu, override_settings(MONDAY_API_URL=emu.url, MONDAY_BOARD_ID=BOARD):
+        first = threading.Thread(target=push_task_to_monday, args=(Task.objects.get(pk=task.pk),))
+        first.start()
+        assert started.wait(5)
+        # the first worker holds the claim while its create_item is in flight
+        assert push_task_to_monday(Task.objects.get(pk=task.pk)) is None
+        release.set()
+        first.join()
+        # once it finished, a later push returns the recorded item
+        assert push_task_to_monday(Task.objects.get(pk=task.pk)) == emu.items[BOARD][0]["id"]
+    assert emu.stats.items_created == 1
+
+
+@override_settings(MONDAY_COLUMN_MAP='{"external_id": "text_taskforge_id"}', MONDAY_PUSH_LEASE_SECONDS=60)
+def test_retry_after_lost_response_finds_existing_item(emulator, make_tasks):
+    [task] = make_tasks(1, status=Task.Status.APPROVED)
+    # a previous attempt created the item but died before recording it
+    item_id = emulator.add_item(BOARD, task.task_item, {"text_taskforge_id": str(task.pk)})
+    MondayPush.objects.create(task=task, state=MondayPush.State.IN_FLIGHT, attempts=1,
+                              claimed_at=timezone.now() - timedelta(minutes=5))
+
+    assert push_tasks_to_monday([task.pk]) == 1
+    assert emulator.stats.items_created == 0
+    task.refresh_from_db()
+    assert task.monday_item_id == item_id
+    assert MondayPush.objects.get(pk=task.pk).state == MondayPush.State.DONE
+
+
+def test_retry_without_external_id_column_is_logged(emulator, make_tasks, monkeypatch, caplog):
+    monkeypatch.setattr("tasks.services._external_id_reported", False)
+    task, other = make_tasks(2, status=Task.Status.APPROVED)
+    MondayPush.objects.create(task=task, state=MondayPush.State.IN_FLIGHT, attempts=1,
+                              claimed_at=timezone.now() - timedelta(minutes=5))
+
+    with caplog.at_level(logging.ERROR, logger="tasks.services"):
+        assert push_tasks_to_monday([task.pk]) == 1
+        assert push_tasks_to_monday([other.pk]) == 1
+    errors = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+    assert sum("has no external_id column" in m for m in errors) == 1
+    assert any(f"task {task.pk} (attempt 2)" in m for m in errors)
@@ -0,0 +1,90 @@
+import pytest
+from django.utils import timezone
+
+from tasks.models import Meeting, Task
+
+
+
+@pytest.mark.django_db
+def test_reconcile_monday_pages_board_and_flags_missing(monkeypatch):
+    from django.core.management import call_command
+
+    from tasks import monday_sync
+
+    meeting = Meeting.objects.create(meeting_id="rec", title="R", organizer_email="o@example.com",
+                                     date=timezone.now())
+    reviewed = timezone.now() - timezone.timedelta(hours=1)
+
+    def task(name, item_id, posted=True):
+        return Task.objects.create(meeting=meeting, task_item=name, brief_description="d",
+                                   date_expected=timezone.now().date(), status=Task.Status.APPROVED,
+                                   reviewed_at=reviewed, monday_item_id=item_id, posted_to_monday=posted)
+
+    on_board = task("on board", "1", posted=False)
+    deleted = task("deleted", "2")
+    unposted = task("unposted", None, posted=False)
+    pages = {None: ([{"id": "1"}, {"id": "99"}], "c1"), "c1": ([{"id": "3"}], None)}
+
+    def fake_page(board_id=None, cursor=None, limit=500):
+        return pages[cursor]
+
+    monkeypatch.setattr(monday_sync, "fetch_items_page", fake_page)
+    monkeypatch.setattr("tasks.services.create_monday_items", lambda tasks: {t.id: "3" for t in tasks})
+
+    call_command("reconcile_monday", "--max-pages", "1")  # first page only; cursor stored
+    deleted.refresh_from_db()
+    assert deleted.posted_to_monday is True
+    call_command("reconcile_monday")  # resumes from the stored cursor and finishes
+
+    for t in (on_board, deleted, unposted):
+        t.refresh_from_db()
+    assert on_board.posted_to_monday is True and on_board.monday_seen_at is not None
+    assert unposted.monday_item_id == "3"
+    assert deleted.posted_to_monday is False  # flagged: item 2 is gone from the board
+    assert "cursor" not in monday_sync._load_state()
+
+
+@pytest.mark.django_db
+def test_reconcile_stamps_changes_when_it_writes_them(monkeypatch):
+    from tasks import monday_sync
+    from tasks.changes import SETTLE, changes_since
+
+    meeting = Meeting.objects.create(meeting_id="slow", title="S", organizer_email="o@example.com",
+                                     date=timezone.now())
+    task = Task.objects.create(meeting=meeting, task_item="t", brief_description="d",
+                               date_expected=timezone.now().date(), status=Task.Status.APPROVED,
+                               reviewed_at=timezone.now() - timezone.timedelta(hours=1), monday_item_id="1")
+    Task.objects.filter(pk=task.pk).update(updated_at=timezone.now() - timezone.timedelta(hours=1))
+    started = timezone.now() - SETTLE * 4  # re-pushes and earlier pages took a while
+    # a mirror that synced after the scan started has moved past started + SETTLE
+    token = changes_since(None, 100).next_token
+    monkeypatch.setattr(monday_sync, "fetch_items_page",
+                        lambda board_id=None, cursor=None, limit=500: ([{"id": "1"}], None))
+
+    monday_sync.reconcile(force_scan=True, now=started)
+    task.refresh_from_db()
+    assert task.posted_to_monday is True and task.updated_at > started + SETTLE
+    page = changes_since(token, 100, now=timezone.now() + SETTLE * 2)
+    assert [t.pk for t in page.upserted] == [task.pk]
+
+
+@pytest.mark.django_db
+def test_reconcile_leaves_already_flagged_tasks_alone(monkeypatch):
+    from tasks import monday_sync
+
+    meeting = Meeting.objects.create(meeting_id="gone", title="G", organizer_email="o@example.com",
+                                     date=timezone.now())
+    task = Task.objects.create(meeting=meeting, task_item="t", brief_description="d",
+                               date_expected=timezone.now().date(), status=Task.Status.APPROVED,
+                               reviewed_at=timezone.now() - timezone.timedelta(hours=1), monday_item_id="2")
+    monkeypatch.setattr(monday_sync, "fetch_items_page",
+                        lambda board_id=None, cursor=None, limit=500: ([{"id": "1"}], None))
+
+    monday_sync.reconcile(force_scan=True)
+    task.refresh_from_db()
+    assert task.posted_to_monday is False
+    flagged_at = task.updated_at
+
+    monday_sync.reconcile(force_scan=True)
+    task.refresh_from_db()
+    assert task.updated_at == flagged_at
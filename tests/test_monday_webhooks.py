@@ -0,0 +1,95 @@
+"""Replays recorded Monday.com webhook deliveries against the receiver."""
+import base64
+import hashlib
+import hmac
+import json
+import time
+from pathlib import Path
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.models import Meeting, MondayWebhookEvent, ReviewAction, Task
+
+RECORDED = json.loads((Path(__file__).parent / "fixtures" / "monday_webhooks.json").read_text())
+SECRET = "monday-signing-secret"
+
+
+def _jwt(secret, exp_in=60):
+    def enc(obj):
+        return base64.urlsafe_b64encode(json.dumps(obj).encode()).rstrip(b"=").decode()
+
+    signing_input = f"{enc({'alg': 'HS256', 'typ': 'JWT'})}.{enc({'exp': int(time.time()) + exp_in})}"
+    signature = hmac.new(secret.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{base64.urlsafe_b64encode(signature).rstrip(b'=').decode()}"
+
+
+def replay(client, payloads, secret=SECRET):
+    """Stand-in for Monday: POST each recorded delivery, signed like the real service."""
+    return [
+        client.post(reverse("tasks:monday-webhook"), data=json.dumps(p), content_type="application/json",
+                    HTTP_AUTHORIZATION=_jwt(secret))
+        for p in payloads
+    ]
+
+
+@pytest.fixture()
+def board_tasks():
+    meeting = Meeting.objects.create(meeting_id="wh", title="Board", organizer_email="o@example.com", date=timezone.now())
+
+    def task(item_id, status):
+        return Task.objects.create(meeting=meeting, task_item=f"item {item_id}", brief_description="d",
+                                   date_expected=timezone.now().date(), status=status,
+                                   monday_item_id=item_id, posted_to_monday=True)
+
+    return {item: task(item, Task.Status.APPROVED) for item in ("1001", "1002", "1003")}
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(MONDAY_WEBHOOK_SECRET=SECRET)
+def test_recorded_deliveries_sync_task_status(client, board_tasks):
+    responses = replay(client, RECORDED)
+
+    assert responses[0].json() == {"challenge": RECORDED[0]["challenge"]}
+    assert [r.status_code for r in responses] == [200] * len(RECORDED)
+    assert responses[2].json() == {"queued": False}  # redelivery of the same triggerUuid
+
+    for task in board_tasks.values():
+        task.refresh_from_db()
+    assert board_tasks["1001"].status == Task.Status.REJECTED
+    assert board_tasks["1003"].status == Task.Status.APPROVED  # To Do, then back to Approved
+    assert board_tasks["1002"].posted_to_monday is False  # deleted on the board
+    assert ReviewAction.objects.filter(task=board_tasks["1001"], action=ReviewAction.Action.REJECT).exists()
+    assert not MondayWebhookEvent.objects.filter(processed_at__isnull=True).exists()
+    assert MondayWebhookEvent.objects.get(item_id="5555").error == "No task with this Monday item id"
+    assert Meeting.objects.get(meeting_id="wh").rejected_count == 1
+
+
+@pytest.mark.django_db
+@override_settings(MONDAY_WEBHOOK_SECRET=SECRET)
+def test_bad_signature_rejected(client, board_tasks):
+    [resp] = replay(client, RECORDED[1:2], secret="wrong")
+    assert resp.status_code == 401
+    assert not MondayWebhookEvent.objects.exists()
+
+
+@pytest.mark.django_db
+@override_settings(MONDAY_WEBHOOK_SECRET=None, DEBUG=False)
+def test_events_refused_without_secret(client, board_tasks):
+    [resp] = replay(client, RECORDED[1:2])
+    assert resp.status_code == 403
+    assert not MondayWebhookEvent.objects.exists()
+
+
+@pytest.mark.django_db
+def test_batch_applies_last_status_per_item(board_tasks):
+    from tasks.monday_webhooks import apply_pending_events, enqueue
+
+    for payload in RECORDED[3:5]:
+        enqueue(payload["event"])
+    assert apply_pending_events() == 2
+    board_tasks["1003"].refresh_from_db()
+    assert board_tasks["1003"].status == Task.Status.APPROVED
+    assert not ReviewAction.objects.exists()  # net effect: unchanged
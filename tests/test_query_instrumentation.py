@@ -0,0 +1,59 @@
+import json
+import logging
+
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import override_settings
+
+from tasks.models import SecurityQuestion, UserSecurityAnswer
+
+INSTRUMENTED = [settings.MIDDLEWARE[0], "tasks.middleware.QueryInstrumentationMiddleware", *settings.MIDDLEWARE[1:]]
+
+
+@pytest.fixture()
+def user_with_answers():
+    user = User.objects.create_user(username="qa", password="old")
+    for i in range(3):
+        question = SecurityQuestion.objects.create(question_text=f"Question {i}?")
+        UserSecurityAnswer.set_answer(user, question, f"answer{i}")
+    return user
+
+
+def _reset(client):
+    payload = {
+        "username": "qa",
+        "new_password": "new-pass",
+        "answers": [{"id": q.id, "answer": f"answer{i}"} for i, q in enumerate(SecurityQuestion.objects.order_by("id"))],
+    }
+    return client.post("/api/reset-password-questions/", data=json.dumps(payload), content_type="application/json")
+
+
+@pytest.mark.django_db
+def test_server_timing_header_absent_by_default(client, user_with_answers):
+    resp = _reset(client)
+    assert resp.status_code == 200
+    assert "Server-Timing" not in resp
+
+
+@pytest.mark.django_db
+@override_settings(MIDDLEWARE=INSTRUMENTED)
+def test_server_timing_reports_queries_and_duplicates(client, user_with_answers):
+    resp = _reset(client)
+    assert resp.status_code == 200
+    timing = resp["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert "queries" in timing
+    # One SecurityQuestion + one UserSecurityAnswer lookup per answer → duplicated shapes
+    assert 'db-dup;desc="0 duplicated"' not in timing
+
+
+@pytest.mark.django_db
+@override_settings(MIDDLEWARE=INSTRUMENTED, QUERY_BUDGET=1)
+def test_query_budget_warning(client, user_with_answers, caplog):
+    with caplog.at_level(logging.INFO, logger="tasks.middleware"):
+        _reset(client)
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING and "Query budget exceeded" in r.getMessage()]
+    assert warnings
+    assert warnings[0].db["queries"] > 1
+    assert warnings[0].db["duplicates"]
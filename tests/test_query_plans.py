@@ -0,0 +1,70 @@
+"""EXPLAIN-based guard rails for the hot query shapes.
+
+Seeds a few thousand rows, refreshes planner statistics and asserts that none
+of the queries below fall back to a full table scan. When adding a new list
+endpoint or ordering, add its queryset here.
+"""
+import re
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from tasks.models import Meeting, PageLog, ReviewAction, Task
+
+MEETINGS = 100
+TASKS_PER_MEETING = 30
+
+
+@pytest.fixture()
+def seeded():
+    now = timezone.now()
+    meetings = Meeting.objects.bulk_create(
+        Meeting(meeting_id=f"plan-{i}", title=f"M{i}", organizer_email=f"o{i % 7}@example.com",
+                date=now - timedelta(hours=i))
+        for i in range(MEETINGS)
+    )
+    statuses = [Task.Status.PENDING, Task.Status.APPROVED, Task.Status.REJECTED, Task.Status.APPROVED]
+    tasks = Task.objects.bulk_create(
+        Task(meeting=m, meeting_date=m.date, task_item=f"Task {m.meeting_id}-{j}", brief_description="d",
+             date_expected=now.date(), status=statuses[j % len(statuses)])
+        for m in meetings
+        for j in range(TASKS_PER_MEETING)
+    )
+    ReviewAction.objects.bulk_create(ReviewAction(task=t, action=ReviewAction.Action.APPROVE) for t in tasks[::3])
+    PageLog.objects.bulk_create(PageLog(path=f"/p/{i}", method="GET", status_code=200) for i in range(3000))
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    return meetings
+
+
+def _full_scans(queryset):
+    plan = queryset.explain()
+    if connection.vendor == "postgresql":
+        return re.findall(r"Seq Scan on (\w+)", plan)
+    # SQLite: "SCAN tbl" is a table scan; "SCAN tbl USING [COVERING] INDEX" walks an index in order.
+    # "USE TEMP B-TREE FOR ORDER BY" means no index matched the ordering, so every row gets sorted.
+    scans = [m.group(1) for m in re.finditer(r"SCAN (\w+)(?! USING)(?:\s|$)", plan)]
+    return scans + re.findall(r"USE TEMP B-TREE FOR \w+ ?BY", plan)
+
+
+def hot_queries(meeting, task):
+    return {
+        "default list": Task.objects.select_related("meeting")[:50],
+        "pending list": Task.objects.filter(status=Task.Status.PENDING)[:50],
+        "status filter": Task.objects.filter(status=Task.Status.APPROVED).select_related("meeting")[:50],
+        "meeting tasks": Task.objects.filter(meeting=meeting, status=Task.Status.PENDING).order_by("-created_at")[:50],
+        "ingest lookup": Task.objects.filter(meeting=meeting, task_item="Task plan-5-3").order_by("-created_at")[:1],
+        "review history": ReviewAction.objects.order_by("-timestamp")[:50],
+        "task reviews": ReviewAction.objects.filter(task=task).order_by("-timestamp")[:50],
+        "page log": PageLog.objects.order_by("-timestamp")[:50],
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", list(hot_queries(None, None)))
+def test_hot_query_uses_index(seeded, name):
+    meeting = seeded[5]
+    queryset = hot_queries(meeting, ReviewAction.objects.filter(task__meeting=meeting).first().task)[name]
+    assert _full_scans(queryset) == [], queryset.explain()
@@ -0,0 +1,82 @@
+import pytest
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.models import Meeting, Task
+from tasks.search import _fts5_query, search_tasks
+
+
+@pytest.fixture()
+def tasks_with_text():
+    meeting = Meeting.objects.create(meeting_id="fts-1", title="Quarterly roadmap review",
+                                     organizer_email="lead@example.com", date=timezone.now())
+    other = Meeting.objects.create(meeting_id="fts-2", title="Hiring sync",
+                                   organizer_email="hr@example.com", date=timezone.now())
+    today = timezone.now().date()
+    return {
+        "invoice": Task.objects.create(meeting=meeting, task_item="Send invoice to Acme",
+                                       brief_description="Finance needs the signed invoice", date_expected=today),
+        "mention": Task.objects.create(meeting=other, task_item="Update careers page",
+                                       brief_description="Mention the invoice portal once", date_expected=today),
+        "unrelated": Task.objects.create(meeting=other, task_item="Book interview rooms",
+                                         brief_description="Two rooms for Friday", assignee_names="Alice Smith",
+                                         date_expected=today),
+    }
+
+
+@pytest.mark.django_db
+def test_search_ranks_title_match_first(tasks_with_text):
+    results = list(search_tasks(Task.objects.all(), "invoice"))
+    assert [t.id for t in results] == [tasks_with_text["invoice"].id, tasks_with_text["mention"].id]
+    assert results[0].search_rank > results[1].search_rank
+
+
+@pytest.mark.django_db
+def test_search_covers_meeting_and_assignee_fields(tasks_with_text):
+    assert set(search_tasks(Task.objects.all(), "roadmap")) == {tasks_with_text["invoice"]}
+    assert set(search_tasks(Task.objects.all(), "alice")) == {tasks_with_text["unrelated"]}
+
+
+@pytest.mark.django_db
+def test_index_follows_task_and_meeting_updates(tasks_with_text):
+    task = tasks_with_text["unrelated"]
+    task.task_item = "Book auditorium"
+    task.save()
+    assert set(search_tasks(Task.objects.all(), "auditorium")) == {task}
+
+    Meeting.objects.filter(meeting_id="fts-2").update(title="Recruiting offsite")
+    assert set(search_tasks(Task.objects.all(), "offsite")) == {task, tasks_with_text["mention"]}
+
+    task.delete()
+    assert set(search_tasks(Task.objects.all(), "auditorium")) == set()
+
+
+@pytest.mark.django_db
+def test_task_api_q_parameter(client, tasks_with_text):
+    resp = client.get(reverse("tasks:task-list"), {"q": "invoice"})
+    assert resp.status_code == 200
+    assert [t["task_item"] for t in resp.json()] == ["Send invoice to Acme", "Update careers page"]
+
+
+@pytest.mark.django_db
+def test_admin_search_uses_index(admin_client, tasks_with_text):
+    resp = admin_client.get(reverse("admin:tasks_actionitem_changelist"), {"q": "interview"})
+    assert resp.status_code == 200
+    assert "Book interview rooms" in resp.content.decode()
+    assert "Send invoice to Acme" not in resp.content.decode()
+
+
+def test_fts5_query_is_sanitised():
+    assert _fts5_query('foo "bar" OR -baz*') == '"foo"* "bar"* "OR"* "baz"*'
+
+
+@pytest.mark.postgres
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="tsvector search needs PostgreSQL")
+@pytest.mark.django_db
+def test_postgres_query_matches_unstemmed_fields(tasks_with_text):
+    # names and ids are indexed with the same config the query is parsed with
+    assert set(search_tasks(Task.objects.all(), "Alice")) == {tasks_with_text["unrelated"]}
+    assert set(search_tasks(Task.objects.all(), "hr@example.com")) == {
+        tasks_with_text["mention"], tasks_with_text["unrelated"],
+    }
@@ -0,0 +1,76 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tasks.models import Meeting, ReviewAction, Task
+
+
+@pytest.fixture()
+def api(client):
+    cache.clear()
+    client.force_login(User.objects.create_user(username="manager", password="pass"))
+    return client
+
+
+@pytest.fixture()
+def reviewed_tasks():
+    now = timezone.now()
+    meeting = Meeting.objects.create(meeting_id="s1", title="Stats", organizer_email="o@example.com", date=now)
+
+    def make(status, reviewed_after=None, pushed=False):
+        task = Task.objects.create(
+            meeting=meeting, task_item=f"{status}-{Task.objects.count()}", brief_description="d",
+            date_expected=now.date(), status=status, posted_to_monday=pushed,
+        )
+        if reviewed_after is not None:
+            Task.objects.filter(pk=task.pk).update(reviewed_at=task.created_at + reviewed_after)
+        return task
+
+    make(Task.Status.APPROVED, timedelta(minutes=10), pushed=True)
+    make(Task.Status.APPROVED, timedelta(minutes=30), pushed=False)
+    edited = make(Task.Status.REJECTED, timedelta(minutes=5))
+    make(Task.Status.PENDING)
+    ReviewAction.objects.create(task=edited, action=ReviewAction.Action.EDIT)
+
+
+@pytest.mark.django_db
+def test_stats_aggregates_today(api, reviewed_tasks):
+    resp = api.get("/api/stats/?days=7")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert len(data["daily"]) == 7
+    today = data["daily"][-1]
+    assert today["date"] == timezone.localdate().isoformat()
+    assert (today["ingested"], today["approved"], today["rejected"], today["edits"], today["pushed"]) == (4, 2, 1, 1, 1)
+    assert today["rejection_rate"] == pytest.approx(1 / 3, abs=1e-3)
+    assert today["avg_approval_latency_seconds"] == pytest.approx(20 * 60, abs=1)
+    assert today["push_success_rate"] == 0.5
+    assert data["totals"]["ingested"] == 4
+    assert sum(week["ingested"] for week in data["weekly"]) == 4
+    assert data["daily"][0]["rejection_rate"] is None
+
+
+@pytest.mark.django_db
+def test_stats_served_from_daily_cache(api, reviewed_tasks):
+    api.get("/api/stats/?days=30")
+    # Every day bucket is now cached: no aggregate queries on the second load
+    with CaptureQueriesContext(connection) as ctx:
+        resp = api.get("/api/stats/?days=30")
+    assert resp.json()["totals"]["approved"] == 2
+    assert not [q["sql"] for q in ctx.captured_queries if "tasks_task" in q["sql"] or "tasks_reviewaction" in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_stats_rejects_bad_range(api):
+    assert api.get("/api/stats/?days=0").status_code == 400
+    assert api.get("/api/stats/?days=abc").status_code == 400
+
+
+@pytest.mark.django_db
+def test_stats_requires_login(client):
+    assert client.get("/api/stats/").status_code in (401, 403)
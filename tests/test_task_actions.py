@@ -1,4 +1,8 @@
+import threading
+import time
+
 import pytest
+from django.db import connection
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.test import APIClient
@@ -32,7 +36,7 @@ def test_task_approve_flow(api_client):
     )
 
     url = reverse("tasks:task-approve", args=[task.id]) + "?confirm=true"
-    with patch("tasks.views.create_monday_item", return_value="123"):
+    with patch("tasks.services.create_monday_item", return_value="123"):
         resp = api_client.post(url)
     assert resp.status_code == 200
     task.refresh_from_db()
@@ -89,4 +93,61 @@ def test_task_edit_description(api_client):
     resp = api_client.patch(url, data={"new_brief_description": "New desc"}, format="json")
     assert resp.status_code == 200
     task.refresh_from_db()
-    assert "New desc" in task.brief_description 
\ No newline at end of file
+    assert "New desc" in task.brief_description
+
+
+@pytest.mark.django_db
+def test_second_review_gets_409(api_client):
+    meeting = Meeting.objects.create(meeting_id="m4", title="T4", organizer_email="x@example.com", date=timezone.now())
+    task = Task.objects.create(meeting=meeting, task_item="Foo", brief_description="Bar",
+                               date_expected=timezone.now().date())
+    with patch("tasks.views.push_task_to_monday", return_value=None):
+        assert api_client.post(reverse("tasks:task-approve", args=[task.id]) + "?confirm=true").status_code == 200
+    reason = "Duplicate of another task raised in the same meeting."
+    resp = api_client.post(reverse("tasks:task-reject", args=[task.id]) + "?confirm=true",
+                           data={"reason": reason}, format="json")
+    assert resp.status_code == 409
+    task.refresh_from_db()
+    assert (task.status, task.rejected_reason) == (Task.Status.APPROVED, "")
+    assert ReviewAction.objects.filter(task=task).count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_reviews_have_one_winner():
+    users = [User.objects.create_user(username=f"hammer{i}", password="x", is_staff=True) for i in range(12)]
+    meeting = Meeting.objects.create(meeting_id="m5", title="T5", organizer_email="x@example.com", date=timezone.now())
+    task = Task.objects.create(meeting=meeting, task_item="Foo", brief_description="Bar",
+                               date_expected=timezone.now().date())
+    reason = "Not needed any more after the scope change."
+    barrier, codes = threading.Barrier(12), {}
+
+    def review(i):
+        # the test client's exception hook is process-wide and would re-raise other threads' errors here
+        client = APIClient(raise_request_exception=False)
+        client.force_authenticate(user=users[i])
+        name, data = ("tasks:task-approve", None) if i % 2 else ("tasks:task-reject", {"reason": reason})
+        barrier.wait()
+        try:
+            for _ in range(50):
+                resp = client.post(reverse(name, args=[task.id]) + "?confirm=true", data=data, format="json")
+                # SQLite's shared-cache test DB refuses concurrent writers with a 500; only retry
+                # when this request's review didn't commit, so an error after the commit still fails
+                if resp.status_code != 500 or ReviewAction.objects.filter(user=users[i]).exists():
+                    codes[i] = resp.status_code
+                    return
+                time.sleep(0.01)
+        finally:
+            connection.close()
+
+    with patch("tasks.views.push_task_to_monday", return_value=None):
+        threads = [threading.Thread(target=review, args=(i,)) for i in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(codes.values()) == [200] + [409] * 11
+    [winner] = [i for i, code in codes.items() if code == 200]
+    assert ReviewAction.objects.get(task=task).user == users[winner]
+    task.refresh_from_db()
+    assert task.status == (Task.Status.APPROVED if winner % 2 else Task.Status.REJECTED)
@@ -0,0 +1,59 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tasks.models import Meeting, ReviewAction, Task
+from tasks.transitions import tasks_transitioned, transition
+
+
+@pytest.fixture()
+def meeting():
+    return Meeting.objects.create(meeting_id="tr", title="Transitions", organizer_email="o@example.com", date=timezone.now())
+
+
+def _tasks(meeting, n, **fields):
+    return [Task.objects.create(meeting=meeting, task_item=f"Task {i}", brief_description="d",
+                                date_expected=timezone.now().date(), **fields) for i in range(n)]
+
+
+@pytest.mark.django_db
+def test_bulk_transition_is_constant_queries(meeting):
+    small, large = _tasks(meeting, 2), _tasks(meeting, 40)
+    with CaptureQueriesContext(connection) as few:
+        transition([t.pk for t in small], Task.Status.REJECTED, reason="Out of scope")
+    with CaptureQueriesContext(connection) as many:
+        transition([t.pk for t in large], Task.Status.REJECTED, reason="Out of scope")
+    assert len(many) == len(few)
+    assert Task.objects.filter(status=Task.Status.REJECTED, rejected_reason="Out of scope").count() == 42
+    assert ReviewAction.objects.filter(action=ReviewAction.Action.REJECT).count() == 42
+    meeting.refresh_from_db()
+    assert (meeting.pending_count, meeting.rejected_count) == (0, 42)
+
+
+@pytest.mark.django_db
+def test_only_allowed_sources_move(meeting):
+    pending, approved = _tasks(meeting, 1)[0], _tasks(meeting, 1, status=Task.Status.APPROVED)[0]
+    result = transition([pending.pk, approved.pk, str(pending.pk)], Task.Status.REJECTED)
+    assert result.moved == [pending.pk]
+    assert result.skipped == [approved.pk]
+    approved.refresh_from_db()
+    assert approved.status == Task.Status.APPROVED
+    assert not approved.reviews.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_signal_sent_once_after_commit(meeting):
+    tasks = _tasks(meeting, 3)
+    received = []
+
+    def receiver(sender, task_ids, status, **kwargs):
+        received.append((sorted(map(str, task_ids)), status))
+
+    tasks_transitioned.connect(receiver)
+    try:
+        transition([t.pk for t in tasks], Task.Status.APPROVED)
+        transition([t.pk for t in tasks], Task.Status.APPROVED)  # nothing left to move
+    finally:
+        tasks_transitioned.disconnect(receiver)
+    assert received == [(sorted(str(t.pk) for t in tasks), Task.Status.APPROVED)]